@@ -303,6 +303,8 @@ class JoplinMCPConfig:
     DEFAULT_IMPORT_SETTINGS = {
         "max_file_size_mb": 100,  # Maximum file size in MB
         "max_batch_size": 100,  # Maximum notes per batch
+        "inter_batch_pause": 0.1,  # Seconds between batches once Joplin slows down
+        "cache_populate_threshold": 20,  # Notes below which the catalog isn't preloaded
         "create_missing_notebooks": True,  # Auto-create notebooks
         "create_missing_tags": True,  # Auto-create tags
         "preserve_timestamps": True,  # Preserve original timestamps
@@ -811,8 +813,16 @@ class JoplinMCPConfig:
                     raise ConfigError("Invalid boolean in import_settings")
 
                 for key, val in raw_settings.items():
-                    if key in ("max_file_size_mb", "max_batch_size"):
+                    if key in ("max_file_size_mb", "max_batch_size", "cache_populate_threshold"):
                         import_settings[key] = _as_int(val)
+                    elif key == "inter_batch_pause":
+                        try:
+                            pause = float(val)
+                        except (TypeError, ValueError):
+                            raise ConfigError("import_settings.inter_batch_pause must be a number") from None
+                        if pause < 0:
+                            raise ConfigError("import_settings.inter_batch_pause must not be negative")
+                        import_settings[key] = pause
                     elif key in ("create_missing_notebooks", "create_missing_tags", "preserve_timestamps", "preserve_structure"):
                         import_settings[key] = _as_bool(val)
                     elif key == "handle_duplicates":
@@ -1284,9 +1294,10 @@ def _auto_discover_with_logging() -> JoplinMCPConfig:
     """Auto-discover configuration on import, with logging.
 
     Honours JOPLIN_MCP_CONFIG / JOPLIN_CONFIG_FILE for an explicit path,
-    otherwise falls back to JoplinMCPConfig.auto_discover() (standard
-    locations + cwd). On any failure, returns a default config so import
-    never raises.
+    otherwise searches the same standard locations (home + cwd) as
+    JoplinMCPConfig.auto_discover(). Each candidate is probed once and the
+    first hit is both loaded and logged. On any failure, returns a default
+    config so import never raises.
     """
     logger.info("Auto-discovering Joplin MCP configuration...")
 
@@ -1302,41 +1313,28 @@ def _auto_discover_with_logging() -> JoplinMCPConfig:
                 logger.info(
                     f"Using explicit configuration from: {cfg_path}"
                 )
-                config = JoplinMCPConfig.from_file(cfg_path)
                 loaded_from = cfg_path
             else:
                 logger.warning(
                     f"Explicit config path set but not found: {cfg_path}. Falling back to discovery."
                 )
-                config = JoplinMCPConfig.auto_discover()
-        else:
-            config = JoplinMCPConfig.auto_discover()
 
         if loaded_from is None:
             for path in JoplinMCPConfig.get_default_config_paths():
                 if path.exists():
                     loaded_from = path
                     break
-            if loaded_from is None:
-                cwd = Path.cwd()
-                for path in [
-                    cwd / "joplin-mcp.json",
-                    cwd / "joplin-mcp.yaml",
-                    cwd / "joplin-mcp.yml",
-                ]:
-                    if path.exists():
-                        loaded_from = path
-                        break
 
         if loaded_from is None:
             logger.warning(
                 "No configuration file found. Using environment variables and defaults."
             )
-        else:
-            logger.info(
-                f"Successfully loaded configuration from: {loaded_from}"
-            )
+            return JoplinMCPConfig.from_environment()
 
+        config = JoplinMCPConfig.from_file(loaded_from)
+        logger.info(
+            f"Successfully loaded configuration from: {loaded_from}"
+        )
         return config
 
     except Exception as e:
@@ -553,6 +553,17 @@ def create_content_preview_with_search(
     return "\n".join(preview_parts)
 
 
+# str.format equivalents of the strftime patterns the formatters use on
+# every listed item; they skip strftime's per-call format parsing.
+_FAST_TIMESTAMP_FORMATS = {
+    "%Y-%m-%d %H:%M": "{0.year:04d}-{0.month:02d}-{0.day:02d} {0.hour:02d}:{0.minute:02d}",
+    "%Y-%m-%d %H:%M:%S": (
+        "{0.year:04d}-{0.month:02d}-{0.day:02d} "
+        "{0.hour:02d}:{0.minute:02d}:{0.second:02d}"
+    ),
+}
+
+
 def format_timestamp(
     timestamp: Optional[Union[int, datetime.datetime]],
     format_str: str = "%Y-%m-%d %H:%M:%S",
@@ -560,16 +571,20 @@ def format_timestamp(
     """Format a timestamp safely."""
     if not timestamp:
         return None
-    try:
-        if isinstance(timestamp, datetime.datetime):
-            return timestamp.strftime(format_str)
-        elif isinstance(timestamp, int):
-            return datetime.datetime.fromtimestamp(timestamp / 1000).strftime(
-                format_str
-            )
-        else:
+    if isinstance(timestamp, int):
+        try:
+            timestamp = datetime.datetime.fromtimestamp(timestamp / 1000)
+        except (OSError, OverflowError, ValueError):
+            # Out of the platform's representable range
             return None
-    except:
+    elif not isinstance(timestamp, datetime.datetime):
+        return None
+    fast_format = _FAST_TIMESTAMP_FORMATS.get(format_str)
+    if fast_format is not None:
+        return fast_format.format(timestamp)
+    try:
+        return timestamp.strftime(format_str)
+    except ValueError:
         return None
 
 
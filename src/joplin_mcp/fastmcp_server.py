@@ -25,7 +25,7 @@
 - list_tags() - List all available tags
 - tag_note(note_id, tag_name) - Add a tag to a note
 - untag_note(note_id, tag_name) - Remove a tag from a note
-- get_tags_by_note(note_id) - See what tags a note has
+- get_tags_by_note(note_id) - See what tags a note has (pass a list of IDs for several notes)
 
 📁 MANAGING NOTEBOOKS:
 - list_notebooks() - List all available notebooks (surfaces each notebook's emoji icon, if set)
@@ -37,21 +37,28 @@
 - delete_note / delete_notebook move items to trash (soft delete); find_notes("*", trash=True) lists trashed notes
 """
 
+import asyncio
 import datetime
 import json
 import re
+import threading
 import time
 import logging
 import os
+from collections import OrderedDict
 from enum import Enum
-from functools import wraps
+from functools import partial, wraps
 from typing import Annotated, Any, Callable, Dict, List, Optional, TypeVar, Union
 
 # FastMCP imports
 from fastmcp import FastMCP
 
 # Direct joppy import
+import joppy.client_api as joppy_client_api
 from joppy.client_api import ClientApi
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Pydantic imports for proper Field annotations
 from pydantic import Field
@@ -98,9 +105,10 @@ T = TypeVar("T")
 # Log the enabled-tool count from the auto-discovered config. Auto-discovery
 # itself (and its file/path logging) lives in joplin_mcp.config.
 try:
-    _enabled = sorted([k for k, v in get_config().tools.items() if v])
+    _enabled = [k for k, v in get_config().tools.items() if v]
     logger.info("Module config loaded; enabled tools count=%d", len(_enabled))
-    logger.debug("Enabled tools: %s", _enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Enabled tools: %s", sorted(_enabled))
 except Exception:
     pass
 
@@ -202,17 +210,18 @@ def optional_int_converter(
     raise ValueError(f"{field_name} must be an integer or string representation of an integer")
 
 
+_JOPLIN_ID_RE = re.compile(r"^[a-f0-9]{32}$")
+
+
 def validate_joplin_id(note_id: str) -> str:
     """Validate that a string is a proper Joplin note ID (32 hex characters)."""
-    import re
-
+    if isinstance(note_id, str) and _JOPLIN_ID_RE.match(note_id):
+        return note_id
     if not isinstance(note_id, str):
         raise ValueError("Note ID must be a string")
-    if not re.match(r"^[a-f0-9]{32}$", note_id):
-        raise ValueError(
-            "Note ID must be exactly 32 hexadecimal characters (Joplin UUID format)"
-        )
-    return note_id
+    raise ValueError(
+        "Note ID must be exactly 32 hexadecimal characters (Joplin UUID format)"
+    )
 
 
 def timestamp_converter(value: Optional[Union[int, str]], field_name: str) -> Optional[int]:
@@ -258,6 +267,89 @@ OptionalBoolType = Optional[
 
 # === UTILITY FUNCTIONS ===
 
+# Matches the default asyncio.to_thread executor's worker cap, so every worker
+# running a client call can hold its own kept-alive connection.
+_HTTP_POOL_MAXSIZE = 32
+
+# Joplin answers 429/503 while busy (e.g. mid-sync); retry idempotent requests
+# a few times, honouring Retry-After. Connection errors are not retried here --
+# they feed the circuit breaker instead.
+_HTTP_RETRY = Retry(
+    total=3,
+    connect=0,
+    read=0,
+    status=3,
+    status_forcelist=(429, 503),
+    backoff_factor=0.5,
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# After this many consecutive connection failures, fail fast for the cooldown
+# instead of letting every tool call wait out its own timeout.
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN_SECONDS = 10.0
+
+
+class _JoplinHTTPAdapter(HTTPAdapter):
+    """HTTP adapter for joppy's session: default timeout plus circuit breaker.
+
+    joppy never passes a timeout, so a stalled Joplin would pin a worker
+    thread indefinitely; the configured ``timeout`` is applied instead.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._breaker_lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+
+    def send(self, request, timeout=None, **kwargs):  # type: ignore[override]
+        with self._breaker_lock:
+            remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            raise requests.ConnectionError(
+                f"Joplin unreachable after {_BREAKER_THRESHOLD} consecutive "
+                f"failures; not retrying for another {remaining:.0f}s"
+            )
+        if timeout is None:
+            timeout = get_config().timeout
+        try:
+            response = super().send(request, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            with self._breaker_lock:
+                self._consecutive_failures += 1
+                if self._consecutive_failures >= _BREAKER_THRESHOLD:
+                    self._open_until = time.monotonic() + _BREAKER_COOLDOWN_SECONDS
+            raise
+        with self._breaker_lock:
+            self._consecutive_failures = 0
+        return response
+
+
+def _tune_joppy_session() -> None:
+    """Configure joppy's shared session for concurrent worker-thread calls.
+
+    joppy sends every request through one module-level ``requests.Session``,
+    so connections to Joplin are already reused across client instances. Its
+    default adapter keeps only 10 connections per host, though; bursts of
+    ``run_blocking`` calls beyond that discard connections and reconnect.
+    """
+    adapter = _JoplinHTTPAdapter(
+        pool_maxsize=_HTTP_POOL_MAXSIZE, max_retries=_HTTP_RETRY
+    )
+    joppy_client_api.SESSION.mount("http://", adapter)
+    joppy_client_api.SESSION.mount("https://", adapter)
+
+
+_tune_joppy_session()
+
+
+# Last client handed out, keyed by (token, url). ClientApi only holds those
+# two strings (requests go through joppy's shared SESSION), so one instance
+# can serve every tool call until the config changes.
+_client_cache: Optional[tuple] = None
+
 
 def get_joplin_client() -> ClientApi:
     """Get a configured joppy client instance.
@@ -265,21 +357,67 @@ def get_joplin_client() -> ClientApi:
     Reads the live config via the resolver. Falls back to the JOPLIN_TOKEN
     env var if the config has no token.
     """
+    global _client_cache
     config = get_config()
 
     if config.token:
-        return ClientApi(token=config.token, url=config.base_url)
+        token, url = config.token, config.base_url
+    else:
+        # Fallback to environment variables
+        token = os.getenv("JOPLIN_TOKEN")
+        if not token:
+            raise ValueError(
+                "Authentication token missing. Set 'token' in joplin-mcp.json or JOPLIN_TOKEN env var."
+            )
+        # Prefer configured base URL if available without token
+        url = config.base_url if config else os.getenv("JOPLIN_URL", "http://localhost:41184")
 
-    # Fallback to environment variables
-    token = os.getenv("JOPLIN_TOKEN")
-    if not token:
-        raise ValueError(
-            "Authentication token missing. Set 'token' in joplin-mcp.json or JOPLIN_TOKEN env var."
-        )
+    cached = _client_cache
+    if cached is not None and cached[0] == token and cached[1] == url:
+        return cached[2]
+    client = ClientApi(token=token, url=url)
+    _client_cache = (token, url, client)
+    return client
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call (joppy client, notebook resolver) on a worker thread.
+
+    joppy is built on ``requests``, so every client method blocks for the
+    full HTTP round-trip. Tools await this instead of calling the client
+    directly so the event loop keeps serving other MCP requests meanwhile.
+    """
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+# Upper bound on concurrent Joplin requests issued by run_blocking_many, so
+# bulk operations don't flood the local Joplin server.
+_BULK_FETCH_CONCURRENCY = 8
 
-    # Prefer configured base URL if available without token
-    url = config.base_url if config else os.getenv("JOPLIN_URL", "http://localhost:41184")
-    return ClientApi(token=token, url=url)
+
+async def run_blocking_many(calls: List[Callable[[], T]]) -> List[Any]:
+    """Run zero-argument blocking callables concurrently, in ``calls`` order.
+
+    Each call runs on a worker thread, at most ``_BULK_FETCH_CONCURRENCY`` at
+    a time. A failed call yields its exception in place of the result, so
+    callers decide per item whether to raise or report.
+    """
+    semaphore = asyncio.Semaphore(_BULK_FETCH_CONCURRENCY)
+
+    async def run(call: Callable[[], T]) -> T:
+        async with semaphore:
+            return await run_blocking(call)
+
+    return await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+
+
+async def fetch_notes_concurrently(
+    client: Any, note_ids: List[str], fields: str
+) -> List[Any]:
+    """Fetch several notes in parallel, in ``note_ids`` order (see run_blocking_many)."""
+    return await run_blocking_many(
+        [partial(client.get_note, note_id, fields=fields) for note_id in note_ids]
+    )
 
 
 # === NOTEBOOK RESOLVER ===
@@ -308,6 +446,15 @@ init_resolver(lambda: get_joplin_client())
 COMMON_NOTE_FIELDS = (
     "id,title,body,created_time,updated_time,parent_id,is_todo,todo_completed,todo_due,deleted_time"
 )
+# COMMON_NOTE_FIELDS minus body, for listing passes whose results don't show
+# content (privacy settings), so bodies aren't transferred only to be hidden.
+NOTE_LISTING_FIELDS = (
+    "id,title,created_time,updated_time,parent_id,is_todo,todo_completed,todo_due,deleted_time"
+)
+# Just enough of a note to run the notebook allowlist check on it
+NOTE_PARENT_FIELDS = "id,parent_id"
+TAG_FIELDS = "id,title,created_time,updated_time"
+NOTEBOOK_FIELDS = "id,title,created_time,updated_time,parent_id,icon"
 
 
 
@@ -419,23 +566,24 @@ def register_tools(target_mcp: FastMCP, config: "JoplinMCPConfig") -> List[str]:
     config disables). Returns the resulting list of enabled tool names.
 
     Uses fastmcp v3's ``local_provider.add_tool`` / ``remove_tool`` API:
-    do a remove-all round-trip then re-add the enabled set, so toggling
-    config across reconfigures works in both directions.
+    each tool is removed then re-added only if enabled, so toggling config
+    across reconfigures works in both directions.
     """
+    disabled = frozenset(name for name, on in config.tools.items() if not on)
+    provider = target_mcp.local_provider
     enabled: List[str] = []
-    for tool_name, _ in _tool_registry:
+    for tool_name, tool_obj in _tool_registry:
         try:
-            target_mcp.local_provider.remove_tool(tool_name)
+            provider.remove_tool(tool_name)
         except Exception:
             pass  # already absent (first-run or previously filtered out)
-    for tool_name, tool_obj in _tool_registry:
-        if config.tools.get(tool_name, True):
-            target_mcp.local_provider.add_tool(tool_obj)
-            enabled.append(tool_name)
-        else:
+        if tool_name in disabled:
             logger.info(
                 "Tool '%s' disabled in configuration", tool_name,
             )
+        else:
+            provider.add_tool(tool_obj)
+            enabled.append(tool_name)
     return enabled
 
 
@@ -466,8 +614,9 @@ def _get_item_id_by_name(
         ValueError: If item not found or multiple matches
     """
     all_items = fetch_fn(fields=fields)
+    name_lower = name.lower()
     matching_items = [
-        item for item in all_items if getattr(item, "title", "").lower() == name.lower()
+        item for item in all_items if getattr(item, "title", "").lower() == name_lower
     ]
 
     if not matching_items:
@@ -495,6 +644,97 @@ def _get_item_id_by_name(
     return item_id
 
 
+# === TAG CACHE ===
+# Every tag-name lookup and list_tags needs the full tag listing. It is cached
+# for a short TTL; the tag tools clear it on create/update/delete, and
+# import_from_file clears it after creating tags.
+
+_TAG_CACHE_TTL_SECONDS = 30
+
+_cached_tags: Optional[List[Any]] = None
+_cached_tags_at: float = 0.0
+# Serializes refreshes so concurrent cold callers share one fetch
+_tag_cache_lock = threading.Lock()
+# Guards the cached listing and its generation; never held across a fetch
+_tag_state_lock = threading.Lock()
+# Bumped by clear_tag_cache, so a refresh that raced it doesn't store stale tags
+_tags_generation = 0
+
+
+def _tag_cache_fresh(now: float) -> bool:
+    return _cached_tags is not None and (now - _cached_tags_at) < _TAG_CACHE_TTL_SECONDS
+
+
+def get_all_tags_cached(client: Any) -> List[Any]:
+    """Return every tag (``TAG_FIELDS``), served from cache while within TTL."""
+    global _cached_tags, _cached_tags_at
+    with _tag_state_lock:
+        if _tag_cache_fresh(time.monotonic()):
+            return _cached_tags
+    with _tag_cache_lock:
+        # Another caller may have refreshed while we waited for the lock
+        now = time.monotonic()
+        with _tag_state_lock:
+            if _tag_cache_fresh(now):
+                return _cached_tags
+            generation = _tags_generation
+        tags = list(client.get_all_tags(fields=TAG_FIELDS))
+        with _tag_state_lock:
+            if generation == _tags_generation:
+                _cached_tags = tags
+                _cached_tags_at = now
+        return tags
+
+
+# Per-note tag lists for get_tags_by_note, LRU-bounded and sharing the TTL above
+_NOTE_TAGS_CACHE_MAXSIZE = 512
+_note_tags_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_note_tags_lock = threading.Lock()
+# Bumped on every eviction, so a fetch that raced one doesn't store stale tags
+_note_tags_generation = 0
+
+
+def get_note_tags_cached(client: Any, note_id: str) -> List[Any]:
+    """Return the tags on ``note_id`` (``TAG_FIELDS``), cached per note."""
+    now = time.monotonic()
+    with _note_tags_lock:
+        entry = _note_tags_cache.get(note_id)
+        if entry is not None and (now - entry[0]) < _TAG_CACHE_TTL_SECONDS:
+            _note_tags_cache.move_to_end(note_id)
+            return entry[1]
+        generation = _note_tags_generation
+    tags = process_search_results(client.get_tags(note_id=note_id, fields=TAG_FIELDS))
+    with _note_tags_lock:
+        if generation == _note_tags_generation:
+            _note_tags_cache[note_id] = (now, tags)
+            _note_tags_cache.move_to_end(note_id)
+            while len(_note_tags_cache) > _NOTE_TAGS_CACHE_MAXSIZE:
+                _note_tags_cache.popitem(last=False)
+    return tags
+
+
+def forget_note_tags(note_ids: List[str]) -> None:
+    """Evict cached tag lists for notes whose tags just changed."""
+    global _note_tags_generation
+    with _note_tags_lock:
+        _note_tags_generation += 1
+        for note_id in note_ids:
+            _note_tags_cache.pop(note_id, None)
+
+
+def clear_tag_cache() -> None:
+    """Drop the cached tag listing and per-note tags. Call after any tag mutation."""
+    global _cached_tags, _cached_tags_at, _tags_generation, _note_tags_generation
+    # Doesn't wait for a running refresh; the generation bump discards its result
+    with _tag_state_lock:
+        _tags_generation += 1
+        _cached_tags = None
+        _cached_tags_at = 0.0
+    with _note_tags_lock:
+        _note_tags_generation += 1
+        _note_tags_cache.clear()
+
+
 def get_tag_id_by_name(name: str) -> str:
     """Get tag ID by name with helpful error messages.
 
@@ -511,8 +751,8 @@ def get_tag_id_by_name(name: str) -> str:
     return _get_item_id_by_name(
         name=name,
         item_type="tag",
-        fetch_fn=client.get_all_tags,
-        fields="id,title,created_time,updated_time",
+        fetch_fn=lambda fields: get_all_tags_cached(client),
+        fields=TAG_FIELDS,
         not_found_hint="Use create_tag to create a new tag.",
     )
 
@@ -558,42 +798,81 @@ def _format_notebook_icon(icon_field: Optional[str]) -> Optional[str]:
     return None
 
 
+_LIST_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+
+
+_LIST_ITEM_ATTRS = ("id", "title", "parent_id", "icon", "created_time", "updated_time")
+
+
+def _item_attrs(item: Any) -> Dict[str, Any]:
+    """Snapshot the attributes the item list formatters read.
+
+    joppy's data classes keep their fields in ``__dict__``, so one ``vars()``
+    call replaces a ``getattr`` per field; slotted objects fall back to
+    copying just the listed attributes.
+    """
+    try:
+        return vars(item)
+    except TypeError:
+        return {
+            name: getattr(item, name)
+            for name in _LIST_ITEM_ATTRS
+            if hasattr(item, name)
+        }
+
+
+def _append_item_timestamps(result_parts: List[str], attrs: Dict[str, Any]) -> None:
+    """Append the created/updated lines shared by the item list formatters."""
+    created_time = attrs.get("created_time")
+    if created_time:
+        created_date = format_timestamp(created_time, _LIST_TIMESTAMP_FORMAT)
+        if created_date:
+            result_parts.append(f"  created: {created_date}")
+
+    updated_time = attrs.get("updated_time")
+    if updated_time:
+        updated_date = format_timestamp(updated_time, _LIST_TIMESTAMP_FORMAT)
+        if updated_date:
+            result_parts.append(f"  updated: {updated_date}")
+
+
 def format_item_list(items: List[Any], item_type: ItemType) -> str:
     """Format a list of items (notebooks, tags, etc.) for display optimized for LLM comprehension."""
+    type_value = item_type.value
     if not items:
-        return f"ITEM_TYPE: {item_type.value}\nTOTAL_ITEMS: 0\nSTATUS: No {item_type.value}s found in Joplin instance"
+        return f"ITEM_TYPE: {type_value}\nTOTAL_ITEMS: 0\nSTATUS: No {type_value}s found in Joplin instance"
 
     count = len(items)
-    result_parts = [f"ITEM_TYPE: {item_type.value}", f"TOTAL_ITEMS: {count}", ""]
+    result_parts = [f"ITEM_TYPE: {type_value}", f"TOTAL_ITEMS: {count}", ""]
+    is_notebook = item_type == ItemType.notebook
 
     # Precompute notebook map if listing notebooks to enable path display
     notebooks_map: Optional[Dict[str, Dict[str, Optional[str]]]] = None
-    if item_type == ItemType.notebook:
+    if is_notebook:
         try:
             notebooks_map = _build_notebook_map(items)  # items already are notebooks
         except Exception:
             notebooks_map = None
 
     for i, item in enumerate(items, 1):
-        title = getattr(item, "title", "Untitled")
-        item_id = getattr(item, "id", "unknown")
+        attrs = _item_attrs(item)
+        title = attrs.get("title", "Untitled")
+        item_id = attrs.get("id", "unknown")
 
         # Structured item entry
-        result_parts.extend(
-            [
-                f"ITEM_{i}:",
-                f"  {item_type.value}_id: {item_id}",
-                f"  title: {title}",
-            ]
+        result_parts += (
+            f"ITEM_{i}:",
+            f"  {type_value}_id: {item_id}",
+            f"  title: {title}",
         )
 
         # Add parent folder ID if available (for notebooks)
-        parent_id = getattr(item, "parent_id", None)
+        parent_id = attrs.get("parent_id")
         if parent_id:
             result_parts.append(f"  parent_id: {parent_id}")
 
         # Add full path for notebooks
-        if item_type == ItemType.notebook:
+        if is_notebook:
             try:
                 if notebooks_map:
                     path = _compute_notebook_path(item_id, notebooks_map)
@@ -604,31 +883,51 @@ def format_item_list(items: List[Any], item_type: ItemType) -> str:
             except Exception:
                 pass
 
-            icon_line = _format_notebook_icon(getattr(item, "icon", None))
+            icon_line = _format_notebook_icon(attrs.get("icon"))
             if icon_line:
                 result_parts.append(icon_line)
 
-        # Add creation time if available
-        created_time = getattr(item, "created_time", None)
-        if created_time:
-            created_date = format_timestamp(created_time, "%Y-%m-%d %H:%M")
-            if created_date:
-                result_parts.append(f"  created: {created_date}")
-
-        # Add update time if available
-        updated_time = getattr(item, "updated_time", None)
-        if updated_time:
-            updated_date = format_timestamp(updated_time, "%Y-%m-%d %H:%M")
-            if updated_date:
-                result_parts.append(f"  updated: {updated_date}")
-
+        _append_item_timestamps(result_parts, attrs)
         result_parts.append("")
 
     return "\n".join(result_parts)
 
 
-def format_tag_list_with_counts(tags: List[Any], client: Any) -> str:
-    """Format a list of tags with note counts for display optimized for LLM comprehension."""
+# Joplin's REST API caps page size at 100; asking for the max keeps the
+# number of round-trips per unpaginated listing as low as possible.
+_MAX_PAGE_LIMIT = 100
+
+
+def _count_tag_notes(client: Any, tag_id: str) -> int:
+    """Count the notes carrying ``tag_id``.
+
+    Requests only the ``id`` field -- the count never needs bodies -- and
+    walks every page, so tags on more than one page of notes are counted
+    in full.
+    """
+    notes = client.get_all_notes(tag_id=tag_id, fields="id", limit=_MAX_PAGE_LIMIT)
+    return len(process_search_results(notes))
+
+
+async def count_tag_notes_concurrently(client: Any, tags: List[Any]) -> List[int]:
+    """Count each tag's notes in parallel, in ``tags`` order; failed counts are 0."""
+    counts = await run_blocking_many(
+        [
+            partial(_count_tag_notes, client, _item_attrs(tag).get("id", "unknown"))
+            for tag in tags
+        ]
+    )
+    return [0 if isinstance(c, BaseException) else c for c in counts]
+
+
+def format_tag_list_with_counts(
+    tags: List[Any], client: Any, note_counts: Optional[List[int]] = None
+) -> str:
+    """Format a list of tags with note counts for display optimized for LLM comprehension.
+
+    ``note_counts`` (parallel to ``tags``) skips the per-tag count requests;
+    without it each tag is counted sequentially through ``client``.
+    """
     if not tags:
         return (
             "ITEM_TYPE: tag\nTOTAL_ITEMS: 0\nSTATUS: No tags found in Joplin instance"
@@ -638,41 +937,28 @@ def format_tag_list_with_counts(tags: List[Any], client: Any) -> str:
     result_parts = ["ITEM_TYPE: tag", f"TOTAL_ITEMS: {count}", ""]
 
     for i, tag in enumerate(tags, 1):
-        title = getattr(tag, "title", "Untitled")
-        tag_id = getattr(tag, "id", "unknown")
+        attrs = _item_attrs(tag)
+        title = attrs.get("title", "Untitled")
+        tag_id = attrs.get("id", "unknown")
 
         # Get note count for this tag
-        try:
-            notes_result = client.get_notes(tag_id=tag_id, fields=COMMON_NOTE_FIELDS)
-            notes = process_search_results(notes_result)
-            note_count = len(notes)
-        except Exception:
-            note_count = 0
+        if note_counts is not None:
+            note_count = note_counts[i - 1]
+        else:
+            try:
+                note_count = _count_tag_notes(client, tag_id)
+            except Exception:
+                note_count = 0
 
         # Structured tag entry
-        result_parts.extend(
-            [
-                f"ITEM_{i}:",
-                f"  tag_id: {tag_id}",
-                f"  title: {title}",
-                f"  note_count: {note_count}",
-            ]
+        result_parts += (
+            f"ITEM_{i}:",
+            f"  tag_id: {tag_id}",
+            f"  title: {title}",
+            f"  note_count: {note_count}",
         )
 
-        # Add creation time if available
-        created_time = getattr(tag, "created_time", None)
-        if created_time:
-            created_date = format_timestamp(created_time, "%Y-%m-%d %H:%M")
-            if created_date:
-                result_parts.append(f"  created: {created_date}")
-
-        # Add update time if available
-        updated_time = getattr(tag, "updated_time", None)
-        if updated_time:
-            updated_date = format_timestamp(updated_time, "%Y-%m-%d %H:%M")
-            if updated_date:
-                result_parts.append(f"  updated: {updated_date}")
-
+        _append_item_timestamps(result_parts, attrs)
         result_parts.append("")
 
     return "\n".join(result_parts)
@@ -725,6 +1011,18 @@ async def health_check(request) -> dict:
     )
 
 
+# A successful ping is reused for a couple of seconds so clients polling for
+# liveness don't hit Joplin on every call. Failures are never cached, so an
+# outage is reported on the next ping.
+_PING_CACHE_TTL_SECONDS = 2.0
+_last_ping_ok_at: Optional[float] = None
+
+_PING_SUCCESS = """OPERATION: PING_JOPLIN
+STATUS: SUCCESS
+CONNECTION: ESTABLISHED
+MESSAGE: Joplin server connection successful"""
+
+
 @create_tool("ping_joplin", "Ping Joplin")
 async def ping_joplin() -> str:
     """Test connection to Joplin server.
@@ -734,14 +1032,19 @@ async def ping_joplin() -> str:
     Returns:
         str: Connection status information.
     """
+    global _last_ping_ok_at
+    if (
+        _last_ping_ok_at is not None
+        and time.monotonic() - _last_ping_ok_at < _PING_CACHE_TTL_SECONDS
+    ):
+        return _PING_SUCCESS
     try:
         client = get_joplin_client()
-        client.ping()
-        return """OPERATION: PING_JOPLIN
-STATUS: SUCCESS
-CONNECTION: ESTABLISHED
-MESSAGE: Joplin server connection successful"""
+        await run_blocking(client.ping)
+        _last_ping_ok_at = time.monotonic()
+        return _PING_SUCCESS
     except Exception as e:
+        _last_ping_ok_at = None
         return f"""OPERATION: PING_JOPLIN
 STATUS: FAILED
 CONNECTION: FAILED
@@ -760,7 +1063,7 @@ async def get_server_info() -> dict:
     """Get Joplin server information."""
     try:
         client = get_joplin_client()
-        is_connected = client.ping()
+        is_connected = await run_blocking(client.ping)
         return {
             "connected": bool(is_connected),
             "url": getattr(client, "url", "unknown"),
@@ -834,6 +1137,22 @@ def run_compat_server(
     uvicorn.run(app, host=host, port=port, log_level=log_level)
 
 
+def _warm_joplin_connection() -> None:
+    """Open the keep-alive connection (and notebook cache) before the first tool call.
+
+    Runs on a daemon thread from main(); failures only log, since the server
+    must start even while Joplin is down.
+    """
+    try:
+        get_joplin_client().ping()
+        if not get_config().has_notebook_allowlist:
+            # With an allowlist, startup validation builds the map itself
+            notebook_resolver.get_map()
+        logger.debug("Joplin connection warmed")
+    except Exception as e:
+        logger.debug("Joplin warm-up failed: %s", _sanitise_error(str(e)))
+
+
 def main(
     config_file: Optional[str] = None,
     transport: str = "stdio",
@@ -854,9 +1173,14 @@ def main(
         else:
             logger.info("Using auto-discovered configuration for runtime")
 
+        threading.Thread(
+            target=_warm_joplin_connection, name="joplin-warmup", daemon=True
+        ).start()
+
         registered_tools = register_tools(mcp, get_config())
-        logger.info(f"FastMCP server has {len(registered_tools)} tools registered")
-        logger.info(f"Registered tools: {sorted(registered_tools)}")
+        logger.info("FastMCP server has %d tools registered", len(registered_tools))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Registered tools: %s", sorted(registered_tools))
 
         logger.info("Initializing Joplin client...")
         client = get_joplin_client()
@@ -902,6 +1226,9 @@ def main(
         import traceback
         traceback.print_exc()
         raise
+    finally:
+        # Release the pooled keep-alive connections to Joplin
+        joppy_client_api.SESSION.close()
 
 
 if __name__ == "__main__":
@@ -15,62 +15,86 @@ class ItemType(str, Enum):
     tag = "tag"
 
 
-def get_item_emoji(item_type: ItemType) -> str:
-    """Get emoji for item type."""
-    emoji_map = {ItemType.note: "📝", ItemType.notebook: "📁", ItemType.tag: "🏷️"}
-    return emoji_map.get(item_type, "📄")
+_ITEM_EMOJI = {ItemType.note: "📝", ItemType.notebook: "📁", ItemType.tag: "🏷️"}
 
 
-def format_creation_success(item_type: ItemType, title: str, item_id: str) -> str:
-    """Format a standardized success message for creation operations optimized for LLM comprehension."""
-    return f"""OPERATION: CREATE_{item_type.value.upper()}
-STATUS: SUCCESS
-ITEM_TYPE: {item_type.value}
-ITEM_ID: {item_id}
-TITLE: {title}
-MESSAGE: {item_type.value} created successfully in Joplin"""
+def get_item_emoji(item_type: ItemType) -> str:
+    """Get emoji for item type."""
+    return _ITEM_EMOJI.get(item_type, "📄")
 
 
-def format_update_success(item_type: ItemType, item_id: str) -> str:
-    """Format a standardized success message for update operations optimized for LLM comprehension."""
-    return f"""OPERATION: UPDATE_{item_type.value.upper()}
-STATUS: SUCCESS
-ITEM_TYPE: {item_type.value}
-ITEM_ID: {item_id}
-MESSAGE: {item_type.value} updated successfully in Joplin"""
+def _success_template(operation: str, item_type: ItemType, *body_lines: str) -> str:
+    """Build the fixed part of a success message; ``{item_id}``/``{title}`` stay as fields."""
+    return "\n".join(
+        (
+            f"OPERATION: {operation}_{item_type.value.upper()}",
+            "STATUS: SUCCESS",
+            f"ITEM_TYPE: {item_type.value}",
+            "ITEM_ID: {item_id}",
+        )
+        + body_lines
+    )
 
 
-def format_delete_success(item_type: ItemType, item_id: str) -> str:
-    """Format a standardized success message for delete operations optimized for LLM comprehension."""
+def _delete_message(item_type: ItemType) -> str:
+    """Trash-aware delete message for ``item_type``; may contain ``{item_id}``."""
     if item_type is ItemType.note:
-        message = (
+        return (
             "note moved to trash."
             " Use find_notes(\"*\", trash=True) to list trashed notes,"
-            f" restore_from_trash(item_id=\"{item_id}\", item_type=\"note\") to restore"
+            " restore_from_trash(item_id=\"{item_id}\", item_type=\"note\") to restore"
         )
-    elif item_type is ItemType.notebook:
+    if item_type is ItemType.notebook:
         # No listing path for trashed notebooks yet — keep the ID prominent
-        message = (
+        return (
             "notebook moved to trash."
-            f" Restore with restore_from_trash(item_id=\"{item_id}\", item_type=\"notebook\")."
+            " Restore with restore_from_trash(item_id=\"{item_id}\", item_type=\"notebook\")."
             " Notes inside the notebook are also trashed; restore the notebook first."
         )
-    else:
-        message = f"{item_type.value} deleted successfully from Joplin"
-    return f"""OPERATION: DELETE_{item_type.value.upper()}
-STATUS: SUCCESS
-ITEM_TYPE: {item_type.value}
-ITEM_ID: {item_id}
-MESSAGE: {message}"""
+    return f"{item_type.value} deleted successfully from Joplin"
+
+
+# Success messages only vary by item id/title, so the per-type text is
+# rendered once here and each call is a single str.format.
+_CREATE_TEMPLATES = {
+    t: _success_template(
+        "CREATE", t, "TITLE: {title}", f"MESSAGE: {t.value} created successfully in Joplin"
+    )
+    for t in ItemType
+}
+_UPDATE_TEMPLATES = {
+    t: _success_template("UPDATE", t, f"MESSAGE: {t.value} updated successfully in Joplin")
+    for t in ItemType
+}
+_DELETE_TEMPLATES = {
+    t: _success_template("DELETE", t, f"MESSAGE: {_delete_message(t)}") for t in ItemType
+}
+_RESTORE_TEMPLATES = {
+    t: _success_template(
+        "RESTORE", t, f"MESSAGE: {t.value} restored successfully from trash in Joplin"
+    )
+    for t in ItemType
+}
+
+
+def format_creation_success(item_type: ItemType, title: str, item_id: str) -> str:
+    """Format a standardized success message for creation operations optimized for LLM comprehension."""
+    return _CREATE_TEMPLATES[item_type].format(title=title, item_id=item_id)
+
+
+def format_update_success(item_type: ItemType, item_id: str) -> str:
+    """Format a standardized success message for update operations optimized for LLM comprehension."""
+    return _UPDATE_TEMPLATES[item_type].format(item_id=item_id)
+
+
+def format_delete_success(item_type: ItemType, item_id: str) -> str:
+    """Format a standardized success message for delete operations optimized for LLM comprehension."""
+    return _DELETE_TEMPLATES[item_type].format(item_id=item_id)
 
 
 def format_restore_success(item_type: ItemType, item_id: str) -> str:
     """Format a standardized success message for restore-from-trash operations."""
-    return f"""OPERATION: RESTORE_{item_type.value.upper()}
-STATUS: SUCCESS
-ITEM_TYPE: {item_type.value}
-ITEM_ID: {item_id}
-MESSAGE: {item_type.value} restored successfully from trash in Joplin"""
+    return _RESTORE_TEMPLATES[item_type].format(item_id=item_id)
 
 
 def format_relation_success(
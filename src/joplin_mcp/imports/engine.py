@@ -4,8 +4,12 @@ import asyncio
 import logging
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+import time
+from datetime import datetime
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
+import requests
 from joppy.client_api import ClientApi
 
 from joplin_mcp.config import JoplinMCPConfig
@@ -13,6 +17,86 @@ from .types import ImportedNote, ImportOptions, ImportResult
 
 logger = logging.getLogger(__name__)
 
+# Cap on tag applications in flight at once, to stay gentle on Joplin
+_TAG_APPLY_CONCURRENCY = 8
+
+# Notes in flight at once during an import
+_NOTE_CREATE_CONCURRENCY = 8
+
+# Timestamps this close to now are left for Joplin to set itself
+_SERVER_DEFAULT_TOLERANCE_MS = 5000
+
+# Upper bound on the "(n)" suffix search when renaming duplicates
+_RENAME_PROBE_LIMIT = 1 << 20
+
+# Rewritten note bodies saved at once after the import
+_LINK_REWRITE_CONCURRENCY = 8
+
+# Pause between batches only once Joplin slows down: when the smoothed
+# per-note time exceeds the fastest batch seen by this factor
+_SLOWDOWN_RATIO = 1.5
+
+# Ceiling for the pause after consecutive batches with failed notes
+_MAX_BACKOFF_SECONDS = 2.0
+
+# Server-side duplicate rejection, matched without lowercasing the message
+_ALREADY_EXISTS_RE = re.compile(r"already exists", re.IGNORECASE)
+
+# Joplin's maximum page size for list endpoints
+_PAGE_SIZE = 100
+
+_title_and_id = attrgetter("title", "id")
+
+# Joplin's search syntax has no escape for '"' inside a quoted term; a space
+# keeps the rest of the title as the phrase (exact matching is client-side)
+_QUERY_QUOTES = str.maketrans({'"': " "})
+
+
+# Link-rewrite patterns
+# ID links: matches both image and normal md links: ![alt](:/id) or [text](:/id)
+_ID_LINK_RE = re.compile(r"(!?\[[^\]]*\])\(:\/([a-f0-9]{32})(#[^)]+)?\)")
+# File links: [text](path[#anchor]); optional leading ! captured to detect images
+_FILE_LINK_RE = re.compile(r"(!?)(\[[^\]]*\])\(([^)]+)\)")
+# Raw ID tokens to quickly collect IDs present in a body
+_ANY_ID_TOKEN_RE = re.compile(r":/([a-f0-9]{32})")
+# URL scheme prefix (http:, mailto:, ...)
+_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+def _name_key(name: str) -> str:
+    """Cache key for a notebook or tag name.
+
+    Names match ignoring case and surrounding whitespace, as in the notebook
+    resolver and tag tools.
+    """
+    return name.strip().lower()
+
+
+def _is_client_error(error: requests.HTTPError) -> bool:
+    """Whether Joplin rejected the request itself (HTTP 4xx)."""
+    response = error.response
+    return response is not None and 400 <= response.status_code < 500
+
+
+def _collect_titles(
+    fetch, into: Dict[str, str], normalize: Optional[Callable[[str], str]] = None, **query
+) -> Dict[str, str]:
+    """Page through a joppy list call, recording title -> id into ``into``.
+
+    Items are consumed one page at a time rather than materialized as a
+    full list first. The first ID seen for a title (after ``normalize``,
+    if given) wins. Blocking.
+    """
+    page = 1
+    while True:
+        response = fetch(page=page, limit=_PAGE_SIZE, **query)
+        for title, item_id in map(_title_and_id, response.items):
+            if title and item_id:
+                into.setdefault(normalize(title) if normalize else title, item_id)
+        if not response.has_more:
+            return into
+        page += 1
+
 
 class JoplinImportEngine:
     """Core engine for processing import operations.
@@ -33,8 +117,35 @@ class JoplinImportEngine:
         """
         self.client = client
         self.config = config
-        self._notebook_cache: Dict[str, str] = {}  # name -> id
-        self._tag_cache: Dict[str, str] = {}  # name -> id
+        self._notebook_cache: Dict[str, str] = {}  # _name_key(name) -> id
+        self._tag_cache: Dict[str, str] = {}  # _name_key(name) -> id
+        # Once both caches hold every existing notebook/tag, a miss means
+        # "doesn't exist" and needs no refetch
+        self._caches_populated = False
+        # Set once a full listing has seeded the cache, so misses go straight to creation
+        self._notebooks_listed = False
+        self._tags_listed = False
+        # Duplicate-check indexes, each loaded on first use:
+        # notebook id -> {title: note id}, and title -> note id across all notes
+        self._notebook_titles: Dict[str, Dict[str, str]] = {}
+        self._all_titles: Optional[Dict[str, str]] = None
+        # Whether the current import is large enough to list every note for the
+        # no-notebook index; smaller ones search per title instead
+        self._index_all_titles = False
+        # Per-key locks for lookups that await a client call and must not race
+        # with themselves: ("title", notebook_id, title), ("notebook", name),
+        # ("tag", name), ("titles", notebook_id)
+        self._locks: Dict[tuple, asyncio.Lock] = {}
+        # (title, notebook_id) -> existing note ID, for lookups answered by search
+        self._exists_cache: Dict[Tuple[str, Optional[str]], Optional[str]] = {}
+        # Notes created (or overwritten) by this engine, never overwritten again
+        self._created_ids: Set[str] = set()
+        # Next "(n)" suffix to try when renaming duplicates of a title
+        self._rename_ctr: Dict[Tuple[Optional[str], str], int] = {}
+
+    def _lock_for(self, key: tuple) -> asyncio.Lock:
+        """Return the lock serializing work on ``key`` (created on first use)."""
+        return self._locks.setdefault(key, asyncio.Lock())
 
     async def import_batch(
         self, notes: List[ImportedNote], options: ImportOptions
@@ -91,110 +202,169 @@ class JoplinImportEngine:
             pass
 
         result.total_processed = len(notes)
+        large_import = len(notes) >= options.cache_populate_threshold
+        self._index_all_titles = large_import
 
         try:
-            # Pre-populate caches for performance
-            await self._populate_caches()
+            # Pre-populate caches for performance; small imports resolve the
+            # few notebooks/tags they use on demand instead
+            if large_import and not self._caches_populated:
+                await self._populate_caches()
 
             # Prepare tracking for created notes to support link rewriting
             created_records: List[Dict[str, str]] = []
 
-            # Process notes in batches to avoid overwhelming Joplin
-            batch_size = min(options.max_batch_size, 50)
-
-            for i in range(0, len(notes), batch_size):
-                batch = notes[i : i + batch_size]
-                await self._process_batch(batch, options, result, created_records)
-
-                # Small delay between batches to be gentle on Joplin
-                if i + batch_size < len(notes):
-                    await asyncio.sleep(0.1)
+            await self._create_notes(notes, options, result, created_records)
 
             # After creating all notes, attempt to rewrite internal note links
             try:
-                await self._rewrite_internal_note_links(created_records, result, options)
+                rewritten = await asyncio.to_thread(
+                    self._rewrite_internal_note_links, created_records, result, options
+                )
+                await self._save_rewritten_bodies(rewritten, result)
             except Exception as e:
-                logger.warning(f"Internal link rewrite failed: {e}")
+                logger.warning("Internal link rewrite failed: %s", e)
 
         except Exception as e:
             result.add_failure("Batch Processing", f"Critical error: {str(e)}")
-            logger.error(f"Import batch failed: {e}")
+            logger.error("Import batch failed: %s", e)
 
         finally:
             result.finalize()
 
         return result
 
-    async def _process_batch(
+    async def _create_notes(
         self,
-        batch: List[ImportedNote],
+        notes: List[ImportedNote],
         options: ImportOptions,
         result: ImportResult,
         created_records: List[Dict[str, str]],
     ) -> None:
-        """Process a single batch of notes.
+        """Create notes through a pool of workers sharing one queue.
+
+        Up to _NOTE_CREATE_CONCURRENCY notes are in flight at once, with no
+        barrier between batches, so slow notes overlap with fast ones.
+        Pacing is measured over windows of max_batch_size (at most 50)
+        completed notes: when Joplin slows down or notes fail, the worker
+        closing the window pauses everyone before the next note is taken.
+        Outcomes are recorded in input order once every note is done.
 
         Args:
-            batch: Batch of notes to process
+            notes: Notes to create
             options: Import options
             result: Result object to update
+            created_records: Receives a record per created note
         """
-        for note in batch:
-            try:
-                success, message, new_id = await self.create_note_safe(
-                    note, options, result
+        queue: asyncio.Queue[Tuple[int, ImportedNote]] = asyncio.Queue()
+        for item in enumerate(notes):
+            queue.put_nowait(item)
+        outcomes: List[Union[Tuple[bool, str, Optional[str]], Exception, None]] = [
+            None
+        ] * len(notes)
+
+        window = min(options.max_batch_size, 50)
+        gate = asyncio.Event()
+        gate.set()
+        done = 0
+        failed = 0
+        window_started = time.perf_counter()
+        window_failed = 0
+        fastest: Optional[float] = None
+        smoothed: Optional[float] = None
+        failing_windows = 0
+
+        async def pace() -> None:
+            nonlocal window_started, window_failed, fastest, smoothed, failing_windows
+            now = time.perf_counter()
+            per_note = (now - window_started) / window
+            window_started = now
+
+            fastest = per_note if fastest is None else min(fastest, per_note)
+            smoothed = per_note if smoothed is None else 0.7 * smoothed + 0.3 * per_note
+            failing_windows = failing_windows + 1 if failed > window_failed else 0
+            window_failed = failed
+
+            if done >= len(notes) or options.inter_batch_pause <= 0:
+                return
+            # Be gentle on Joplin, but only once it shows signs of strain:
+            # failing notes (backing off while it persists), or slowing down
+            if failing_windows:
+                delay = min(
+                    options.inter_batch_pause * 2 ** failing_windows, _MAX_BACKOFF_SECONDS
                 )
-                if success:
-                    # Only count as a created success if we actually created a note (have new_id)
-                    if new_id:
-                        result.add_success(note.title)
-                    # Track created note info for link rewriting
-                    if new_id:
-                        try:
-                            record: Dict[str, str] = {
-                                "new_id": new_id or "",
+            elif smoothed > _SLOWDOWN_RATIO * fastest:
+                delay = options.inter_batch_pause
+            else:
+                return
+            gate.clear()
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                gate.set()
+
+        async def worker() -> None:
+            nonlocal done, failed
+            while True:
+                await gate.wait()
+                try:
+                    index, note = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    outcome = await self.create_note_safe(note, options, result)
+                except Exception as e:
+                    outcome = e
+                outcomes[index] = outcome
+                if isinstance(outcome, Exception) or not outcome[0]:
+                    failed += 1
+                done += 1
+                if done % window == 0:
+                    await pace()
+
+        await asyncio.gather(
+            *(worker() for _ in range(min(_NOTE_CREATE_CONCURRENCY, len(notes))))
+        )
+        for note, outcome in zip(notes, outcomes):
+            self._record_outcome(note, outcome, result, created_records)
+
+    def _record_outcome(
+        self,
+        note: ImportedNote,
+        outcome: Union[Tuple[bool, str, Optional[str]], Exception],
+        result: ImportResult,
+        created_records: List[Dict[str, str]],
+    ) -> None:
+        """Record one create_note_safe outcome (or the exception it raised)."""
+        try:
+            if isinstance(outcome, Exception):
+                raise outcome
+            success, message, new_id = outcome
+            if success:
+                # Only count as a created success if we actually created a note (have new_id)
+                if new_id:
+                    result.add_success(note.title)
+                # Track created note info for link rewriting
+                if new_id:
+                    try:
+                        created_records.append(
+                            {
+                                "new_id": new_id,
                                 "title": note.title,
+                                # Body as sent to Joplin, so link rewriting needn't refetch it
+                                "body": note.body,
+                                **note.link_record_fields(),
                             }
-                            # Capture origin identifiers for mapping
-                            if isinstance(note.metadata, dict):
-                                orig_id = note.metadata.get("id") or note.metadata.get(
-                                    "joplin_id"
-                                )
-                                if orig_id and isinstance(orig_id, str):
-                                    record["original_id"] = orig_id
-
-                                source_file = note.metadata.get("source_file")
-                                if source_file:
-                                    from pathlib import Path as _P
-                                    try:
-                                        p = _P(str(source_file)).resolve()
-                                        record["source_file"] = str(p)
-                                        record["source_dir"] = str(p.parent)
-                                    except Exception:
-                                        record["source_file"] = str(source_file)
-
-                            original_format = note.metadata.get("original_format")
-                            if original_format:
-                                record["original_format"] = str(original_format)
-
-                                raw_res = note.metadata.get("raw_resources_dir")
-                                if raw_res:
-                                    try:
-                                        from pathlib import Path as _P
-                                        record["raw_resources_dir"] = str(_P(str(raw_res)).resolve())
-                                    except Exception:
-                                        record["raw_resources_dir"] = str(raw_res)
-
-                            created_records.append(record)
-                        except Exception:
-                            # Non-fatal tracking failure
-                            pass
-                else:
-                    result.add_failure(note.title, message)
+                        )
+                    except Exception:
+                        # Non-fatal tracking failure
+                        pass
+            else:
+                result.add_failure(note.title, message)
 
-            except Exception as e:
-                result.add_failure(note.title, f"Unexpected error: {str(e)}")
-                logger.error(f"Failed to process note '{note.title}': {e}")
+        except Exception as e:
+            result.add_failure(note.title, f"Unexpected error: {str(e)}")
+            logger.error("Failed to process note '%s': %s", note.title, e)
 
     async def create_note_safe(
         self, note: ImportedNote, options: ImportOptions, result: ImportResult
@@ -209,6 +379,7 @@ class JoplinImportEngine:
         Returns:
             Tuple of (success: bool, message: str, new_id: Optional[str])
         """
+        overwritten_id: Optional[str] = None
         try:
             # Handle notebook assignment
             notebook_id = None
@@ -221,8 +392,15 @@ class JoplinImportEngine:
                     options.target_notebook, options, result
                 )
 
-            # Handle duplicate checking
-            if options.handle_duplicates != "overwrite":
+            # Notes in the same batch are created concurrently; hold the lock
+            # for this (notebook, title) from the duplicate check until the new
+            # note is indexed, so same-titled notes can't both pass the check.
+            async with self._lock_for(("title", notebook_id, note.title)):
+                timestamps = (
+                    self._timestamp_fields(note) if options.preserve_timestamps else {}
+                )
+
+                # Handle duplicate checking
                 existing_id = await self._find_existing_note(note.title, notebook_id)
                 if existing_id:
                     if options.handle_duplicates == "skip":
@@ -233,50 +411,85 @@ class JoplinImportEngine:
                         note.title = await self._generate_unique_title(
                             note.title, notebook_id
                         )
+                    elif existing_id not in self._created_ids:
+                        # Overwrite updates the note in place; notes created by
+                        # this import are never overwritten by later ones
+                        await asyncio.to_thread(
+                            self.client.modify_note,
+                            existing_id,
+                            body=note.body,
+                            is_todo=note.is_todo,
+                            todo_completed=note.todo_completed,
+                            **timestamps,
+                        )
+                        overwritten_id = existing_id
+                        self._created_ids.add(existing_id)
+
+                # Create the note, with original timestamps in the same request
+                note_kwargs = {
+                    "title": note.title,
+                    "body": note.body,
+                    "parent_id": notebook_id,
+                    "is_todo": note.is_todo,
+                    "todo_completed": note.todo_completed,
+                }
+                if overwritten_id:
+                    note_id = overwritten_id
+                else:
+                    try:
+                        note_id = await asyncio.to_thread(
+                            self.client.add_note, **note_kwargs, **timestamps
+                        )
+                    except requests.HTTPError as e:
+                        if not timestamps or not _is_client_error(e):
+                            raise
+                        # Backend rejected the timestamp fields: create, then patch
+                        note_id = await asyncio.to_thread(self.client.add_note, **note_kwargs)
+                        if note_id and isinstance(note_id, str):
+                            await self._update_note_timestamps(note_id, note)
 
-            # Create the note
-            note_id = self.client.add_note(
-                title=note.title,
-                body=note.body,
-                parent_id=notebook_id,
-                is_todo=note.is_todo,
-                todo_completed=note.todo_completed,
-            )
+                    # add_note returns the note ID directly as a string
+                    if not note_id or not isinstance(note_id, str):
+                        return False, "Failed to get note ID from creation response", None
 
-            # add_note returns the note ID directly as a string
-            if not note_id or not isinstance(note_id, str):
-                return False, "Failed to get note ID from creation response", None
+                    self._created_ids.add(note_id)
+                    self._index_note(note_id, note.title, notebook_id)
 
             # Handle tags
             if note.tags:
                 await self._apply_tags_to_note(note_id, note.tags, options, result)
 
-            # Handle timestamps if preserve_timestamps is enabled
-            if options.preserve_timestamps and (note.created_time or note.updated_time):
-                await self._update_note_timestamps(note_id, note)
-
+            if overwritten_id:
+                return True, f"Overwrote existing note (ID: {note_id})", note_id
             return True, f"Created successfully (ID: {note_id})", note_id
 
         except Exception as e:
             error_msg = str(e)
-            if "already exists" in error_msg.lower():
-                if options.handle_duplicates == "skip":
-                    result.add_skip(note.title, "Duplicate note")
-                    return True, "Skipped (duplicate)"
+            if options.handle_duplicates == "skip" and _ALREADY_EXISTS_RE.search(error_msg):
+                result.add_skip(note.title, "Duplicate note")
+                return True, "Skipped (duplicate)", None
 
             return False, f"Creation failed: {error_msg}", None
 
-    async def _rewrite_internal_note_links(
+    def _rewrite_internal_note_links(
         self, created_records: List[Dict[str, str]], result: ImportResult, options: ImportOptions
-    ) -> None:
+    ) -> List[Tuple[str, str]]:
         """Rewrite internal note links of the form [text](:/oldid) to their new IDs.
 
+        Blocking (resource uploads run inside regex callbacks); import_batch
+        runs it on a worker thread once every note has been created, then
+        saves the returned bodies with _save_rewritten_bodies.
+
         Args:
-            created_records: List of dicts with keys including 'new_id' and optional 'original_id'.
+            created_records: List of dicts with keys including 'new_id' and optional
+                'original_id' and 'body' (the body the note was created with).
             result: ImportResult to record warnings.
+
+        Returns:
+            (note_id, new_body) for each note whose body changed.
         """
         if not created_records:
-            return
+            return []
 
         # Build mapping from original Joplin IDs to new IDs
         id_map: Dict[str, str] = {}
@@ -298,18 +511,6 @@ class JoplinImportEngine:
                 fs_map[sf] = nid
                 fs_map_ci[sf.lower()] = nid
 
-        # Patterns
-        # ID links: matches both image and normal md links: ![alt](:/id) or [text](:/id)
-        id_link_re = re.compile(r"(!?\[[^\]]*\])\(:\/([a-f0-9]{32})(#[^)]+)?\)")
-        # File links (non-image): [text](path[#anchor]) excluding schemes and joplin ids
-        # Capture optional leading ! to detect and skip images
-        file_link_re = re.compile(r"(!?)(\[[^\]]*\])\(([^)]+)\)")
-        # Raw ID tokens to quickly collect IDs present in body
-        any_id_token_re = re.compile(r":/([a-f0-9]{32})")
-
-        def has_scheme(href: str) -> bool:
-            return re.match(r"^[a-zA-Z][a-zA-Z0-9+.-]*:", href) is not None
-
         # Build resource id -> file path map for RAW/JEX, and upload map
         res_dirs: List[str] = []
         for rec in created_records:
@@ -358,7 +559,7 @@ class JoplinImportEngine:
         uploaded_path_map: Dict[str, str] = {}        # absolute fs path -> new_resource_id
 
         # Iterate through created notes to rewrite bodies
-        notes_modified = 0
+        rewritten: List[Tuple[str, str]] = []
         uploaded_count = 0
         reused_count = 0
         unresolved_count = 0
@@ -368,18 +569,22 @@ class JoplinImportEngine:
                 continue
 
             try:
-                # Fetch the current note content (ensure body is included)
-                note_obj = self.client.get_note(note_id, fields="id,title,body")
-                body = getattr(note_obj, "body", None)
-                if not body or ":/" not in body:
-                    pass  # We might still have file links to rewrite
+                # Use the body we created the note with; fetch only if unknown
+                body = rec.get("body")
+                if body is None:
+                    note_obj = self.client.get_note(note_id, fields="id,body")
+                    body = getattr(note_obj, "body", None)
+                # Only ":/" ID links and (when file notes were imported) markdown
+                # links can be rewritten; most notes have neither
+                if not body or (":/" not in body and not (fs_map and "](" in body)):
+                    continue
 
                 new_body = body
+                # IDs linked from this body; most bodies link to none of ours
+                candidates = set(_ANY_ID_TOKEN_RE.findall(body)) if ":/" in body else set()
 
                 # 0) RAW/JEX resources: upload and rewrite :/oldResourceId if we can resolve files
-                if attachment_mode == "embed" and res_file_map and body:
-                    # Collect IDs present
-                    candidates = set(m.group(1) for m in any_id_token_re.finditer(body))
+                if attachment_mode == "embed" and res_file_map and candidates:
                     res_id_map: Dict[str, str] = {}
                     processed_rids: set[str] = set()
                     # Note IDs that will be handled by note-id mapping later
@@ -426,7 +631,9 @@ class JoplinImportEngine:
                                 uploaded_res_map[rid] = new_res_id
                                 uploaded_count += 1
                         except Exception as e:
-                            logger.warning(f"Failed to upload resource {rid} from {fp}: {e}")
+                            logger.warning(
+                                "Failed to upload resource %s from %s: %s", rid, fp, e
+                            )
                             continue
 
                     if res_id_map:
@@ -439,7 +646,7 @@ class JoplinImportEngine:
                                 return f"{prefix}(:/{nr}{anchor})"
                             return match.group(0)
 
-                        new_body = id_link_re.sub(_sub_res, new_body)
+                        new_body = _ID_LINK_RE.sub(_sub_res, new_body)
 
                     # Count unresolved resource IDs that we attempted but couldn't replace
                     for rid in processed_rids:
@@ -447,20 +654,18 @@ class JoplinImportEngine:
                             unresolved_count += 1
 
                 # 1) Rewrite :/oldid links (both image and non-image) for notes
-                if id_map and body:
-                    def _sub_id(match: re.Match) -> str:
-                        prefix = match.group(1)
-                        old_id = match.group(2)
-                        anchor = match.group(3) or ""
-                        # Do not override resource replacements
-                        if 'res_id_map' in locals() and old_id in res_id_map:
-                            return match.group(0)
-                        new_id = id_map.get(old_id)
+                if id_map and not candidates.isdisjoint(id_map):
+                    # Resource links were already rewritten to their new IDs
+                    # above, and resource IDs never collide with note IDs, so
+                    # every match only needs the note map
+                    def _sub_id(match: re.Match, _lookup=id_map.get) -> str:
+                        prefix, old_id, anchor = match.groups()
+                        new_id = _lookup(old_id)
                         if new_id and new_id != old_id:
-                            return f"{prefix}(:/{new_id}{anchor})"
+                            return f"{prefix}(:/{new_id}{anchor or ''})"
                         return match.group(0)
 
-                    new_body = id_link_re.sub(_sub_id, new_body)
+                    new_body = _ID_LINK_RE.sub(_sub_id, new_body)
 
                 # 2) Rewrite file path links: to note IDs (when target is a note) or to resources (attachments)
                 if fs_map and new_body:
@@ -501,7 +706,7 @@ class JoplinImportEngine:
                         prefix = match.group(2)
                         href = (match.group(3) or "").strip()
                         # Already joplin id or anchor-only
-                        if href.startswith(":/") or href.startswith("#") or has_scheme(href):
+                        if href.startswith(":/") or href.startswith("#") or _SCHEME_RE.match(href):
                             return match.group(0)
                         # Split anchor
                         anchor = ""
@@ -565,22 +770,38 @@ class JoplinImportEngine:
                         unresolved_count += 1
                         return match.group(0)
 
-                    new_body2 = file_link_re.sub(_sub_file, new_body)
+                    new_body2 = _FILE_LINK_RE.sub(_sub_file, new_body)
                     new_body = new_body2
 
                 if new_body != body:
-                    self.client.modify_note(note_id, body=new_body)
-                    notes_modified += 1
+                    rewritten.append((note_id, new_body))
             except Exception as e:
-                logger.warning(
-                    f"Failed rewriting links for note {note_id}: {e}"
-                )
+                logger.warning("Failed rewriting links for note %s: %s", note_id, e)
 
-        # Update summary counters
-        result.notes_rewritten += notes_modified
+        # Update summary counters (notes_rewritten once the bodies are saved)
         result.resources_uploaded += uploaded_count
         result.resources_reused += reused_count
         result.unresolved_links += unresolved_count
+        return rewritten
+
+    async def _save_rewritten_bodies(
+        self, rewritten: List[Tuple[str, str]], result: ImportResult
+    ) -> None:
+        """Write rewritten note bodies back to Joplin concurrently."""
+        semaphore = asyncio.Semaphore(_LINK_REWRITE_CONCURRENCY)
+
+        async def save(note_id: str, body: str) -> None:
+            async with semaphore:
+                await asyncio.to_thread(self.client.modify_note, note_id, body=body)
+
+        outcomes = await asyncio.gather(
+            *(save(note_id, body) for note_id, body in rewritten), return_exceptions=True
+        )
+        for (note_id, _), outcome in zip(rewritten, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning("Failed rewriting links for note %s: %s", note_id, outcome)
+            else:
+                result.notes_rewritten += 1
 
     async def ensure_notebook_exists(
         self, notebook_name: str, options: ImportOptions, result: ImportResult
@@ -598,32 +819,51 @@ class JoplinImportEngine:
         if not notebook_name or not notebook_name.strip():
             return None
 
+        nb_cache = self._notebook_cache
+        key = _name_key(notebook_name)
+
         # Check cache first
-        if notebook_name in self._notebook_cache:
-            return self._notebook_cache[notebook_name]
+        notebook_id = nb_cache.get(key)
+        if notebook_id is not None:
+            return notebook_id
 
-        try:
-            # Try to find existing notebook
-            notebooks = self.client.get_all_notebooks()
-            for notebook in notebooks:
-                if notebook.title == notebook_name:
-                    notebook_id = notebook.id
-                    self._notebook_cache[notebook_name] = notebook_id
-                    return notebook_id
-
-            # Create new notebook if allowed
-            if options.create_missing_notebooks:
-                notebook_id = self.client.add_notebook(title=notebook_name)
-                if notebook_id:
-                    self._notebook_cache[notebook_name] = notebook_id
-                    result.add_created_notebook(notebook_name)
-                    return notebook_id
+        # Concurrent notes may need the same missing notebook; create it once
+        async with self._lock_for(("notebook", key)):
+            notebook_id = nb_cache.get(key)
+            if notebook_id is not None:
+                return notebook_id
 
-        except Exception as e:
-            logger.error(f"Failed to ensure notebook '{notebook_name}': {e}")
-            result.add_warning(
-                f"Could not create/find notebook '{notebook_name}': {str(e)}"
-            )
+            try:
+                # Try to find existing notebook (unless the cache is known complete);
+                # keep every title from the listing so later names hit the cache
+                if not (self._caches_populated or self._notebooks_listed):
+                    await asyncio.to_thread(
+                        _collect_titles, self.client.get_notebooks, nb_cache, _name_key,
+                        fields="id,title",
+                    )
+                    self._notebooks_listed = True
+                    notebook_id = nb_cache.get(key)
+                    if notebook_id is not None:
+                        return notebook_id
+
+                # Create new notebook if allowed
+                if options.create_missing_notebooks:
+                    notebook_name = notebook_name.strip()
+                    notebook_id = await asyncio.to_thread(
+                        self.client.add_notebook, title=notebook_name
+                    )
+                    if notebook_id:
+                        nb_cache[key] = notebook_id
+                        # A brand-new notebook has no notes to collide with
+                        self._notebook_titles[notebook_id] = {}
+                        result.add_created_notebook(notebook_name)
+                        return notebook_id
+
+            except Exception as e:
+                logger.error("Failed to ensure notebook '%s': %s", notebook_name, e)
+                result.add_warning(
+                    f"Could not create/find notebook '{notebook_name}': {str(e)}"
+                )
 
         return None
 
@@ -640,43 +880,70 @@ class JoplinImportEngine:
         Returns:
             List of tag IDs
         """
-        tag_ids = []
+        tag_cache = self._tag_cache
 
+        # Unique non-blank names by cache key, in first-seen order
+        wanted: Dict[str, str] = {}
         for tag_name in tag_names:
-            if not tag_name or not tag_name.strip():
-                continue
-
-            # Check cache first
-            if tag_name in self._tag_cache:
-                tag_ids.append(self._tag_cache[tag_name])
-                continue
+            if tag_name and tag_name.strip():
+                wanted.setdefault(_name_key(tag_name), tag_name)
 
+        missing = [key for key in wanted if key not in tag_cache]
+        if missing:
             try:
-                # Try to find existing tag
-                tags = self.client.get_all_tags()
-                found = False
-                for tag in tags:
-                    if tag.title == tag_name:
-                        tag_id = tag.id
-                        self._tag_cache[tag_name] = tag_id
-                        tag_ids.append(tag_id)
-                        found = True
-                        break
-
-                # Create new tag if allowed and not found
-                if not found and options.create_missing_tags:
-                    tag_id = self.client.add_tag(title=tag_name)
-                    if tag_id:
-                        self._tag_cache[tag_name] = tag_id
-                        tag_ids.append(tag_id)
-                        result.add_created_tag(tag_name)
+                # Find existing tags (unless the cache is known complete) with one
+                # listing for the whole set; every title goes into the cache
+                if not (self._caches_populated or self._tags_listed):
+                    async with self._lock_for(("tags",)):
+                        if not self._tags_listed:
+                            await asyncio.to_thread(
+                                _collect_titles, self.client.get_tags, tag_cache, _name_key,
+                                fields="id,title",
+                            )
+                            self._tags_listed = True
+            except Exception as e:
+                for key in missing:
+                    logger.error("Failed to ensure tag '%s': %s", wanted[key], e)
+                    result.add_warning(
+                        f"Could not create/find tag '{wanted[key]}': {str(e)}"
+                    )
+            else:
+                # Create whatever is still unknown, concurrently
+                if options.create_missing_tags:
+                    semaphore = asyncio.Semaphore(_TAG_APPLY_CONCURRENCY)
+                    await asyncio.gather(
+                        *(
+                            self._create_tag(wanted[key], key, semaphore, result)
+                            for key in missing
+                            if key not in tag_cache
+                        )
+                    )
+
+        return [tag_cache[key] for key in wanted if key in tag_cache]
 
+    async def _create_tag(
+        self,
+        tag_name: str,
+        key: str,
+        semaphore: asyncio.Semaphore,
+        result: ImportResult,
+    ) -> None:
+        """Create a missing tag and cache its ID, recording failures as warnings."""
+        # Concurrent notes may share a missing tag; create it once
+        async with self._lock_for(("tag", key)):
+            if key in self._tag_cache:
+                return
+            try:
+                tag_name = tag_name.strip()
+                async with semaphore:
+                    tag_id = await asyncio.to_thread(self.client.add_tag, title=tag_name)
+                if tag_id:
+                    self._tag_cache[key] = tag_id
+                    result.add_created_tag(tag_name)
             except Exception as e:
-                logger.error(f"Failed to ensure tag '{tag_name}': {e}")
+                logger.error("Failed to ensure tag '%s': %s", tag_name, e)
                 result.add_warning(f"Could not create/find tag '{tag_name}': {str(e)}")
 
-        return tag_ids
-
     async def _apply_tags_to_note(
         self,
         note_id: str,
@@ -695,13 +962,22 @@ class JoplinImportEngine:
         try:
             tag_ids = await self.ensure_tags_exist(tag_names, options, result)
 
-            for tag_id in tag_ids:
-                try:
-                    self.client.add_tag_to_note(tag_id=tag_id, note_id=note_id)
-                except Exception as e:
+            semaphore = asyncio.Semaphore(_TAG_APPLY_CONCURRENCY)
+
+            async def apply(tag_id: str) -> None:
+                async with semaphore:
+                    await asyncio.to_thread(
+                        self.client.add_tag_to_note, tag_id=tag_id, note_id=note_id
+                    )
+
+            outcomes = await asyncio.gather(
+                *(apply(tag_id) for tag_id in tag_ids), return_exceptions=True
+            )
+            for tag_id, outcome in zip(tag_ids, outcomes):
+                if isinstance(outcome, Exception):
                     # Non-fatal error, just log it
                     logger.warning(
-                        f"Failed to apply tag {tag_id} to note {note_id}: {e}"
+                        "Failed to apply tag %s to note %s: %s", tag_id, note_id, outcome
                     )
 
         except Exception as e:
@@ -710,24 +986,61 @@ class JoplinImportEngine:
     async def _populate_caches(self) -> None:
         """Pre-populate notebook and tag caches for performance."""
         try:
-            # Cache notebooks
-            notebooks = self.client.get_all_notebooks()
-            for notebook in notebooks:
-                name = notebook.title
-                notebook_id = notebook.id
-                if name and notebook_id:
-                    self._notebook_cache[name] = notebook_id
-
-            # Cache tags
-            tags = self.client.get_all_tags()
-            for tag in tags:
-                name = tag.title
-                tag_id = tag.id
-                if name and tag_id:
-                    self._tag_cache[name] = tag_id
+            # Cache notebooks and tags, listing both at once
+            await asyncio.gather(
+                asyncio.to_thread(
+                    _collect_titles, self.client.get_notebooks, self._notebook_cache,
+                    _name_key, fields="id,title",
+                ),
+                asyncio.to_thread(
+                    _collect_titles, self.client.get_tags, self._tag_cache, _name_key,
+                    fields="id,title",
+                ),
+            )
+
+            self._caches_populated = True
 
         except Exception as e:
-            logger.warning(f"Failed to populate caches: {e}")
+            logger.warning("Failed to populate caches: %s", e)
+
+    def _index_note(self, note_id: str, title: str, parent_id: Optional[str]) -> None:
+        """Record a new note in whichever duplicate-check indexes are loaded."""
+        self._exists_cache[(title, parent_id)] = note_id
+        self._exists_cache.setdefault((title, None), note_id)
+        if parent_id in self._notebook_titles:
+            self._notebook_titles[parent_id].setdefault(title, note_id)
+        if self._all_titles is not None:
+            self._all_titles.setdefault(title, note_id)
+
+    def _load_titles(self, notebook_id: Optional[str]) -> Optional[Dict[str, str]]:
+        """Return title -> id for one notebook (or every note when None).
+
+        One listing per notebook the import touches replaces a title search
+        per imported note. The every-note listing is only worth it for large
+        imports (see ``_index_all_titles``). Returns None if the listing
+        fails, so callers fall back to searching.
+        """
+        if notebook_id is None:
+            if self._all_titles is None:
+                try:
+                    self._all_titles = _collect_titles(
+                        self.client.get_notes, {}, fields="id,title"
+                    )
+                except Exception as e:
+                    self._all_titles = None
+                    logger.warning("Failed to list existing notes: %s", e)
+            return self._all_titles
+
+        if notebook_id not in self._notebook_titles:
+            try:
+                self._notebook_titles[notebook_id] = _collect_titles(
+                    self.client.get_notes, {}, notebook_id=notebook_id,
+                    fields="id,title",
+                )
+            except Exception as e:
+                logger.warning("Failed to list notes in notebook %s: %s", notebook_id, e)
+                return None
+        return self._notebook_titles[notebook_id]
 
     async def _find_existing_note(
         self, title: str, notebook_id: Optional[str]
@@ -741,19 +1054,45 @@ class JoplinImportEngine:
         Returns:
             Note ID if found, None otherwise
         """
+        key = (title, notebook_id)
+        if key in self._exists_cache:
+            return self._exists_cache[key]
+
+        # Already-loaded index: answer without a lock or thread hop
+        titles = (
+            self._all_titles
+            if notebook_id is None
+            else self._notebook_titles.get(notebook_id)
+        )
+        if titles is None and (notebook_id is not None or self._index_all_titles):
+            # Only one listing per notebook, however many notes ask at once
+            async with self._lock_for(("titles", notebook_id)):
+                titles = await asyncio.to_thread(self._load_titles, notebook_id)
+        if titles is not None:
+            return titles.get(title)
+
         try:
-            # Search for notes with exact title match
-            search_query = f'title:"{title}"'
-            results = self.client.search_all(search_query)
+            # Joplin's title: filter matches words, not the whole title, so
+            # the exact comparison stays client-side; stop at the first hit
+            search_query = 'title:"' + title.translate(_QUERY_QUOTES) + '"'
+            results = await asyncio.to_thread(
+                self.client.search_all, query=search_query, fields="id,title,parent_id"
+            )
 
-            for note in results:
-                if note.title == title:
-                    # Check notebook match if specified
-                    if notebook_id is None or note.parent_id == notebook_id:
-                        return note.id
+            found = next(
+                (
+                    note.id
+                    for note in results
+                    if note.title == title
+                    and (notebook_id is None or note.parent_id == notebook_id)
+                ),
+                None,
+            )
+            self._exists_cache[key] = found
+            return found
 
         except Exception as e:
-            logger.warning(f"Failed to search for existing note '{title}': {e}")
+            logger.warning("Failed to search for existing note '%s': %s", title, e)
 
         return None
 
@@ -769,39 +1108,77 @@ class JoplinImportEngine:
         Returns:
             Unique title
         """
-        counter = 1
-        while True:
-            candidate_title = f"{base_title} ({counter})"
-            if not await self._find_existing_note(candidate_title, notebook_id):
-                return candidate_title
-            counter += 1
+        # Resume after the last suffix handed out for this base, so renaming
+        # many duplicates of one title doesn't re-probe every earlier suffix
+        key = (notebook_id, base_title)
+        start = self._rename_ctr.get(key, 1)
+
+        async def taken(n: int) -> bool:
+            return bool(await self._find_existing_note(f"{base_title} ({n})", notebook_id))
+
+        if await taken(start):
+            # Existing "(n)" suffixes usually run contiguously from 1, so
+            # gallop past them (start+1, +2, +4, ...) to a free one, then
+            # binary-search back for the first free suffix after a taken one
+            used, step = start, 1
+            free = start + step
+            while await taken(free):
+                used = free
+                step *= 2
+                free = start + step
+                # Safety break to avoid an endless probe
+                if step > _RENAME_PROBE_LIMIT:
+                    break
+            while free - used > 1:
+                mid = (used + free) // 2
+                if await taken(mid):
+                    used = mid
+                else:
+                    free = mid
+            start = free
 
-            # Safety break to avoid infinite loop
-            if counter > 1000:
-                return f"{base_title} ({counter})"
+        self._rename_ctr[key] = start + 1
+        return f"{base_title} ({start})"
+
+    @staticmethod
+    def _timestamp_fields(note: ImportedNote) -> Dict[str, int]:
+        """Return the note's created/updated times as Joplin millisecond fields.
+
+        Both the system and user_* variants are set, so the original dates are
+        what Joplin shows.
+
+        Times within a few seconds of now (e.g. ImportedNote's defaults for
+        sources without dates) are left out: Joplin stamps new notes with
+        the current time anyway.
+        """
+        now_ms = datetime.now().timestamp() * 1000
+        fields: Dict[str, int] = {}
+        for name in ("created_time", "updated_time"):
+            value = getattr(note, name)
+            if value:
+                ms = int(value.timestamp() * 1000)
+                if abs(ms - now_ms) >= _SERVER_DEFAULT_TOLERANCE_MS:
+                    # user_* are the dates Joplin's apps display and sort by
+                    fields[name] = fields[f"user_{name}"] = ms
+        return fields
 
     async def _update_note_timestamps(self, note_id: str, note: ImportedNote) -> None:
-        """Update note timestamps if preserve_timestamps is enabled.
+        """Set timestamps on an existing note.
+
+        Fallback for when add_note rejects the timestamp fields.
 
         Args:
             note_id: ID of the note to update
             note: ImportedNote with timestamp information
         """
         try:
-            update_data = {}
-
-            if note.created_time:
-                # Convert datetime to milliseconds timestamp
-                update_data["created_time"] = int(note.created_time.timestamp() * 1000)
-
-            if note.updated_time:
-                update_data["updated_time"] = int(note.updated_time.timestamp() * 1000)
+            update_data = self._timestamp_fields(note)
 
             if update_data:
-                self.client.modify_note(note_id, **update_data)
+                await asyncio.to_thread(self.client.modify_note, note_id, **update_data)
 
         except Exception as e:
-            logger.warning(f"Failed to update timestamps for note {note_id}: {e}")
+            logger.warning("Failed to update timestamps for note %s: %s", note_id, e)
 
 
 def get_joplin_client() -> ClientApi:
@@ -1,16 +1,38 @@
 """Import functionality for Joplin MCP server."""
 
+import importlib
+from typing import Any
+
 from .base import BaseImporter
-from .csv_importer import CSVImporter
-from .generic_importer import GenericImporter
-from .html_importer import HTMLImporter
-from .jex_importer import JEXImporter
 from .markdown_importer import MarkdownImporter
-from .raw_importer import RAWImporter
 
 # Import utilities for use by importers
 from . import utils
 
+# Less common importers are loaded on first access (PEP 562), so importing a
+# single markdown file doesn't pay for the archive, HTML and CSV modules.
+_LAZY_IMPORTERS = {
+    "CSVImporter": ".csv_importer",
+    "GenericImporter": ".generic_importer",
+    "HTMLImporter": ".html_importer",
+    "JEXImporter": ".jex_importer",
+    "RAWImporter": ".raw_importer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTERS))
+
+
 __all__ = [
     "BaseImporter",
     "MarkdownImporter",
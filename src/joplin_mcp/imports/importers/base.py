@@ -1,11 +1,12 @@
 """Base classes for import functionality."""
 
+import asyncio
 import os
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from ..types import ImportedNote, ImportOptions
 from .utils import (
@@ -20,6 +21,9 @@ from .utils import (
     parse_flexible_timestamp,
 )
 
+# Files read and parsed at once when importing a directory
+_PARSE_CONCURRENCY = 8
+
 
 class ImportError(Exception):
     """Base exception for import-related errors."""
@@ -361,6 +365,29 @@ class BaseImporter(ABC):
         
         return scan_directory_for_files(directory_path, extensions, recursive)
     
+    async def parse_files_concurrently(
+        self, files: List[Path], parse_file: Callable[[Path], Any]
+    ) -> List[Any]:
+        """Run a synchronous per-file parser over many files in worker threads.
+
+        At most ``_PARSE_CONCURRENCY`` files are parsed at once, so slow disk
+        reads overlap without blocking the event loop. Results are returned in
+        ``files`` order; a file whose parser raised yields the exception instead.
+        """
+        results: List[Any] = [None] * len(files)
+        pending = iter(enumerate(files))
+
+        async def worker() -> None:
+            for index, file_path in pending:
+                try:
+                    results[index] = await asyncio.to_thread(parse_file, file_path)
+                except Exception as e:
+                    results[index] = e
+
+        workers = min(_PARSE_CONCURRENCY, len(files))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return results
+
     def extract_title_safe(self, content: str, filename_fallback: str) -> str:
         """Extract title from content using shared logic.
         
@@ -4,6 +4,7 @@ Converts HTML files to Markdown format suitable for Joplin import.
 Supports both single HTML files and basic HTML document structures.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import List, Optional
@@ -65,22 +66,21 @@ class HTMLImporter(BaseImporter):
 
         if path.is_file():
             # Parse single HTML file
-            note = await self._parse_html_file(path)
+            note = await asyncio.to_thread(self._parse_html_file, path)
             return [note] if note else []
         elif path.is_dir():
             # Parse all HTML files in directory using enhanced base class
             all_notes = []
             html_files = self.scan_directory_safe(path)
+            parsed = await self.parse_files_concurrently(html_files, self._parse_html_file)
 
-            for html_file in html_files:
-                try:
-                    note = await self._parse_html_file(html_file)
-                    if note:
-                        all_notes.append(note)
-                except Exception as e:
+            for html_file, note in zip(html_files, parsed):
+                if isinstance(note, Exception):
                     # Log error but continue with other files
-                    logger.warning(f"Failed to parse {html_file}: {str(e)}")
+                    logger.warning(f"Failed to parse {html_file}: {str(note)}")
                     continue
+                if note:
+                    all_notes.append(note)
 
             return all_notes
         else:
@@ -89,7 +89,7 @@ class HTMLImporter(BaseImporter):
                 f"Source is neither file nor directory: {source_path}"
             )
 
-    async def _parse_html_file(self, file_path: Path) -> Optional[ImportedNote]:
+    def _parse_html_file(self, file_path: Path) -> Optional[ImportedNote]:
         """Parse a single HTML file and convert to ImportedNote."""
         # Read file content using enhanced base class utilities
         content, used_encoding = self.read_file_safe(file_path)
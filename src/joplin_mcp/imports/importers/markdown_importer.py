@@ -1,5 +1,6 @@
 """Markdown file importer for Joplin MCP server."""
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import List, Optional
@@ -52,35 +53,37 @@ class MarkdownImporter(BaseImporter):
 
         if path.is_file():
             # Parse single file
-            note = await self._parse_markdown_file(path)
+            note = await asyncio.to_thread(self._parse_markdown_file, path)
             return [note] if note else []
 
         elif path.is_dir():
             # Parse all markdown files in directory using enhanced base class
             all_notes = []
             markdown_files = self.scan_directory_safe(path)
+            parsed = await self.parse_files_concurrently(
+                markdown_files, self._parse_markdown_file
+            )
 
-            for md_file in markdown_files:
-                try:
-                    note = await self._parse_markdown_file(md_file)
-                    # Preserve directory structure as notebook if not set by frontmatter
-                    if note and not note.notebook and self.options.preserve_structure:
-                        derived_notebook = self.extract_notebook_from_path(str(md_file), str(path))
-                        if derived_notebook:
-                            note.notebook = derived_notebook
-                    if note:
-                        all_notes.append(note)
-                except Exception as e:
+            for md_file, note in zip(markdown_files, parsed):
+                if isinstance(note, Exception):
                     # Log error but continue processing other files
                     logging.getLogger(__name__).warning(
-                        "Failed to parse %s: %s", md_file, e
+                        "Failed to parse %s: %s", md_file, note
                     )
+                    continue
+                # Preserve directory structure as notebook if not set by frontmatter
+                if note and not note.notebook and self.options.preserve_structure:
+                    derived_notebook = self.extract_notebook_from_path(str(md_file), str(path))
+                    if derived_notebook:
+                        note.notebook = derived_notebook
+                if note:
+                    all_notes.append(note)
 
             return all_notes
 
         return []
 
-    async def _parse_markdown_file(self, file_path: Path) -> Optional[ImportedNote]:
+    def _parse_markdown_file(self, file_path: Path) -> Optional[ImportedNote]:
         """Parse a single markdown file."""
         # Read markdown content using enhanced base class utilities
         content, used_encoding = self.read_file_safe(file_path)
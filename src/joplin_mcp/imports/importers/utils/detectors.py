@@ -1,8 +1,13 @@
 """Detector helpers for importer heuristics."""
 
 import re
+from itertools import islice
 from pathlib import Path
 
+_KV_SAMPLE_SIZE = 10
+_KV_ID_RE = re.compile(r"^id:\s*[a-f0-9]{32}$", re.M)
+_KV_TYPE_RE = re.compile(r"^type_:\s*\d+", re.M)
+
 
 def looks_like_raw_export(path: Path) -> bool:
     """Heuristically determine if a directory is a Joplin RAW export.
@@ -19,7 +24,7 @@ def looks_like_raw_export(path: Path) -> bool:
     """
     try:
         res_dir = path / "resources"
-        if res_dir.exists() and res_dir.is_dir():
+        if res_dir.is_dir():
             try:
                 # Any markdown anywhere under this directory
                 if any(path.rglob("*.md")):
@@ -31,20 +36,20 @@ def looks_like_raw_export(path: Path) -> bool:
 
     # Lightweight KV metadata check for top-level markdown only
     try:
-        md_top = list(path.glob("*.md"))
+        # Only a small sample is ever read, so don't list the whole directory
+        md_top = list(islice(path.glob("*.md"), _KV_SAMPLE_SIZE))
         if md_top:
             def looks_like_joplin_kv(md_path: Path) -> bool:
                 try:
                     text = md_path.read_text(encoding="utf-8", errors="ignore")
                     tail = "\n".join(text.strip().splitlines()[-40:])
-                    has_id = re.search(r"^id:\s*[a-f0-9]{32}$", tail, re.M) is not None
-                    has_type = re.search(r"^type_:\s*\d+", tail, re.M) is not None
+                    has_id = _KV_ID_RE.search(tail) is not None
+                    has_type = _KV_TYPE_RE.search(tail) is not None
                     return has_id and has_type
                 except Exception:
                     return False
 
-            sample = md_top[: min(10, len(md_top))]
-            matches = sum(1 for f in sample if looks_like_joplin_kv(f))
+            matches = sum(1 for f in md_top if looks_like_joplin_kv(f))
             if matches >= 2:
                 return True
     except Exception:
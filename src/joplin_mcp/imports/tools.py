@@ -2,29 +2,58 @@
 import ast
 import json
 import logging
+import os
+import stat
+from dataclasses import fields
 from pathlib import Path
-from typing import Annotated, Any, Dict, Literal, Optional
+from typing import Annotated, Any, Dict, Iterator, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from joplin_mcp.config import JoplinMCPConfig
-from joplin_mcp.fastmcp_server import create_tool, get_joplin_client
+from joplin_mcp.config import get_config
+from joplin_mcp.fastmcp_server import clear_tag_cache, create_tool, get_joplin_client
+from joplin_mcp.notebook_utils import invalidate_notebook_map_cache
 
+from . import importers
 from .engine import JoplinImportEngine
-from .importers import (
-    CSVImporter,
-    GenericImporter,
-    HTMLImporter,
-    JEXImporter,
-    MarkdownImporter,
-    RAWImporter,
-)
 from .importers.base import ImportProcessingError, ImportValidationError
 from .importers.utils import looks_like_raw_export
 from .types import ImportOptions
 
 logger = logging.getLogger(__name__)
 
+# Importer class name per format name (as given by the user or detected
+# below). Classes are looked up on use so only the needed importer loads.
+_FORMAT_MAP = {
+    "md": "MarkdownImporter",
+    "markdown": "MarkdownImporter",
+    "jex": "JEXImporter",
+    "html": "HTMLImporter",
+    "htm": "HTMLImporter",
+    "csv": "CSVImporter",
+    "raw": "RAWImporter",
+    "generic": "GenericImporter",
+}
+
+# Lowercased file extension -> format name
+_EXT_TO_FORMAT = {
+    "md": "md",
+    "markdown": "md",
+    "mdown": "md",
+    "mkd": "md",
+    "jex": "jex",
+    "html": "html",
+    "htm": "html",
+    "csv": "csv",
+}
+
+# Formats that count towards directory detection (JEX archives do not)
+_DIRECTORY_FORMATS = frozenset({"md", "html", "csv"})
+
+# Option keys set directly on ImportOptions; any other key is passed to the
+# importers through ImportOptions.import_options
+_IMPORT_OPTION_FIELDS = frozenset(f.name for f in fields(ImportOptions))
+
 
 def _require_all_properties(schema: Dict[str, Any], _model: Any) -> None:
     """Make object schemas strict-client compatible.
@@ -73,47 +102,47 @@ class ImportFromFileOptions(BaseModel):
 
 def format_import_result(result, operation_name: str = "IMPORT_BATCH") -> str:
     """Format import result for MCP response."""
-    status = (
-        "SUCCESS"
-        if result.is_complete_success
-        else "PARTIAL_SUCCESS" if result.is_partial_success else "FAILED"
-    )
-
-    response = f"""OPERATION: {operation_name}
-STATUS: {status}
-TOTAL_PROCESSED: {result.total_processed}
-SUCCESSFUL_IMPORTS: {result.successful_imports}
-FAILED_IMPORTS: {result.failed_imports}
-SKIPPED_ITEMS: {result.skipped_items}
-PROCESSING_TIME: {result.processing_time:.2f}s"""
+    complete = result.is_complete_success
+    partial = not complete and result.is_partial_success
+    status = "SUCCESS" if complete else "PARTIAL_SUCCESS" if partial else "FAILED"
+
+    lines = [
+        f"OPERATION: {operation_name}",
+        f"STATUS: {status}",
+        f"TOTAL_PROCESSED: {result.total_processed}",
+        f"SUCCESSFUL_IMPORTS: {result.successful_imports}",
+        f"FAILED_IMPORTS: {result.failed_imports}",
+        f"SKIPPED_ITEMS: {result.skipped_items}",
+        f"PROCESSING_TIME: {result.processing_time:.2f}s",
+    ]
 
     if result.created_notebooks:
-        response += f"\nCREATED_NOTEBOOKS: {', '.join(result.created_notebooks)}"
+        lines.append(f"CREATED_NOTEBOOKS: {', '.join(result.created_notebooks)}")
 
     if result.created_tags:
-        response += f"\nCREATED_TAGS: {', '.join(result.created_tags)}"
-
-    if result.errors:
-        response += f"\nERRORS: {len(result.errors)} error(s)"
-        for error in result.errors[:5]:  # Show first 5 errors
-            response += f"\n  - {error}"
-        if len(result.errors) > 5:
-            response += f"\n  ... and {len(result.errors) - 5} more errors"
-
-    if result.warnings:
-        response += f"\nWARNINGS: {len(result.warnings)} warning(s)"
-        for warning in result.warnings[:3]:  # Show first 3 warnings
-            response += f"\n  - {warning}"
-        if len(result.warnings) > 3:
-            response += f"\n  ... and {len(result.warnings) - 3} more warnings"
+        lines.append(f"CREATED_TAGS: {', '.join(result.created_tags)}")
+
+    error_count = len(result.errors)
+    if error_count:
+        lines.append(f"ERRORS: {error_count} error(s)")
+        lines.extend(f"  - {error}" for error in result.errors[:5])  # Show first 5 errors
+        if error_count > 5:
+            lines.append(f"  ... and {error_count - 5} more errors")
+
+    warning_count = len(result.warnings)
+    if warning_count:
+        lines.append(f"WARNINGS: {warning_count} warning(s)")
+        lines.extend(f"  - {warning}" for warning in result.warnings[:3])  # Show first 3 warnings
+        if warning_count > 3:
+            lines.append(f"  ... and {warning_count - 3} more warnings")
 
     # Add success message
-    if result.is_complete_success:
-        response += f"\nMESSAGE: Import completed successfully - all {result.successful_imports} items imported"
-    elif result.is_partial_success:
-        response += f"\nMESSAGE: Import partially successful - {result.successful_imports}/{result.total_processed} items imported"
+    if complete:
+        lines.append(f"MESSAGE: Import completed successfully - all {result.successful_imports} items imported")
+    elif partial:
+        lines.append(f"MESSAGE: Import partially successful - {result.successful_imports}/{result.total_processed} items imported")
     else:
-        response += "\nMESSAGE: Import failed - no items were successfully imported"
+        lines.append("MESSAGE: Import failed - no items were successfully imported")
 
     # Compact per-run summary (kept short for LLM context)
     try:
@@ -123,8 +152,8 @@ PROCESSING_TIME: {result.processing_time:.2f}s"""
             or getattr(result, "resources_reused", 0)
             or getattr(result, "unresolved_links", 0)
         ):
-            response += (
-                f"\nSUMMARY: modified_notes={getattr(result, 'notes_rewritten', 0)}, "
+            lines.append(
+                f"SUMMARY: modified_notes={getattr(result, 'notes_rewritten', 0)}, "
                 f"uploaded_resources={getattr(result, 'resources_uploaded', 0)}, "
                 f"reused_resources={getattr(result, 'resources_reused', 0)}, "
                 f"unresolved_links={getattr(result, 'unresolved_links', 0)}"
@@ -132,53 +161,47 @@ PROCESSING_TIME: {result.processing_time:.2f}s"""
     except Exception:
         pass
 
-    return response
+    return "\n".join(lines)
 
 
 def get_importer_for_format(file_format: str, options: ImportOptions):
     """Get the appropriate importer for the specified format."""
-    format_map = {
-        "md": MarkdownImporter,
-        "markdown": MarkdownImporter,
-        "jex": JEXImporter,
-        "html": HTMLImporter,
-        "htm": HTMLImporter,
-        "csv": CSVImporter,
-        "raw": RAWImporter,
-        "generic": GenericImporter,
-    }
+    # Fall back to generic importer for unknown formats
+    class_name = _FORMAT_MAP.get(file_format.lower(), "GenericImporter")
+    return getattr(importers, class_name)(options)
 
-    importer_class = format_map.get(file_format.lower())
-    if not importer_class:
-        # Fall back to generic importer for unknown formats
-        return GenericImporter(options)
 
-    return importer_class(options)
+def _extension(name: str) -> str:
+    """Lowercased extension of a file name, like Path.suffix without the dot."""
+    dot = name.rfind(".")
+    return name[dot + 1 :].lower() if dot > 0 else ""
 
 
 def detect_file_format(file_path: str) -> str:
     """Detect file format from file extension."""
-    path = Path(file_path)
-    extension = path.suffix.lstrip(".").lower()
-
-    # Map extensions to formats
-    extension_map = {
-        "md": "md",
-        "markdown": "markdown",
-        "mdown": "md",
-        "mkd": "md",
-        "jex": "jex",
-        "html": "html",
-        "htm": "html",
-        "csv": "csv",
-    }
-
-    detected_format = extension_map.get(extension)
-    if not detected_format:
-        # Fall back to generic format for unknown file types
-        return "generic"
+    # Fall back to generic format for unknown file types
+    return _EXT_TO_FORMAT.get(_extension(os.path.basename(file_path)), "generic")
 
-    return detected_format
+
+def _walk_file_names(directory: str) -> Iterator[str]:
+    """Yield the names of all files under ``directory``, recursively.
+
+    Uses os.scandir so file types come from the directory listing itself
+    rather than a Path object and stat() per entry. Directory symlinks are
+    not followed.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _walk_file_names(entry.path)
+                    elif entry.is_file():
+                        yield entry.name
+                except OSError:
+                    continue
+    except OSError:
+        return
 
 
 def detect_directory_format(directory_path: str) -> str:
@@ -194,45 +217,33 @@ def detect_directory_format(directory_path: str) -> str:
     """
     path = Path(directory_path)
 
-    if not path.exists() or not path.is_dir():
+    if not path.is_dir():
         raise ValueError(f"Directory not found: {directory_path}")
 
     # RAW detection using shared heuristic (root-level sensitive)
     if looks_like_raw_export(path):
         return "raw"
 
-    # Scan extensions in tree
-    extension_counts = {}
-    for file_path in path.rglob("*"):
-        if file_path.is_file():
-            extension = file_path.suffix.lstrip(".").lower()
-            extension_counts[extension] = extension_counts.get(extension, 0) + 1
-
-    if not extension_counts:
+    # Scan the tree, stopping as soon as the answer can no longer change:
+    # a second supported type means mixed content, whatever else is there.
+    found_files = False
+    present_supported = set()
+    for name in _walk_file_names(str(path)):
+        found_files = True
+        fmt = _EXT_TO_FORMAT.get(_extension(name))
+        if fmt in _DIRECTORY_FORMATS and fmt not in present_supported:
+            present_supported.add(fmt)
+            if len(present_supported) > 1:
+                # Mixed content – use GenericImporter
+                return "generic"
+
+    if not found_files:
         raise ValueError(f"No files found in directory: {directory_path}")
 
-    # Supported mapping
-    extension_map = {
-        "md": "md",
-        "markdown": "md",
-        "mdown": "md",
-        "mkd": "md",
-        "html": "html",
-        "htm": "html",
-        "csv": "csv",
-    }
-
-    # Collect supported types present
-    present_supported = {extension_map[ext] for ext in extension_counts.keys() if ext in extension_map}
-
     if not present_supported:
         # Fall back to generic when no recognized types
         return "generic"
 
-    if len(present_supported) > 1:
-        # Mixed content – use GenericImporter
-        return "generic"
-
     # Single supported type present
     return next(iter(present_supported))
 
@@ -271,12 +282,18 @@ async def import_from_file(
                        import_options={"csv_import_mode": "rows"})
     """
     try:
-        # Load configuration
-        config = JoplinMCPConfig.load()
+        # Use the live server configuration (no file re-read per call)
+        config = get_config()
 
-        # Validate file path (support both files and directories)
-        path = Path(file_path)
-        if not path.exists():
+        # Validate file path (support both files and directories) with a
+        # single stat; its mode answers every file/directory check below
+        try:
+            mode = os.stat(file_path).st_mode
+        except (OSError, ValueError):
+            mode = None
+        is_file = mode is not None and stat.S_ISREG(mode)
+        is_dir = mode is not None and stat.S_ISDIR(mode)
+        if mode is None:
             return format_import_result(type('Result', (), {
                 'is_complete_success': False,
                 'is_partial_success': False,
@@ -290,7 +307,7 @@ async def import_from_file(
                 'errors': [f"Path does not exist: {file_path}"],
                 'warnings': []
             })(), "IMPORT_FROM_FILE")
-        if not (path.is_file() or path.is_dir()):
+        if not (is_file or is_dir):
             return format_import_result(type('Result', (), {
                 'is_complete_success': False,
                 'is_partial_success': False,
@@ -307,7 +324,7 @@ async def import_from_file(
 
         # Detect format if not specified
         if not format:
-            if path.is_file():
+            if is_file:
                 try:
                     format = detect_file_format(file_path)
                 except ValueError:
@@ -329,6 +346,10 @@ async def import_from_file(
             preserve_timestamps=config.import_settings.get("preserve_timestamps", True),
             handle_duplicates=config.import_settings.get("handle_duplicates", "skip"),
             max_batch_size=config.import_settings.get("max_batch_size", 100),
+            inter_batch_pause=config.import_settings.get("inter_batch_pause", 0.1),
+            cache_populate_threshold=config.import_settings.get(
+                "cache_populate_threshold", 20
+            ),
             attachment_handling=config.import_settings.get(
                 "attachment_handling", "embed"
             ),
@@ -357,7 +378,7 @@ async def import_from_file(
                 return "VALIDATION_ERROR: import_options must be an object or JSON/dict string"
             # Merge structured options
             for key, value in import_options.items():
-                if hasattr(base_options, key):
+                if key in _IMPORT_OPTION_FIELDS:
                     setattr(base_options, key, value)
                 else:
                     base_options.import_options[key] = value
@@ -367,10 +388,10 @@ async def import_from_file(
 
         # If importing a directory with an importer that doesn't support directories,
         # fall back to GenericImporter which can delegate per-file.
-        if path.is_dir() and hasattr(importer, "supports_directory"):
+        if is_dir and hasattr(importer, "supports_directory"):
             try:
                 if not importer.supports_directory():
-                    importer = GenericImporter(base_options)
+                    importer = importers.GenericImporter(base_options)
             except Exception:
                 pass
 
@@ -395,6 +416,10 @@ async def import_from_file(
             result = await engine.import_batch(notes, base_options)
         except Exception as e:
             return f"ERROR: Import engine failed: {str(e)}"
+        finally:
+            # The engine may have created notebooks and tags behind the caches
+            clear_tag_cache()
+            invalidate_notebook_map_cache()
 
         # Format and return result
         return format_import_result(result, "IMPORT_FROM_FILE")
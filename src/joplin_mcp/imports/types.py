@@ -3,7 +3,11 @@
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+# Skip reasons kept per result; skipped_items still counts every skip
+SKIP_SAMPLE_LIMIT = 100
 
 
 class ImportValidationError(Exception):
@@ -55,6 +59,43 @@ class ImportedNote:
             # Use created_time if available, otherwise current time
             self.updated_time = self.created_time if self.created_time else datetime.now()
 
+    def link_record_fields(self) -> Dict[str, str]:
+        """Origin identifiers from metadata, used to rewrite links after import.
+
+        Returns any of original_id, source_file/source_dir (resolved),
+        original_format and raw_resources_dir that the importer recorded.
+        """
+        meta = self.metadata
+        if not isinstance(meta, dict) or not meta:
+            return {}
+
+        fields: Dict[str, str] = {}
+        orig_id = meta.get("id") or meta.get("joplin_id")
+        if orig_id and isinstance(orig_id, str):
+            fields["original_id"] = orig_id
+
+        source_file = meta.get("source_file")
+        if source_file:
+            try:
+                path = Path(str(source_file)).resolve()
+                fields["source_file"] = str(path)
+                fields["source_dir"] = str(path.parent)
+            except Exception:
+                fields["source_file"] = str(source_file)
+
+        original_format = meta.get("original_format")
+        if original_format:
+            fields["original_format"] = str(original_format)
+
+        raw_res = meta.get("raw_resources_dir")
+        if raw_res:
+            try:
+                fields["raw_resources_dir"] = str(Path(str(raw_res)).resolve())
+            except Exception:
+                fields["raw_resources_dir"] = str(raw_res)
+
+        return fields
+
 
 @dataclass
 class ImportResult:
@@ -80,6 +121,9 @@ class ImportResult:
     resources_uploaded: int = 0
     resources_reused: int = 0
     unresolved_links: int = 0
+    # Membership indexes for created_notebooks / created_tags
+    _created_notebook_set: Set[str] = field(default_factory=set, repr=False, compare=False)
+    _created_tag_set: Set[str] = field(default_factory=set, repr=False, compare=False)
 
     def add_success(self, note_title: str):
         """Record a successful import."""
@@ -91,9 +135,10 @@ class ImportResult:
         self.errors.append(f"{note_title}: {error}")
 
     def add_skip(self, note_title: str, reason: str):
-        """Record a skipped item."""
+        """Record a skipped item (reasons kept for the first SKIP_SAMPLE_LIMIT)."""
         self.skipped_items += 1
-        self.skipped_items_list.append(f"{note_title}: {reason}")
+        if len(self.skipped_items_list) < SKIP_SAMPLE_LIMIT:
+            self.skipped_items_list.append(f"{note_title}: {reason}")
 
     def add_warning(self, message: str):
         """Add a warning message."""
@@ -101,12 +146,14 @@ class ImportResult:
 
     def add_created_notebook(self, notebook_name: str):
         """Record a newly created notebook."""
-        if notebook_name not in self.created_notebooks:
+        if notebook_name not in self._created_notebook_set:
+            self._created_notebook_set.add(notebook_name)
             self.created_notebooks.append(notebook_name)
 
     def add_created_tag(self, tag_name: str):
         """Record a newly created tag."""
-        if tag_name not in self.created_tags:
+        if tag_name not in self._created_tag_set:
+            self._created_tag_set.add(tag_name)
             self.created_tags.append(tag_name)
 
     def finalize(self):
@@ -141,6 +188,8 @@ class ImportOptions:
     preserve_timestamps: bool = True
     handle_duplicates: str = "skip"  # skip|overwrite|rename
     max_batch_size: int = 100
+    inter_batch_pause: float = 0.1  # seconds; applied only while Joplin slows down
+    cache_populate_threshold: int = 20  # smaller imports look up notebooks/tags on demand
     attachment_handling: str = "embed"  # link|embed|skip
     encoding: str = "utf-8"
     max_file_size_mb: Optional[int] = None
@@ -165,3 +214,9 @@ class ImportOptions:
 
         if self.max_batch_size < 1:
             raise ValueError("max_batch_size must be at least 1")
+
+        if self.inter_batch_pause < 0:
+            raise ValueError("inter_batch_pause must not be negative")
+
+        if self.cache_populate_threshold < 0:
+            raise ValueError("cache_populate_threshold must not be negative")
@@ -16,7 +16,7 @@ The module owns three concerns:
 """
 
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 from joplin_mcp.content_utils import (
     calculate_content_stats,
@@ -233,17 +233,39 @@ def format_note_details(
     return "\n".join(result_parts)
 
 
+class _EntryDisplay(NamedTuple):
+    """Content-exposure settings resolved once per search result batch."""
+
+    show_content: bool
+    show_full_content: bool
+    max_preview_length: int
+    preview_query: str
+
+
+def _resolve_entry_display(
+    config: Any, context: str, original_query: Optional[str], query: str
+) -> _EntryDisplay:
+    """Read the content-exposure settings that apply to every entry in a batch."""
+    return _EntryDisplay(
+        show_content=config.should_show_content(context),
+        show_full_content=config.should_show_full_content(context),
+        max_preview_length=config.get_max_preview_length(),
+        preview_query=original_query if original_query is not None else query,
+    )
+
+
 def _format_note_entry(
     note: Any,
     index: int,
-    config: Any,
-    context: str,
-    original_query: Optional[str],
-    query: str,
+    display: _EntryDisplay,
     notebooks_map: Optional[Dict[str, Dict[str, Optional[str]]]] = None,
 ) -> List[str]:
-    """Format a single note entry for search results."""
-    body = getattr(note, "body", "")
+    """Format a single note entry for search results.
+
+    A ``None`` body was not listed because privacy settings hide content. It
+    gets no content stats rather than a zero count.
+    """
+    body = getattr(note, "body", None)
 
     entry = [f"RESULT_{index}:"]
 
@@ -251,7 +273,7 @@ def _format_note_entry(
         note,
         include_timestamps=True,
         include_todo=True,
-        include_content_stats=True,
+        include_content_stats=body is not None,
         content_stats_body=body,
         notebooks_map=notebooks_map,
         timestamp_format="%Y-%m-%d %H:%M",
@@ -260,22 +282,18 @@ def _format_note_entry(
         format_note_metadata_lines(metadata, style="lower", indent="  ")
     )
 
-    should_show_content = config.should_show_content(context)
-    if should_show_content and body:
-        if config.should_show_full_content(context):
+    if display.show_content and body:
+        if display.show_full_content:
             entry.append(f"  content: {body}")
         else:
-            search_query_for_terms = (
-                original_query if original_query is not None else query
-            )
             preview = create_content_preview_with_search(
-                body, config.get_max_preview_length(), search_query_for_terms
+                body, display.max_preview_length, display.preview_query
             )
             entry.append(f"  content_preview: {preview}")
-    elif should_show_content:
+    elif display.show_content:
         entry.append("  content: (empty)")
     else:
-        content_status = "(hidden by privacy settings)" if body else "(empty)"
+        content_status = "(empty)" if body == "" else "(hidden by privacy settings)"
         entry.append(f"  content: {content_status}")
 
     entry.append("")
@@ -355,12 +373,9 @@ def format_search_results_with_pagination(
         order_by=order_by, order_dir=order_dir,
     )
 
+    display = _resolve_entry_display(config, context, original_query, query)
     for i, note in enumerate(results, 1):
-        result_parts.extend(
-            _format_note_entry(
-                note, i, config, context, original_query, query, notebooks_map
-            )
-        )
+        result_parts.extend(_format_note_entry(note, i, display, notebooks_map))
 
     result_parts.extend(build_pagination_summary(total_count, limit, offset))
 
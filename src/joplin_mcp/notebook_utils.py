@@ -19,9 +19,11 @@ the default resolver and accept an optional ``client_fn`` for tests that
 want an isolated resolver instance.
 """
 
+import heapq
 import logging
 import os
 import re
+import threading
 import time
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
@@ -94,6 +96,9 @@ _DEFAULT_NOTEBOOK_TTL_SECONDS = 90  # sensible default; adjustable via env var
 # Regex for 32-char hex IDs (Joplin notebook/note IDs)
 _HEX_ID_RE = re.compile(r"^[0-9a-f]{32}$", re.IGNORECASE)
 
+# Fields needed to rebuild the notebook hierarchy
+_NOTEBOOK_TREE_FIELDS = "id,title,parent_id"
+
 
 def _get_notebook_cache_ttl() -> int:
     """Read cache TTL from JOPLIN_MCP_NOTEBOOK_CACHE_TTL env, clamped to [5, 3600]."""
@@ -216,20 +221,19 @@ def _find_notebook_suggestions(
         List of full notebook paths containing the search term
     """
     search_lower = search_term.lower()
-    matching_paths = []
 
-    for nb_id, info in notebooks_map.items():
-        title = info.get("title", "")
-        if search_lower in title.lower():
-            full_path = _compute_notebook_path(nb_id, notebooks_map, sep="/")
-            if full_path:
-                # Sort key: exact match first, then by path length (shorter = more relevant)
-                is_exact = title.lower() == search_lower
-                matching_paths.append((not is_exact, len(full_path), full_path))
+    def ranked_matches():
+        for nb_id, info in notebooks_map.items():
+            title_lower = info.get("title", "").lower()
+            if search_lower in title_lower:
+                full_path = _compute_notebook_path(nb_id, notebooks_map, sep="/")
+                if full_path:
+                    # Sort key: exact match first, then by path length (shorter = more relevant)
+                    is_exact = title_lower == search_lower
+                    yield (not is_exact, len(full_path), full_path)
 
-    # Sort by (not_exact, length) and return just the paths
-    matching_paths.sort()
-    return [path for _, _, path in matching_paths[:limit]]
+    # Keep only the best ``limit`` by (not_exact, length) instead of sorting every match
+    return [path for _, _, path in heapq.nsmallest(limit, ranked_matches())]
 
 
 class AllowlistDeniedError(ValueError):
@@ -275,6 +279,8 @@ class NotebookResolver:
         )
         self._map: Optional[Dict[str, Dict[str, Optional[str]]]] = None
         self._map_built_at: float = 0.0
+        # Held while refreshing the map so concurrent cold callers share one fetch
+        self._map_lock = threading.Lock()
         self._allowlist_entries: Optional[List[str]] = None
         self._allowlist_positive: Optional[pathspec.PathSpec] = None
         self._allowlist_negation: Optional[pathspec.PathSpec] = None
@@ -300,20 +306,30 @@ class NotebookResolver:
     ) -> Dict[str, Dict[str, Optional[str]]]:
         """Return the cached notebook map; refresh if stale or forced."""
         ttl = _get_notebook_cache_ttl()
-        now = time.monotonic()
+        requested_at = time.monotonic()
         if (
             not force_refresh
             and self._map is not None
-            and (now - self._map_built_at) < ttl
+            and (requested_at - self._map_built_at) < ttl
         ):
             return self._map
 
-        client = self._client_factory()
-        notebooks = client.get_all_notebooks(fields="id,title,parent_id")
-        nb_map = _build_notebook_map(notebooks)
-        self._map = nb_map
-        self._map_built_at = now
-        return nb_map
+        with self._map_lock:
+            # A refresh that started after this call was made already covers
+            # it, forced or not; so does any still-fresh map for plain reads.
+            now = time.monotonic()
+            if self._map is not None and (
+                self._map_built_at > requested_at
+                or (not force_refresh and (now - self._map_built_at) < ttl)
+            ):
+                return self._map
+
+            client = self._client_factory()
+            notebooks = client.get_all_notebooks(fields=_NOTEBOOK_TREE_FIELDS)
+            nb_map = _build_notebook_map(notebooks)
+            self._map = nb_map
+            self._map_built_at = now
+            return nb_map
 
     def _get_allowlist_specs(
         self,
@@ -495,13 +511,15 @@ class NotebookResolver:
             allowlist_entries=allowlist_entries, force_refresh=True
         )
 
+        # Lowercase each title once, not once per path segment
+        children: Dict[tuple, List[str]] = {}
+        for nb_id, info in notebooks_map.items():
+            key = (info.get("parent_id") or None, info["title"].lower())
+            children.setdefault(key, []).append(nb_id)
+
         current_parent: Optional[str] = None
         for part in parts:
-            matches = [
-                nb_id for nb_id, info in notebooks_map.items()
-                if info["title"].lower() == part.lower()
-                and (info.get("parent_id") or None) == current_parent
-            ]
+            matches = children.get((current_parent, part.lower()), [])
             if not matches:
                 suggestions = _find_notebook_suggestions(part, notebooks_map)
                 if suggestions:
@@ -658,7 +676,7 @@ class NotebookResolver:
 
         # Build a fresh notebook map from the explicit client, then populate
         # our cache so subsequent reads through the resolver hit it warm.
-        notebooks = client.get_all_notebooks(fields="id,title,parent_id")
+        notebooks = client.get_all_notebooks(fields=_NOTEBOOK_TREE_FIELDS)
         nb_map = _build_notebook_map(notebooks)
         self._map = nb_map
         self._map_built_at = time.monotonic()
@@ -780,7 +798,7 @@ class NotebookResolver:
             )
 
         # Check how many notebooks are actually accessible
-        all_notebooks = client.get_all_notebooks(fields="id,title,parent_id")
+        all_notebooks = client.get_all_notebooks(fields=_NOTEBOOK_TREE_FIELDS)
         accessible = self.filter_accessible(
             all_notebooks, allowlist_entries=allowlist
         )
@@ -8,6 +8,7 @@ from joplin_mcp.config import get_config
 from joplin_mcp.fastmcp_server import (
     ItemType,
     JoplinIdType,
+    NOTEBOOK_FIELDS,
     RequiredStringType,
     create_tool,
     format_creation_success,
@@ -15,6 +16,7 @@ from joplin_mcp.fastmcp_server import (
     format_item_list,
     format_update_success,
     get_joplin_client,
+    run_blocking,
 )
 from joplin_mcp.notebook_utils import get_notebook_id_by_name, notebook_resolver
 
@@ -66,8 +68,7 @@ async def list_notebooks() -> str:
         str: Formatted list of all notebooks including title, unique ID, parent notebook (if sub-notebook), and creation date.
     """
     client = get_joplin_client()
-    fields_list = "id,title,created_time,updated_time,parent_id,icon"
-    notebooks = client.get_all_notebooks(fields=fields_list)
+    notebooks = await run_blocking(client.get_all_notebooks, fields=NOTEBOOK_FIELDS)
     if get_config().has_notebook_allowlist:
         notebooks = notebook_resolver.filter_accessible(
             notebooks, allowlist_entries=get_config().notebook_allowlist
@@ -114,7 +115,7 @@ async def create_notebook(
 
     resolved_parent_id: Optional[str] = None
     if parent_name is not None:
-        resolved_parent_id = get_notebook_id_by_name(parent_name)
+        resolved_parent_id = await run_blocking(get_notebook_id_by_name, parent_name)
 
     if get_config().has_notebook_allowlist:
         if resolved_parent_id:
@@ -131,7 +132,7 @@ async def create_notebook(
     if emoji is not None:
         notebook_kwargs["icon"] = _build_icon_payload(emoji)
 
-    notebook = notebook_resolver.add_notebook(**notebook_kwargs)
+    notebook = await run_blocking(notebook_resolver.add_notebook, **notebook_kwargs)
     return format_creation_success(ItemType.notebook, title, str(notebook))
 
 
@@ -198,7 +199,7 @@ async def update_notebook(
                 raise ValueError("Notebook not accessible")
             new_parent_id = ""
         else:
-            new_parent_id = get_notebook_id_by_name(parent_name)
+            new_parent_id = await run_blocking(get_notebook_id_by_name, parent_name)
             if get_config().has_notebook_allowlist:
                 notebook_resolver.validate_access(
                     new_parent_id,
@@ -218,7 +219,7 @@ async def update_notebook(
             notebook_id, allowlist_entries=get_config().notebook_allowlist
         )
 
-    notebook_resolver.modify_notebook(notebook_id, **update_kwargs)
+    await run_blocking(notebook_resolver.modify_notebook, notebook_id, **update_kwargs)
     return format_update_success(ItemType.notebook, notebook_id)
 
 
@@ -249,7 +250,7 @@ async def delete_notebook(
     # Joplin's API silently 200s on DELETE for a missing notebook, so the
     # tool would otherwise report SUCCESS for a no-op. GET first to surface
     # the 404 as a sanitised ValueError via with_client_error_handling.
-    client.get_notebook(notebook_id, fields="id")
+    await run_blocking(client.get_notebook, notebook_id, fields="id")
 
-    notebook_resolver.delete_notebook(notebook_id)
+    await run_blocking(notebook_resolver.delete_notebook, notebook_id)
     return format_delete_success(ItemType.notebook, notebook_id)
@@ -1,4 +1,5 @@
 """Note tools for Joplin MCP."""
+from itertools import islice
 from typing import Annotated, Any, Dict, List, Optional, Union
 
 from pydantic import Field
@@ -9,6 +10,8 @@ from joplin_mcp.fastmcp_server import (
     ItemType,
     JoplinIdType,
     LimitType,
+    NOTE_LISTING_FIELDS,
+    NOTE_PARENT_FIELDS,
     OffsetType,
     OptionalBoolType,
     OptionalSortByType,
@@ -27,6 +30,7 @@ from joplin_mcp.fastmcp_server import (
     optional_int_converter,
     process_search_results,
     resolve_sort_params,
+    run_blocking,
     timestamp_converter,
     validate_joplin_id,
 )
@@ -47,6 +51,11 @@ from joplin_mcp.notebook_utils import (
     validate_notebook_access,
 )
 
+# get_links only parses bodies; timestamps and todo state are never rendered
+_LINK_SCAN_FIELDS = "id,title,body,parent_id"
+_LINK_TARGET_FIELDS = "id,title,parent_id"
+_RESOURCE_OCR_FIELDS = "id,title,mime,ocr_text,ocr_status"
+
 
 def build_search_filters(task: Optional[bool], completed: Optional[bool]) -> List[str]:
     """Build search filter parts for task and completion status."""
@@ -98,6 +107,13 @@ def format_no_results_with_pagination(
         return format_no_results_message(item_type, criteria)
 
 
+def _listing_fields(context: str = "search_results") -> str:
+    """Note fields for a listing pass; bodies only when the results show content."""
+    if get_config().should_show_content(context):
+        return COMMON_NOTE_FIELDS
+    return NOTE_LISTING_FIELDS
+
+
 # === NOTE TOOLS ===
 
 
@@ -182,16 +198,17 @@ async def get_note(
     if start_line is not None and include_body:
         note = note_view.get_cached_note(note_id)
         if note is None:
-            note = client.get_note(note_id, fields=COMMON_NOTE_FIELDS)
+            note = await run_blocking(client.get_note, note_id, fields=COMMON_NOTE_FIELDS)
             note_view.set_cached_note(note_id, note)
     else:
-        note = client.get_note(note_id, fields=COMMON_NOTE_FIELDS)
+        note = await run_blocking(client.get_note, note_id, fields=COMMON_NOTE_FIELDS)
 
     if get_config().has_notebook_allowlist:
         parent_id = getattr(note, 'parent_id', '')
         validate_notebook_access(parent_id, allowlist_entries=get_config().notebook_allowlist)
 
-    return note_view.render_note(
+    return await run_blocking(
+        note_view.render_note,
         note,
         note_id=note_id,
         section=section,
@@ -249,9 +266,8 @@ async def get_note_resources(
     client = get_joplin_client()
 
     if get_config().has_notebook_allowlist:
-        parent_id = getattr(
-            client.get_note(note_id, fields="id,parent_id"), "parent_id", ""
-        )
+        note = await run_blocking(client.get_note, note_id, fields=NOTE_PARENT_FIELDS)
+        parent_id = getattr(note, "parent_id", "")
         validate_notebook_access(
             parent_id, allowlist_entries=get_config().notebook_allowlist
         )
@@ -259,9 +275,10 @@ async def get_note_resources(
     resources: List[Any] = []
     page = 1
     while True:
-        page_result = client.get_resources(
+        page_result = await run_blocking(
+            client.get_resources,
             note_id=note_id,
-            fields="id,title,mime,ocr_text,ocr_status",
+            fields=_RESOURCE_OCR_FIELDS,
             page=page,
             limit=100,
         )
@@ -351,7 +368,7 @@ async def get_links(
     client = get_joplin_client()
 
     # Get the note
-    note = client.get_note(note_id, fields=COMMON_NOTE_FIELDS)
+    note = await run_blocking(client.get_note, note_id, fields=_LINK_SCAN_FIELDS)
 
     # Allowlist validation: ensure source note is in an accessible notebook
     if get_config().has_notebook_allowlist:
@@ -376,7 +393,9 @@ async def get_links(
 
                 # Try to get the target note title
                 try:
-                    target_note = client.get_note(target_note_id, fields="id,title,parent_id")
+                    target_note = await run_blocking(
+                        client.get_note, target_note_id, fields=_LINK_TARGET_FIELDS
+                    )
                     target_title = getattr(target_note, "title", "Unknown Note")
                     target_exists = True
                 except Exception:
@@ -416,8 +435,8 @@ async def get_links(
 
         # Search for notes containing this note's ID in link format
         search_query = f":/{note_id}"
-        backlink_results = client.search_all(
-            query=search_query, fields=COMMON_NOTE_FIELDS
+        backlink_results = await run_blocking(
+            client.search_all, query=search_query, fields=_LINK_SCAN_FIELDS
         )
         backlink_notes = process_search_results(backlink_results)
 
@@ -594,7 +613,7 @@ async def create_note(
     todo_due_ms = timestamp_converter(todo_due, "todo_due")
 
     # Use helper function to get notebook ID
-    parent_id = get_notebook_id_by_name(notebook_name)
+    parent_id = await run_blocking(get_notebook_id_by_name, notebook_name)
 
     # Allowlist validation: ensure target notebook is accessible
     if get_config().has_notebook_allowlist:
@@ -611,7 +630,7 @@ async def create_note(
     if todo_due_ms is not None:
         note_kwargs["todo_due"] = todo_due_ms
 
-    note = client.add_note(**note_kwargs)
+    note = await run_blocking(client.add_note, **note_kwargs)
     return format_creation_success(ItemType.note, title, str(note))
 
 
@@ -670,7 +689,9 @@ async def update_note(
     if body is not None:
         update_data["body"] = body
     if notebook_name is not None:
-        update_data["parent_id"] = get_notebook_id_by_name(notebook_name)
+        update_data["parent_id"] = await run_blocking(
+            get_notebook_id_by_name, notebook_name
+        )
     if is_todo is not None:
         update_data["is_todo"] = 1 if is_todo else 0
     if todo_completed is not None:
@@ -685,7 +706,7 @@ async def update_note(
 
     # Allowlist validation: source must be accessible, and if moving, destination too.
     if get_config().has_notebook_allowlist:
-        note = client.get_note(note_id, fields="id,parent_id")
+        note = await run_blocking(client.get_note, note_id, fields=NOTE_PARENT_FIELDS)
         parent_id_check = getattr(note, 'parent_id', '')
         validate_notebook_access(parent_id_check, allowlist_entries=get_config().notebook_allowlist)
         if "parent_id" in update_data:
@@ -694,7 +715,7 @@ async def update_note(
                 allowlist_entries=get_config().notebook_allowlist,
             )
 
-    note_view.modify_note(client, note_id, **update_data)
+    await run_blocking(note_view.modify_note, client, note_id, **update_data)
 
     return format_update_success(ItemType.note, note_id)
 
@@ -769,7 +790,7 @@ async def edit_note(
         )
 
     client = get_joplin_client()
-    note = client.get_note(note_id, fields=COMMON_NOTE_FIELDS)
+    note = await run_blocking(client.get_note, note_id, fields=COMMON_NOTE_FIELDS)
 
     # Allowlist validation: ensure note is in an accessible notebook
     if get_config().has_notebook_allowlist:
@@ -804,7 +825,7 @@ async def edit_note(
             new_body = body.replace(old_string, new_string, 1)
             replacements = 1
 
-        note_view.modify_note(client, note_id, body=new_body)
+        await run_blocking(note_view.modify_note, client, note_id, body=new_body)
 
         if new_string == "":
             return f"EDIT_NOTE: Deleted {replacements} occurrence(s) of the specified text."
@@ -819,7 +840,7 @@ async def edit_note(
             new_body = new_string + body
             action = "Prepended"
 
-        note_view.modify_note(client, note_id, body=new_body)
+        await run_blocking(note_view.modify_note, client, note_id, body=new_body)
 
         return f"EDIT_NOTE: {action} {len(new_string)} characters."
 
@@ -849,12 +870,12 @@ async def delete_note(
     # GET first so a missing note ID 404s instead of silent-succeeding through
     # Joplin's idempotent DELETE (same shape as delete_notebook). The fetch
     # doubles as the allowlist check below when applicable.
-    note = client.get_note(note_id, fields="id,parent_id")
+    note = await run_blocking(client.get_note, note_id, fields=NOTE_PARENT_FIELDS)
     if get_config().has_notebook_allowlist:
         parent_id = getattr(note, 'parent_id', '')
         validate_notebook_access(parent_id, allowlist_entries=get_config().notebook_allowlist)
 
-    note_view.delete_note(client, note_id)
+    await run_blocking(note_view.delete_note, client, note_id)
 
     return format_delete_success(ItemType.note, note_id)
 
@@ -940,8 +961,9 @@ async def find_notes(
         if search_filters:
             # Use search with filters
             search_query = " ".join(search_filters)
-            results = client.search_all(
-                query=search_query, fields=COMMON_NOTE_FIELDS, **sort_kwargs
+            results = await run_blocking(
+                client.search_all,
+                query=search_query, fields=_listing_fields(), **sort_kwargs
             )
             notes = process_search_results(results)
         else:
@@ -949,8 +971,8 @@ async def find_notes(
             get_all_kwargs = dict(sort_kwargs)
             if trash:
                 get_all_kwargs["include_deleted"] = 1
-            results = client.get_all_notes(
-                fields=COMMON_NOTE_FIELDS, **get_all_kwargs,
+            results = await run_blocking(
+                client.get_all_notes, fields=_listing_fields(), **get_all_kwargs,
             )
             notes = process_search_results(results)
     else:
@@ -967,8 +989,9 @@ async def find_notes(
             text_sort_kwargs = resolve_sort_params(order_by, order_dir)
 
         # Use search_all for full pagination support
-        results = client.search_all(
-            query=search_query, fields=COMMON_NOTE_FIELDS, **text_sort_kwargs
+        results = await run_blocking(
+            client.search_all,
+            query=search_query, fields=_listing_fields(), **text_sort_kwargs
         )
         notes = process_search_results(results)
 
@@ -1008,7 +1031,8 @@ async def find_notes(
             resolve_sort_params(order_by, order_dir) if order_by is not None else {}
         )
 
-    return format_search_results_with_pagination(
+    return await run_blocking(
+        format_search_results_with_pagination,
         search_description,
         paginated_notes,
         total_count,
@@ -1085,7 +1109,7 @@ async def find_in_note(
         raise ValueError(f"Invalid regular expression: {exc}")
 
     client = get_joplin_client()
-    note = client.get_note(note_id, fields=COMMON_NOTE_FIELDS)
+    note = await run_blocking(client.get_note, note_id, fields=COMMON_NOTE_FIELDS)
 
     # Allowlist validation: ensure note is in an accessible notebook
     if get_config().has_notebook_allowlist:
@@ -1100,7 +1124,7 @@ async def find_in_note(
     notebook_path: Optional[str] = None
     if parent_id:
         try:
-            nb_map = get_notebook_map_cached()
+            nb_map = await run_blocking(get_notebook_map_cached)
             notebook_path = _compute_notebook_path(parent_id, nb_map)
         except Exception:
             notebook_path = None
@@ -1309,8 +1333,8 @@ async def find_notes_with_tag(
 
     # Use search_all API with tag constraint for full pagination support
     client = get_joplin_client()
-    results = client.search_all(
-        query=search_query, fields=COMMON_NOTE_FIELDS, **sort_kwargs
+    results = await run_blocking(
+        client.search_all, query=search_query, fields=_listing_fields(), **sort_kwargs
     )
     notes = process_search_results(results)
 
@@ -1330,7 +1354,8 @@ async def find_notes_with_tag(
         criteria_str = format_search_criteria(base_criteria, task, completed)
         return format_no_results_with_pagination("note", criteria_str, offset, limit)
 
-    return format_search_results_with_pagination(
+    return await run_blocking(
+        format_search_results_with_pagination,
         f"tag search: {search_query}",
         paginated_notes,
         total_count,
@@ -1401,7 +1426,7 @@ async def find_notes_in_notebook(
     sort_kwargs = resolve_sort_params(order_by, order_dir)
 
     # Resolve notebook name/path to ID (ensures exact match)
-    notebook_id = get_notebook_id_by_name(notebook_name)
+    notebook_id = await run_blocking(get_notebook_id_by_name, notebook_name)
 
     # Allowlist validation: ensure notebook is accessible
     if get_config().has_notebook_allowlist:
@@ -1409,8 +1434,9 @@ async def find_notes_in_notebook(
 
     # Fetch notes by notebook_id for precision (search API can't distinguish same-named notebooks)
     client = get_joplin_client()
-    results = client.get_all_notes(
-        notebook_id=notebook_id, fields=COMMON_NOTE_FIELDS, **sort_kwargs
+    results = await run_blocking(
+        client.get_all_notes,
+        notebook_id=notebook_id, fields=_listing_fields(), **sort_kwargs
     )
     notes = process_search_results(results)
 
@@ -1432,7 +1458,8 @@ async def find_notes_in_notebook(
         criteria_str = format_search_criteria(base_criteria, task, completed)
         return format_no_results_with_pagination("note", criteria_str, offset, limit)
 
-    return format_search_results_with_pagination(
+    return await run_blocking(
+        format_search_results_with_pagination,
         f"notebook search: {search_query}",
         paginated_notes,
         total_count,
@@ -1478,23 +1505,33 @@ async def get_all_notes(
     sort_kwargs = resolve_sort_params(order_by, order_dir)
 
     client = get_joplin_client()
-    results = client.get_all_notes(fields=COMMON_NOTE_FIELDS, **sort_kwargs)
-    notes = process_search_results(results)
-
-    # Allowlist filtering: only include notes in accessible notebooks
     if get_config().has_notebook_allowlist:
-        notes = [n for n in notes if is_notebook_accessible(
-            getattr(n, 'parent_id', ''),
-            allowlist_entries=get_config().notebook_allowlist
-        )]
-
-    # Apply limit (using consistent pattern but keeping simple offset=0)
-    notes = notes[:limit]
+        # The allowlist is enforced client-side, so the first ``limit``
+        # accessible notes can sit anywhere in the listing: walk every page.
+        results = await run_blocking(
+            client.get_all_notes, fields=COMMON_NOTE_FIELDS, **sort_kwargs
+        )
+        allowlist_entries = get_config().notebook_allowlist
+        # Stop checking access once ``limit`` accessible notes are found
+        notes = list(islice(
+            (n for n in process_search_results(results) if is_notebook_accessible(
+                getattr(n, 'parent_id', ''), allowlist_entries=allowlist_entries
+            )),
+            limit,
+        ))
+    else:
+        # No post-filter: the first server page of ``limit`` notes is the
+        # answer (LimitType caps limit at Joplin's max page size).
+        results = await run_blocking(
+            client.get_notes, fields=COMMON_NOTE_FIELDS, limit=limit, **sort_kwargs
+        )
+        notes = process_search_results(results)[:limit]
 
     if not notes:
         return format_no_results_message("note")
 
-    return format_search_results_with_pagination(
+    return await run_blocking(
+        format_search_results_with_pagination,
         "all notes", notes, len(notes), limit, 0, "search_results",
         order_by=sort_kwargs.get("order_by"),
         order_dir=sort_kwargs.get("order_dir"),
@@ -1,16 +1,22 @@
 """Tag tools for Joplin MCP."""
-from typing import Annotated, Dict, List, Tuple, Union
+from functools import partial
+from typing import Annotated, Any, Callable, Dict, List, Tuple, Union
 
 from pydantic import Field
 
 from joplin_mcp.config import get_config
 from joplin_mcp.fastmcp_server import (
     COMMON_NOTE_FIELDS,
+    NOTE_PARENT_FIELDS,
     ItemType,
     JoplinIdType,
     RequiredStringType,
     _sanitise_error,
+    clear_tag_cache,
+    count_tag_notes_concurrently,
     create_tool,
+    fetch_notes_concurrently,
+    forget_note_tags,
     format_creation_success,
     format_delete_success,
     format_item_list,
@@ -18,9 +24,12 @@ from joplin_mcp.fastmcp_server import (
     format_relation_success,
     format_tag_list_with_counts,
     format_update_success,
+    get_all_tags_cached,
     get_joplin_client,
+    get_note_tags_cached,
     get_tag_id_by_name,
-    process_search_results,
+    run_blocking,
+    run_blocking_many,
 )
 from joplin_mcp.notebook_utils import AllowlistDeniedError, validate_notebook_access
 
@@ -34,7 +43,7 @@ def _resolve_tag_ids(client, tag_names: List[str]) -> Dict[str, str]:
     Raises ValueError if any name is missing or ambiguous (multiple Joplin tags
     with the same case-insensitive title), matching get_tag_id_by_name parity.
     """
-    all_tags = client.get_all_tags(fields="id,title")
+    all_tags = get_all_tags_cached(client)
     by_lower: Dict[str, List[str]] = {}
     for t in all_tags:
         tid = getattr(t, "id", None)
@@ -70,6 +79,74 @@ def _resolve_tag_ids(client, tag_names: List[str]) -> Dict[str, str]:
     return resolved
 
 
+async def _denied_notes(client, note_ids: List[str]) -> Dict[str, str]:
+    """Map each note outside the notebook allowlist to its denial message.
+
+    Parents are fetched concurrently; a note whose fetch fails maps to that
+    error instead, so one bad ID doesn't fail the rest. Returns {} when no
+    allowlist is set.
+    """
+    denied: Dict[str, str] = {}
+    if get_config().has_notebook_allowlist:
+        parent_notes = await fetch_notes_concurrently(
+            client, note_ids, NOTE_PARENT_FIELDS
+        )
+        for nid, note in zip(note_ids, parent_notes):
+            if isinstance(note, BaseException):
+                denied[nid] = _sanitise_error(str(note))
+                continue
+            try:
+                validate_notebook_access(
+                    getattr(note, "parent_id", ""),
+                    allowlist_entries=get_config().notebook_allowlist,
+                )
+            except AllowlistDeniedError as e:
+                denied[nid] = str(e)
+    return denied
+
+
+async def _run_tag_ops(
+    client,
+    note_ids: List[str],
+    tag_names: List[str],
+    tag_map: Dict[str, str],
+    make_call: Callable[[str, str], Callable[[], Any]],
+) -> List[Tuple[str, str, bool, str]]:
+    """Run the (note, tag) cartesian product of a bulk tag op concurrently.
+
+    Notes are checked against the allowlist first (a denied note fails all of
+    its ops); the remaining ops run via run_blocking_many.
+    ``make_call(tag_id, note_id)`` returns the blocking call for one op.
+    Report rows keep input order: notes as given, tags within each note.
+    """
+    denied = await _denied_notes(client, note_ids)
+
+    outcomes = iter(
+        await run_blocking_many(
+            [
+                make_call(tag_map[tname], nid)
+                for nid in note_ids
+                if nid not in denied
+                for tname in tag_names
+            ]
+        )
+    )
+    forget_note_tags(note_ids)
+
+    results: List[Tuple[str, str, bool, str]] = []
+    for nid in note_ids:
+        for tname in tag_names:
+            if nid in denied:
+                results.append((nid, tname, False, denied[nid]))
+                continue
+            outcome = next(outcomes)
+            if isinstance(outcome, BaseException):
+                results.append((nid, tname, False, _sanitise_error(str(outcome))))
+            else:
+                results.append((nid, tname, True, ""))
+    return results
+
+
 def _sanitize_report_field(value: str) -> str:
     """Normalise whitespace and replace double quotes for the one-line report format."""
     return " ".join(value.split()).replace('"', "'")
@@ -119,9 +196,9 @@ async def list_tags() -> str:
         str: Formatted list of all tags including title, unique ID, number of notes tagged with it, and creation date.
     """
     client = get_joplin_client()
-    fields_list = "id,title,created_time,updated_time"
-    tags = client.get_all_tags(fields=fields_list)
-    return format_tag_list_with_counts(tags, client)
+    tags = await run_blocking(get_all_tags_cached, client)
+    note_counts = await count_tag_notes_concurrently(client, tags)
+    return format_tag_list_with_counts(tags, client, note_counts=note_counts)
 
 
 @create_tool("create_tag", "Create tag")
@@ -140,7 +217,8 @@ async def create_tag(
         - create_tag("important") - Create a new tag named "important"
     """
     client = get_joplin_client()
-    tag = client.add_tag(title=title)
+    tag = await run_blocking(client.add_tag, title=title)
+    clear_tag_cache()
     return format_creation_success(ItemType.tag, title, str(tag))
 
 
@@ -157,7 +235,8 @@ async def update_tag(
         str: Success message confirming the tag was updated.
     """
     client = get_joplin_client()
-    client.modify_tag(tag_id, title=title)
+    await run_blocking(client.modify_tag, tag_id, title=title)
+    clear_tag_cache()
     return format_update_success(ItemType.tag, tag_id)
 
 
@@ -181,35 +260,48 @@ async def delete_tag(
     Warning: This action is permanent and cannot be undone.
     """
     client = get_joplin_client()
-    client.delete_tag(tag_id)
+    await run_blocking(client.delete_tag, tag_id)
+    clear_tag_cache()
     return format_delete_success(ItemType.tag, tag_id)
 
 
 @create_tool("get_tags_by_note", "Get tags by note")
 async def get_tags_by_note(
-    note_id: Annotated[JoplinIdType, Field(description="Note ID to get tags from")],
+    note_id: Annotated[
+        Union[JoplinIdType, List[JoplinIdType]],
+        Field(description="Note ID, or list of note IDs"),
+    ],
 ) -> str:
-    """Get all tags for a specific note.
+    """Get all tags for one or more notes.
 
-    Retrieves all tags that are currently applied to a specific note.
+    Retrieves all tags that are currently applied to a specific note. Pass a
+    list of note IDs to look up several notes in one call; the output then has
+    one NOTE_ID block per note, in the order given, and a note that can't be
+    read (e.g. outside the notebook allowlist) gets an ERROR line instead of
+    failing the whole call.
 
     Returns:
         str: Formatted list of tags applied to the note with title, ID, and creation date.
+
+    Examples:
+        - get_tags_by_note("abc...") - Tags on one note
+        - get_tags_by_note(["abc...", "def..."]) - Tags on two notes
     """
 
     client = get_joplin_client()
 
+    if not isinstance(note_id, str):
+        return await _get_tags_by_notes(client, list(note_id))
+
     # Allowlist validation: ensure note is in an accessible notebook
     if get_config().has_notebook_allowlist:
-        note = client.get_note(note_id, fields="id,parent_id")
+        note = await run_blocking(client.get_note, note_id, fields=NOTE_PARENT_FIELDS)
         parent_id = getattr(note, "parent_id", "")
         validate_notebook_access(
             parent_id, allowlist_entries=get_config().notebook_allowlist
         )
 
-    fields_list = "id,title,created_time,updated_time"
-    tags_result = client.get_tags(note_id=note_id, fields=fields_list)
-    tags = process_search_results(tags_result)
+    tags = await run_blocking(get_note_tags_cached, client, note_id)
 
     if not tags:
         return format_no_results_message("tag", f"for note: {note_id}")
@@ -217,6 +309,38 @@ async def get_tags_by_note(
     return format_item_list(tags, ItemType.tag)
 
 
+async def _get_tags_by_notes(client, note_ids: List[str]) -> str:
+    """List form of get_tags_by_note: fetch every note's tags concurrently."""
+    if not note_ids:
+        raise ValueError("note_id list must not be empty")
+
+    denied = await _denied_notes(client, note_ids)
+    outcomes = iter(
+        await run_blocking_many(
+            [
+                partial(get_note_tags_cached, client, nid)
+                for nid in note_ids
+                if nid not in denied
+            ]
+        )
+    )
+
+    blocks: List[str] = []
+    for nid in note_ids:
+        if nid in denied:
+            body = f"STATUS: ERROR\nERROR: {denied[nid]}"
+        else:
+            tags = next(outcomes)
+            if isinstance(tags, BaseException):
+                body = f"STATUS: ERROR\nERROR: {_sanitise_error(str(tags))}"
+            elif not tags:
+                body = format_no_results_message("tag", f"for note: {nid}")
+            else:
+                body = format_item_list(tags, ItemType.tag)
+        blocks.append(f"NOTE_ID: {nid}\n{body}")
+    return "\n\n".join(blocks)
+
+
 # === TAG-NOTE RELATIONSHIP OPERATIONS ===
 
 
@@ -258,31 +382,16 @@ async def tag_note(
 
     client = get_joplin_client()
 
-    # Resolve all tags up front, then loop the cartesian product.
-    tag_map = _resolve_tag_ids(client, tag_names)
-
-    results: List[Tuple[str, str, bool, str]] = []
-    for nid in note_ids:
-        # Allowlist validation per note in bulk path
-        if get_config().has_notebook_allowlist:
-            try:
-                note = client.get_note(nid, fields="id,parent_id")
-                parent_id = getattr(note, "parent_id", "")
-                validate_notebook_access(
-                    parent_id, allowlist_entries=get_config().notebook_allowlist
-                )
-            except AllowlistDeniedError as e:
-                for tname in tag_names:
-                    results.append((nid, tname, False, str(e)))
-                continue
-
-        for tname in tag_names:
-            try:
-                client.add_tag_to_note(tag_map[tname], nid)
-                results.append((nid, tname, True, ""))
-            except Exception as e:
-                results.append((nid, tname, False, _sanitise_error(str(e))))
+    # Resolve all tags up front, then run the cartesian product.
+    tag_map = await run_blocking(_resolve_tag_ids, client, tag_names)
 
+    results = await _run_tag_ops(
+        client,
+        note_ids,
+        tag_names,
+        tag_map,
+        lambda tag_id, nid: partial(client.add_tag_to_note, tag_id, nid),
+    )
     return _format_tag_op_report("TAG_NOTE", results)
 
 
@@ -324,29 +433,14 @@ async def untag_note(
 
     client = get_joplin_client()
 
-    # Resolve all tags up front, then loop the cartesian product.
-    tag_map = _resolve_tag_ids(client, tag_names)
-
-    results: List[Tuple[str, str, bool, str]] = []
-    for nid in note_ids:
-        # Allowlist validation per note in bulk path
-        if get_config().has_notebook_allowlist:
-            try:
-                note = client.get_note(nid, fields="id,parent_id")
-                parent_id = getattr(note, "parent_id", "")
-                validate_notebook_access(
-                    parent_id, allowlist_entries=get_config().notebook_allowlist
-                )
-            except AllowlistDeniedError as e:
-                for tname in tag_names:
-                    results.append((nid, tname, False, str(e)))
-                continue
-
-        for tname in tag_names:
-            try:
-                client.delete(f"/tags/{tag_map[tname]}/notes/{nid}")
-                results.append((nid, tname, True, ""))
-            except Exception as e:
-                results.append((nid, tname, False, _sanitise_error(str(e))))
+    # Resolve all tags up front, then run the cartesian product.
+    tag_map = await run_blocking(_resolve_tag_ids, client, tag_names)
 
+    results = await _run_tag_ops(
+        client,
+        note_ids,
+        tag_names,
+        tag_map,
+        lambda tag_id, nid: partial(client.delete, f"/tags/{tag_id}/notes/{nid}"),
+    )
     return _format_tag_op_report("UNTAG_NOTE", results)
@@ -12,6 +12,7 @@ from joplin_mcp.fastmcp_server import (
     create_tool,
     format_restore_success,
     get_joplin_client,
+    run_blocking,
     validate_joplin_id,
 )
 from joplin_mcp.notebook_utils import notebook_resolver
@@ -54,10 +55,10 @@ async def restore_from_trash(
 
     if item_type == "note":
         client = get_joplin_client()
-        note_view.modify_note(client, item_id, deleted_time=0)
+        await run_blocking(note_view.modify_note, client, item_id, deleted_time=0)
         return format_restore_success(ItemType.note, item_id)
     elif item_type == "notebook":
-        notebook_resolver.modify_notebook(item_id, deleted_time=0)
+        await run_blocking(notebook_resolver.modify_notebook, item_id, deleted_time=0)
         return format_restore_success(ItemType.notebook, item_id)
     else:
         raise ValueError(
@@ -345,6 +345,16 @@ def _reset_notebook_resolver_cache():
     notebook_resolver.invalidate()
 
 
+@pytest.fixture(autouse=True)
+def _reset_tag_cache():
+    """Reset the module-level tag listing cache between tests."""
+    from joplin_mcp.fastmcp_server import clear_tag_cache
+
+    clear_tag_cache()
+    yield
+    clear_tag_cache()
+
+
 # === ALLOWLIST TEST HELPERS ===
 # Shared by test_pathspec_patterns.py, test_notebook_allowlist_access.py,
 # and test_integration_allowlist.py.
@@ -495,6 +495,39 @@ class TestConfigPriority:
             if os.path.exists(config_file):
                 os.unlink(config_file)
 
+    def test_import_discovery_prefers_explicit_path(self, tmp_path):
+        """JOPLIN_MCP_CONFIG is loaded directly, without probing defaults."""
+        from joplin_mcp.config import _auto_discover_with_logging
+
+        config_file = tmp_path / "explicit.json"
+        config_file.write_text(json.dumps({"host": "explicit-host", "token": "t"}))
+
+        with patch.dict(os.environ, {"JOPLIN_MCP_CONFIG": str(config_file)}), patch.object(
+            JoplinMCPConfig, "get_default_config_paths"
+        ) as mock_defaults:
+            config = _auto_discover_with_logging()
+
+        assert config.host == "explicit-host"
+        mock_defaults.assert_not_called()
+
+    def test_import_discovery_loads_first_default_path(self, tmp_path):
+        """Without an explicit path the first existing default is loaded."""
+        from joplin_mcp.config import _auto_discover_with_logging
+
+        config_file = tmp_path / "joplin-mcp.json"
+        config_file.write_text(json.dumps({"host": "default-host", "token": "t"}))
+
+        env = {k: v for k, v in os.environ.items()
+               if k not in ("JOPLIN_MCP_CONFIG", "JOPLIN_CONFIG_FILE")}
+        with patch.dict(os.environ, env, clear=True), patch.object(
+            JoplinMCPConfig,
+            "get_default_config_paths",
+            return_value=[tmp_path / "missing.json", config_file],
+        ):
+            config = _auto_discover_with_logging()
+
+        assert config.host == "default-host"
+
 
 class TestConfigValidationAndEdgeCases:
     """Test additional validation scenarios and edge cases."""
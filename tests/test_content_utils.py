@@ -706,6 +706,14 @@ class TestFormatTimestamp:
         # Very large timestamp that causes overflow
         assert format_timestamp(99999999999999999) is None
 
+    def test_list_format_matches_strftime(self):
+        """The list-row format is rendered exactly as strftime would."""
+        dt = datetime.datetime(2024, 1, 5, 7, 3, 9)
+        assert format_timestamp(dt, "%Y-%m-%d %H:%M") == dt.strftime("%Y-%m-%d %H:%M")
+        ts = 1705315845000
+        expected = datetime.datetime.fromtimestamp(ts / 1000).strftime("%Y-%m-%d %H:%M")
+        assert format_timestamp(ts, "%Y-%m-%d %H:%M") == expected
+
 
 # === Tests for calculate_content_stats ===
 
@@ -748,6 +748,199 @@ def test_get_notebook_cache_ttl_from_env():
     del os.environ["JOPLIN_MCP_NOTEBOOK_CACHE_TTL"]
 
 
+# === Tests for run_blocking and ping_joplin ===
+
+
+@pytest.mark.asyncio
+async def test_run_blocking_runs_off_the_event_loop_thread():
+    """run_blocking executes the call on a worker thread and returns its result."""
+    import threading
+
+    from joplin_mcp.fastmcp_server import run_blocking
+
+    loop_thread = threading.get_ident()
+
+    def blocking(a, b=0):
+        return threading.get_ident(), a + b
+
+    worker_thread, total = await run_blocking(blocking, 1, b=2)
+
+    assert total == 3
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_ping_joplin_reuses_recent_success_but_not_failure(monkeypatch):
+    """A success is cached briefly; a failure always re-pings."""
+    from unittest.mock import MagicMock, patch
+
+    import joplin_mcp.fastmcp_server as server
+
+    monkeypatch.setattr(server, "_last_ping_ok_at", None)
+    mock_client = MagicMock()
+    mock_client.ping.side_effect = [Exception("down"), "JoplinClipperServer"]
+    fn = server.ping_joplin.fn
+
+    with patch("joplin_mcp.fastmcp_server.get_joplin_client", return_value=mock_client):
+        assert "STATUS: FAILED" in await fn()
+        assert "STATUS: SUCCESS" in await fn()
+        assert "STATUS: SUCCESS" in await fn()
+
+    assert mock_client.ping.call_count == 2
+
+
+# === Tests for the Joplin client and HTTP adapter ===
+
+
+def test_joppy_session_pool_sized_for_worker_threads():
+    """joppy's shared session keeps enough connections for run_blocking workers."""
+    import joppy.client_api as joppy_client_api
+
+    from joplin_mcp.fastmcp_server import _HTTP_POOL_MAXSIZE
+
+    adapter = joppy_client_api.SESSION.get_adapter("http://localhost:41184")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == _HTTP_POOL_MAXSIZE
+
+
+def test_get_joplin_client_reused_until_config_changes(override_config):
+    """The client is shared across calls and rebuilt when token/url change."""
+    from joplin_mcp.fastmcp_server import get_joplin_client
+
+    with override_config(token="token_one"):
+        first = get_joplin_client()
+        assert get_joplin_client() is first
+
+    with override_config(token="token_two"):
+        second = get_joplin_client()
+        assert second is not first
+        assert second.token == "token_two"
+
+
+def test_joppy_adapter_applies_configured_timeout(override_config):
+    """joppy passes no timeout; the adapter fills in config.timeout."""
+    from unittest.mock import MagicMock, patch
+
+    from requests.adapters import HTTPAdapter
+
+    from joplin_mcp.fastmcp_server import _JoplinHTTPAdapter
+
+    adapter = _JoplinHTTPAdapter()
+    with override_config(timeout=7), patch.object(
+        HTTPAdapter, "send", return_value=MagicMock()
+    ) as mock_send:
+        adapter.send(MagicMock())
+
+    assert mock_send.call_args.kwargs["timeout"] == 7
+
+
+def test_joppy_adapter_breaker_fails_fast_after_repeated_connection_errors():
+    """Consecutive connection failures open the breaker; the cooldown skips the network."""
+    from unittest.mock import MagicMock, patch
+
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    from joplin_mcp.fastmcp_server import _BREAKER_THRESHOLD, _JoplinHTTPAdapter
+
+    adapter = _JoplinHTTPAdapter()
+    with patch.object(
+        HTTPAdapter, "send", side_effect=requests.ConnectionError("refused")
+    ) as mock_send:
+        for _ in range(_BREAKER_THRESHOLD):
+            with pytest.raises(requests.ConnectionError, match="refused"):
+                adapter.send(MagicMock())
+        with pytest.raises(requests.ConnectionError, match="Joplin unreachable"):
+            adapter.send(MagicMock())
+
+    assert mock_send.call_count == _BREAKER_THRESHOLD
+
+
+def test_warm_joplin_connection_pings_and_swallows_failures():
+    """Startup warm-up pings Joplin but never raises into main()."""
+    from unittest.mock import MagicMock, patch
+
+    from joplin_mcp.fastmcp_server import _warm_joplin_connection
+
+    mock_client = MagicMock()
+    with patch(
+        "joplin_mcp.fastmcp_server.get_joplin_client", return_value=mock_client
+    ), patch("joplin_mcp.fastmcp_server.notebook_resolver") as mock_resolver:
+        _warm_joplin_connection()
+        mock_client.ping.assert_called_once()
+        mock_resolver.get_map.assert_called_once()
+
+        mock_client.ping.side_effect = Exception("connection refused")
+        _warm_joplin_connection()
+        mock_resolver.get_map.assert_called_once()
+
+
+# === Tests for the tag cache ===
+
+
+def test_note_tags_not_stored_after_racing_eviction():
+    """Tags fetched while the note's entry was evicted are not cached."""
+    from unittest.mock import MagicMock
+
+    from joplin_mcp.fastmcp_server import (
+        clear_tag_cache,
+        forget_note_tags,
+        get_note_tags_cached,
+    )
+
+    clear_tag_cache()
+    mock_client = MagicMock()
+
+    def get_tags(note_id, fields):
+        forget_note_tags([note_id])  # a tag_note lands mid-fetch
+        return [MagicMock(title="stale")]
+
+    mock_client.get_tags.side_effect = get_tags
+    get_note_tags_cached(mock_client, "note1")
+
+    mock_client.get_tags.side_effect = None
+    mock_client.get_tags.return_value = [MagicMock(title="fresh")]
+    assert get_note_tags_cached(mock_client, "note1")[0].title == "fresh"
+    assert get_note_tags_cached(mock_client, "note1")[0].title == "fresh"
+    assert mock_client.get_tags.call_count == 2
+    clear_tag_cache()
+
+
+def test_clear_tag_cache_does_not_wait_for_running_refresh():
+    """Clearing returns at once during a refresh, and the raced listing isn't kept."""
+    import threading
+    from unittest.mock import MagicMock
+
+    from joplin_mcp.fastmcp_server import clear_tag_cache, get_all_tags_cached
+
+    clear_tag_cache()
+    started, release = threading.Event(), threading.Event()
+
+    def slow_listing(fields):
+        started.set()
+        release.wait(5)
+        return [MagicMock(title="stale")]
+
+    mock_client = MagicMock()
+    mock_client.get_all_tags.side_effect = slow_listing
+    refresh = threading.Thread(target=get_all_tags_cached, args=(mock_client,))
+    refresh.start()
+    assert started.wait(5)
+
+    clearer = threading.Thread(target=clear_tag_cache)
+    clearer.start()
+    clearer.join(1)
+    cleared_while_blocked = not clearer.is_alive()
+    release.set()
+    refresh.join(5)
+    clearer.join(5)
+
+    assert cleared_while_blocked
+    mock_client.get_all_tags.side_effect = None
+    mock_client.get_all_tags.return_value = [MagicMock(title="fresh")]
+    assert get_all_tags_cached(mock_client)[0].title == "fresh"
+    clear_tag_cache()
+
+
 # === Tests for register_tools (config-driven tool gating) ===
 
 
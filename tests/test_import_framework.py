@@ -1,13 +1,18 @@
 """Tests for the import framework core components."""
 
+import asyncio
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
+import requests
 
 from joplin_mcp.imports import JoplinImportEngine
 from joplin_mcp.imports.importers.base import BaseImporter, ImportValidationError
 from joplin_mcp.imports import ImportedNote, ImportOptions, ImportResult
+from joplin_mcp.imports.tools import detect_directory_format, detect_file_format
+from joplin_mcp.imports.types import SKIP_SAMPLE_LIMIT
 
 
 class TestImportedNote:
@@ -68,6 +73,22 @@ class TestImportedNote:
         assert note.attachments == ["file1.pdf"]
         assert note.metadata == {"source": "test"}
 
+    def test_link_record_fields(self, tmp_path):
+        """Origin metadata is flattened for link rewriting; nothing for plain notes."""
+        source = tmp_path / "notes" / "a.md"
+        note = ImportedNote(
+            title="A",
+            body="x",
+            metadata={"joplin_id": "abc", "source_file": str(source), "other": 1},
+        )
+
+        assert note.link_record_fields() == {
+            "original_id": "abc",
+            "source_file": str(source.resolve()),
+            "source_dir": str(source.parent.resolve()),
+        }
+        assert ImportedNote(title="B", body="y").link_record_fields() == {}
+
 
 class TestImportResult:
     """Test the ImportResult data model."""
@@ -113,6 +134,25 @@ class TestImportResult:
         assert len(result.skipped_items_list) == 1
         assert "Note 1: Already exists" in result.skipped_items_list
 
+    def test_skip_reasons_are_sampled(self):
+        """Every skip is counted, but only the first reasons are kept."""
+        result = ImportResult()
+        for i in range(SKIP_SAMPLE_LIMIT + 5):
+            result.add_skip(f"Note {i}", "Already exists")
+
+        assert result.skipped_items == SKIP_SAMPLE_LIMIT + 5
+        assert len(result.skipped_items_list) == SKIP_SAMPLE_LIMIT
+
+    def test_created_names_recorded_once(self):
+        """Repeated notebook/tag creations are listed once, in order."""
+        result = ImportResult()
+        for name in ["b", "a", "b"]:
+            result.add_created_notebook(name)
+            result.add_created_tag(name)
+
+        assert result.created_notebooks == ["b", "a"]
+        assert result.created_tags == ["b", "a"]
+
     def test_success_rate_calculation(self):
         """Test success rate calculation."""
         result = ImportResult()
@@ -240,6 +280,35 @@ class TestBaseImporter:
         with pytest.raises(ImportValidationError, match="Source path does not exist"):
             importer.validate_source_exists("nonexistent_file.txt")
 
+    @pytest.mark.asyncio
+    async def test_parse_files_concurrently_keeps_order(self):
+        """Results follow input order and parser failures are returned, not raised."""
+        importer = MockImporter()
+        files = [Path(f"note{i}.md") for i in range(20)]
+
+        def parse_file(path):
+            if path.name == "note3.md":
+                raise ValueError("bad file")
+            return path.stem
+
+        results = await importer.parse_files_concurrently(files, parse_file)
+
+        assert isinstance(results[3], ValueError)
+        assert results[:3] + results[4:] == [
+            f"note{i}" for i in range(20) if i != 3
+        ]
+        assert await importer.parse_files_concurrently([], parse_file) == []
+
+
+def _page(*items, has_more=False):
+    """Build a joppy-style paginated response."""
+    return Mock(items=list(items), has_more=has_more)
+
+
+def _http_error(status):
+    """A requests.HTTPError as joppy raises it for the given status."""
+    return requests.HTTPError(response=Mock(status_code=status))
+
 
 class TestJoplinImportEngine:
     """Test the JoplinImportEngine."""
@@ -251,9 +320,10 @@ class TestJoplinImportEngine:
         client.add_note.return_value = "note123"
         client.add_notebook.return_value = "notebook123"
         client.add_tag.return_value = "tag123"
-        client.get_all_notebooks.return_value = []
-        client.get_all_tags.return_value = []
+        client.get_notebooks.return_value = _page()
+        client.get_tags.return_value = _page()
         client.search_all.return_value = []
+        client.get_notes.return_value = _page()
         return client
 
     @pytest.fixture
@@ -331,3 +401,557 @@ class TestJoplinImportEngine:
         assert tag_ids == ["tag123"]
         assert "New Tag" in result.created_tags
         mock_client.add_tag.assert_called_once_with(title="New Tag")
+
+    @pytest.mark.asyncio
+    async def test_duplicate_checks_list_each_notebook_once(self, mock_client, mock_config):
+        """Existing titles come from one listing per notebook, not a search per note."""
+        inbox = Mock(id="inbox_id")
+        inbox.title = "Inbox"
+        mock_client.get_notebooks.return_value = _page(inbox)
+        mock_client.get_notes.return_value = _page(Mock(id="existing1", title="Taken"))
+        mock_client.add_note.side_effect = ["new1", "new2", "new3"]
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(target_notebook="Inbox", handle_duplicates="rename")
+
+        notes = [
+            ImportedNote(title="Taken", body="a"),
+            ImportedNote(title="Fresh", body="b"),
+            ImportedNote(title="Other", body="c", notebook="Brand New"),
+        ]
+        result = await engine.import_batch(notes, options)
+
+        assert result.successful_imports == 3
+        # "Brand New" was just created, so it needs no listing
+        mock_client.get_notes.assert_called_once_with(
+            page=1, limit=100, notebook_id="inbox_id", fields="id,title"
+        )
+        mock_client.search_all.assert_not_called()
+        titles = [c.kwargs["title"] for c in mock_client.add_note.call_args_list]
+        assert sorted(titles) == ["Fresh", "Other", "Taken (1)"]
+
+    @pytest.mark.asyncio
+    async def test_tag_failure_does_not_block_other_tags(self, mock_client, mock_config):
+        """Tags are applied independently; one failing leaves the rest applied."""
+        mock_client.add_tag.side_effect = ["t1", "t2", "t3"]
+        mock_client.add_tag_to_note.side_effect = [None, Exception("boom"), None]
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(create_missing_tags=True)
+
+        await engine._apply_tags_to_note("note123", ["a", "b", "c"], options, ImportResult())
+
+        applied = sorted(c.kwargs["tag_id"] for c in mock_client.add_tag_to_note.call_args_list)
+        assert applied == ["t1", "t2", "t3"]
+
+    @pytest.mark.asyncio
+    async def test_populate_caches_pages_through_listings(self, mock_client, mock_config):
+        """Notebook and tag listings are read page by page into the caches."""
+        first, second, tag = Mock(id="nb1"), Mock(id="nb2"), Mock(id="t1")
+        first.title, second.title, tag.title = "One", "Two", "work"
+        mock_client.get_notebooks.side_effect = [
+            _page(first, has_more=True),
+            _page(second),
+        ]
+        mock_client.get_tags.return_value = _page(tag)
+        engine = JoplinImportEngine(mock_client, mock_config)
+
+        await engine._populate_caches()
+
+        assert engine._notebook_cache == {"one": "nb1", "two": "nb2"}
+        assert engine._tag_cache == {"work": "t1"}
+        assert [c.kwargs["page"] for c in mock_client.get_notebooks.call_args_list] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_populate_caches_lists_notebooks_and_tags_together(self, mock_client, mock_config):
+        """Both listings are in flight at once rather than one after the other."""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def listing(**query):
+            barrier.wait()  # only passes if the other listing is running too
+            return _page()
+
+        mock_client.get_notebooks.side_effect = listing
+        mock_client.get_tags.side_effect = listing
+        engine = JoplinImportEngine(mock_client, mock_config)
+
+        await engine._populate_caches()
+
+        assert engine._caches_populated
+
+    @pytest.mark.asyncio
+    async def test_small_import_skips_catalog_preload(self, mock_client, mock_config):
+        """Below the threshold, only what the notes reference is looked up."""
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(target_notebook="Inbox", cache_populate_threshold=5)
+
+        await engine.import_batch([ImportedNote(title="T", body="x")], options)
+        mock_client.get_tags.assert_not_called()
+
+        notes = [ImportedNote(title=f"T{i}", body="x") for i in range(5)]
+        await JoplinImportEngine(mock_client, mock_config).import_batch(notes, options)
+        mock_client.get_tags.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_notebook_lookup_ignores_case_and_whitespace(self, mock_client, mock_config):
+        """'work ' finds the existing 'Work' notebook instead of creating another."""
+        work = Mock(id="nb1")
+        work.title = "Work"
+        mock_client.get_notebooks.return_value = _page(work)
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(create_missing_notebooks=True)
+
+        assert await engine.ensure_notebook_exists("work ", options, ImportResult()) == "nb1"
+        mock_client.add_notebook.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tag_lookup_ignores_case_and_lists_once(self, mock_client, mock_config):
+        """Tag names match case-insensitively; one listing serves every later miss."""
+        work = Mock(id="t1")
+        work.title = "Work"
+        mock_client.get_tags.return_value = _page(work)
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(create_missing_tags=True)
+        result = ImportResult()
+
+        ids = await engine.ensure_tags_exist(["work", " WORK ", "New", "new"], options, result)
+        more = await engine.ensure_tags_exist(["Other"], options, result)
+
+        assert ids == ["t1", "tag123"]
+        assert more == ["tag123"]
+        mock_client.get_tags.assert_called_once()
+        assert [c.kwargs["title"] for c in mock_client.add_tag.call_args_list] == ["New", "Other"]
+
+    @pytest.mark.asyncio
+    async def test_missing_tags_created_together_in_order(self, mock_client, mock_config):
+        """Missing tags are created in one pass; a failed create only warns."""
+        def add_tag(title):
+            if title == "bad":
+                raise RuntimeError("boom")
+            return f"id-{title}"
+
+        mock_client.add_tag.side_effect = add_tag
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(create_missing_tags=True)
+        result = ImportResult()
+
+        ids = await engine.ensure_tags_exist(["a", "bad", "b", "A", "c"], options, result)
+
+        assert ids == ["id-a", "id-b", "id-c"]
+        mock_client.get_tags.assert_called_once()
+        assert mock_client.add_tag.call_count == 4
+        assert sorted(result.created_tags) == ["a", "b", "c"]
+        assert any("'bad'" in w for w in result.warnings)
+
+    @pytest.mark.asyncio
+    async def test_populated_caches_skip_refetch_on_miss(self, mock_client, mock_config):
+        """After _populate_caches, unknown notebooks/tags are created without relisting."""
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(create_missing_notebooks=True, create_missing_tags=True)
+        result = ImportResult()
+
+        await engine._populate_caches()
+        await engine.ensure_notebook_exists("New Notebook", options, result)
+        await engine.ensure_tags_exist(["New Tag"], options, result)
+
+        assert mock_client.get_notebooks.call_count == 1
+        assert mock_client.get_tags.call_count == 1
+        mock_client.add_notebook.assert_called_once_with(title="New Notebook")
+        mock_client.add_tag.assert_called_once_with(title="New Tag")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_create_missing_notebook_once(self, mock_client, mock_config):
+        """Notes racing for the same missing notebook/tag share one create."""
+        mock_client.get_notebooks.return_value = _page()
+        mock_client.get_tags.return_value = _page()
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(create_missing_notebooks=True, create_missing_tags=True)
+        result = ImportResult()
+
+        ids = await asyncio.gather(
+            *(engine.ensure_notebook_exists("Shared", options, result) for _ in range(5))
+        )
+        await asyncio.gather(
+            *(engine.ensure_tags_exist(["shared"], options, result) for _ in range(5))
+        )
+
+        assert len(set(ids)) == 1
+        mock_client.add_notebook.assert_called_once_with(title="Shared")
+        mock_client.add_tag.assert_called_once_with(title="shared")
+
+    @pytest.mark.asyncio
+    async def test_inter_batch_pause_only_after_slowdown(self, mock_client, mock_config):
+        """Steady windows run back to back; a slowing Joplin gets the pause."""
+        from unittest.mock import AsyncMock, patch
+
+        mock_client.add_note.side_effect = [f"n{i}" for i in range(4)]
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(max_batch_size=1, handle_duplicates="overwrite")
+        notes = [ImportedNote(title=f"Note {i}", body="x") for i in range(4)]
+
+        # Per-note times of 1s, 2s, 3s, 1s: only the third window trips the ratio
+        clock = Mock()
+        clock.perf_counter.side_effect = [0, 1, 3, 6, 7]
+        with patch("joplin_mcp.imports.engine.time", clock), patch(
+            "joplin_mcp.imports.engine.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep, patch("joplin_mcp.imports.engine._NOTE_CREATE_CONCURRENCY", 1):
+            await engine.import_batch(notes, options)
+
+        mock_sleep.assert_awaited_once_with(options.inter_batch_pause)
+
+    @pytest.mark.asyncio
+    async def test_inter_batch_pause_backs_off_while_notes_fail(self, mock_client, mock_config):
+        """Consecutive failing windows double the pause; a clean window resets it."""
+        from unittest.mock import AsyncMock, patch
+
+        mock_client.add_note.side_effect = [Exception("503"), Exception("503"), "n2", "n3"]
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(
+            max_batch_size=1, handle_duplicates="overwrite", preserve_timestamps=False
+        )
+        notes = [ImportedNote(title=f"Note {i}", body="x") for i in range(4)]
+
+        clock = Mock()
+        clock.perf_counter.side_effect = [0, 1, 2, 3, 4]
+        with patch("joplin_mcp.imports.engine.time", clock), patch(
+            "joplin_mcp.imports.engine.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep, patch("joplin_mcp.imports.engine._NOTE_CREATE_CONCURRENCY", 1):
+            result = await engine.import_batch(notes, options)
+
+        assert result.failed_imports == 2
+        pause = options.inter_batch_pause
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [pause * 2, pause * 4]
+
+    @pytest.mark.asyncio
+    async def test_outcomes_recorded_in_input_order(self, mock_client, mock_config):
+        """Notes finishing out of order are still recorded in input order."""
+        engine = JoplinImportEngine(mock_client, mock_config)
+        notes = [ImportedNote(title=f"Note {i}", body="x") for i in range(4)]
+
+        async def create(note, options, result):
+            # Later notes finish first
+            await asyncio.sleep(0.01 * (4 - int(note.title[-1])))
+            if note.title == "Note 1":
+                return False, "rejected", None
+            return True, "Created", f"id{note.title[-1]}"
+
+        engine.create_note_safe = create
+        result = ImportResult()
+        created_records = []
+        await engine._create_notes(notes, ImportOptions(), result, created_records)
+
+        assert [r["new_id"] for r in created_records] == ["id0", "id2", "id3"]
+        assert result.errors == ["Note 1: rejected"]
+        assert result.successful_imports == 3
+
+    @pytest.mark.asyncio
+    async def test_timestamps_sent_with_create(self, mock_client, mock_config):
+        """Preserved timestamps ride on add_note; no follow-up modify_note."""
+        mock_client.add_note.return_value = "new1"
+        engine = JoplinImportEngine(mock_client, mock_config)
+        created = datetime(2024, 1, 2, 3, 4, 5)
+        updated = datetime(2024, 2, 3, 4, 5, 6)
+        note = ImportedNote(
+            title="T", body="x", created_time=created, updated_time=updated
+        )
+
+        success, _, note_id = await engine.create_note_safe(
+            note, ImportOptions(preserve_timestamps=True), ImportResult()
+        )
+
+        assert success and note_id == "new1"
+        kwargs = mock_client.add_note.call_args.kwargs
+        assert kwargs["created_time"] == kwargs["user_created_time"] == int(
+            created.timestamp() * 1000
+        )
+        assert kwargs["updated_time"] == kwargs["user_updated_time"] == int(
+            updated.timestamp() * 1000
+        )
+        mock_client.modify_note.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_current_timestamps_left_to_joplin(self, mock_client, mock_config):
+        """Default (now) timestamps aren't sent; only real historical ones are."""
+        engine = JoplinImportEngine(mock_client, mock_config)
+        created = datetime(2024, 1, 2, 3, 4, 5)
+        note = ImportedNote(title="T", body="x", created_time=created, updated_time=datetime.now())
+
+        await engine.create_note_safe(
+            note, ImportOptions(preserve_timestamps=True), ImportResult()
+        )
+
+        kwargs = mock_client.add_note.call_args.kwargs
+        assert kwargs["created_time"] == int(created.timestamp() * 1000)
+        assert "updated_time" not in kwargs
+
+    @pytest.mark.asyncio
+    async def test_timestamps_fall_back_to_modify_when_rejected(self, mock_client, mock_config):
+        """If Joplin rejects the timestamp fields, create plainly and patch them."""
+        mock_client.add_note.side_effect = [_http_error(400), "new1"]
+        engine = JoplinImportEngine(mock_client, mock_config)
+        created = datetime(2024, 1, 2, 3, 4, 5)
+        updated = datetime(2024, 2, 3, 4, 5, 6)
+        note = ImportedNote(
+            title="T", body="x", created_time=created, updated_time=updated
+        )
+
+        success, _, note_id = await engine.create_note_safe(
+            note, ImportOptions(preserve_timestamps=True), ImportResult()
+        )
+
+        assert success and note_id == "new1"
+        assert "created_time" not in mock_client.add_note.call_args.kwargs
+        created_ms = int(created.timestamp() * 1000)
+        updated_ms = int(updated.timestamp() * 1000)
+        mock_client.modify_note.assert_called_once_with(
+            "new1",
+            created_time=created_ms,
+            user_created_time=created_ms,
+            updated_time=updated_ms,
+            user_updated_time=updated_ms,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error", [requests.Timeout("timed out"), _http_error(500)], ids=["timeout", "5xx"]
+    )
+    async def test_timestamps_no_fallback_on_other_failures(
+        self, mock_client, mock_config, error
+    ):
+        """Only a 4xx rejection retries without timestamps; the note fails otherwise."""
+        mock_client.add_note.side_effect = [error, "new1"]
+        engine = JoplinImportEngine(mock_client, mock_config)
+        note = ImportedNote(title="T", body="x", created_time=datetime(2024, 1, 2))
+
+        success, _, note_id = await engine.create_note_safe(
+            note, ImportOptions(preserve_timestamps=True), ImportResult()
+        )
+
+        assert not success and note_id is None
+        assert mock_client.add_note.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unique_title_gallops_past_taken_suffixes(self, mock_client, mock_config):
+        """A long run of taken suffixes is crossed in logarithmically many probes."""
+        engine = JoplinImportEngine(mock_client, mock_config)
+        engine._notebook_titles["nb1"] = {f"Note ({i})": f"id{i}" for i in range(1, 101)}
+        probes = []
+        real_find = engine._find_existing_note
+
+        async def counting_find(title, notebook_id):
+            probes.append(title)
+            return await real_find(title, notebook_id)
+
+        engine._find_existing_note = counting_find
+
+        assert await engine._generate_unique_title("Note", "nb1") == "Note (101)"
+        assert len(probes) <= 16
+
+    @pytest.mark.asyncio
+    async def test_search_fallback_is_memoized(self, mock_client, mock_config):
+        """When listing fails, each title is searched once and creates are remembered."""
+        mock_client.get_notes.side_effect = Exception("listing failed")
+        mock_client.search_all.return_value = []
+        engine = JoplinImportEngine(mock_client, mock_config)
+
+        assert await engine._find_existing_note("A", "nb1") is None
+        assert await engine._find_existing_note("A", "nb1") is None
+        engine._index_note("new1", "A", "nb1")
+
+        assert await engine._find_existing_note("A", "nb1") == "new1"
+        mock_client.search_all.assert_called_once_with(
+            query='title:"A"', fields="id,title,parent_id"
+        )
+
+    @pytest.mark.asyncio
+    async def test_all_notes_index_only_for_large_imports(self, mock_client, mock_config):
+        """Notebook-less duplicate checks list every note only above the threshold."""
+        existing = Mock(id="n1")
+        existing.title = "A"
+        mock_client.get_notes.return_value = _page(existing)
+        mock_client.search_all.return_value = [Mock(id="n1", title="A", parent_id="nb9")]
+        engine = JoplinImportEngine(mock_client, mock_config)
+
+        assert await engine._find_existing_note("A", None) == "n1"
+        mock_client.get_notes.assert_not_called()
+        mock_client.search_all.assert_called_once()
+
+        engine = JoplinImportEngine(mock_client, mock_config)
+        engine._index_all_titles = True
+        assert await engine._find_existing_note("A", None) == "n1"
+        mock_client.get_notes.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_server_duplicate_rejection_is_skipped(self, mock_client, mock_config):
+        """An 'already exists' error from Joplin counts as a skip in skip mode."""
+        mock_client.add_note.side_effect = Exception("Note ALREADY EXISTS")
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(handle_duplicates="skip")
+
+        result = await engine.import_batch([ImportedNote(title="T", body="x")], options)
+
+        assert result.skipped_items == 1
+        assert result.failed_imports == 0
+
+    @pytest.mark.asyncio
+    async def test_search_fallback_requires_exact_title_in_notebook(self, mock_client, mock_config):
+        """Word matches and other notebooks' notes don't count as duplicates."""
+        mock_client.get_notes.side_effect = Exception("listing failed")
+        mock_client.search_all.return_value = [
+            Mock(id="n1", title="Plan B", parent_id="nb1"),
+            Mock(id="n2", title="Plan", parent_id="nb2"),
+            Mock(id="n3", title="Plan", parent_id="nb1"),
+        ]
+        engine = JoplinImportEngine(mock_client, mock_config)
+
+        assert await engine._find_existing_note("Plan", "nb1") == "n3"
+
+    @pytest.mark.asyncio
+    async def test_search_fallback_neutralizes_quotes(self, mock_client, mock_config):
+        """Quotes in a title can't break out of the quoted search term."""
+        mock_client.get_notes.side_effect = Exception("listing failed")
+        mock_client.search_all.return_value = [
+            Mock(id="n1", title='Say "hi"', parent_id="nb1")
+        ]
+        engine = JoplinImportEngine(mock_client, mock_config)
+
+        assert await engine._find_existing_note('Say "hi"', "nb1") == "n1"
+        assert mock_client.search_all.call_args.kwargs["query"] == 'title:"Say  hi "'
+
+    @pytest.mark.asyncio
+    async def test_unique_title_resumes_from_last_suffix(self, mock_client, mock_config):
+        """Repeated renames of one title probe only the next free suffix."""
+        from unittest.mock import AsyncMock
+
+        engine = JoplinImportEngine(mock_client, mock_config)
+        engine._find_existing_note = AsyncMock(return_value=None)
+
+        first = await engine._generate_unique_title("Note", "nb1")
+        second = await engine._generate_unique_title("Note", "nb1")
+        other = await engine._generate_unique_title("Note", "nb2")
+
+        assert (first, second, other) == ("Note (1)", "Note (2)", "Note (1)")
+        assert engine._find_existing_note.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_overwrite_updates_existing_note_once(self, mock_client, mock_config):
+        """Overwrite edits the pre-existing note; a second same-titled note is created."""
+        inbox = Mock(id="inbox_id")
+        inbox.title = "Inbox"
+        mock_client.get_notebooks.return_value = _page(inbox)
+        mock_client.get_notes.return_value = _page(Mock(id="existing1", title="A"))
+        mock_client.add_note.return_value = "new1"
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(
+            target_notebook="Inbox", handle_duplicates="overwrite", preserve_timestamps=False
+        )
+
+        notes = [
+            ImportedNote(title="A", body="x", metadata={"id": "orig1"}),
+            ImportedNote(title="A", body="y", metadata={"id": "orig2"}),
+        ]
+        result = await engine.import_batch(notes, options)
+
+        assert result.successful_imports == 2
+        mock_client.modify_note.assert_called_once()
+        assert mock_client.modify_note.call_args.args == ("existing1",)
+        mock_client.add_note.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_link_rewrite_uses_created_bodies(self, mock_client, mock_config):
+        """Internal links are rewritten without refetching notes; link-free notes are untouched."""
+        old_a, new_a = "a" * 32, "b" * 32
+        new_ids = {"A": new_a, "B": "c" * 32, "C": "d" * 32}
+        mock_client.add_note.side_effect = lambda **kw: new_ids[kw["title"]]
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(handle_duplicates="overwrite")
+
+        notes = [
+            ImportedNote(title="A", body="target", metadata={"id": old_a}),
+            ImportedNote(title="B", body=f"see [A](:/{old_a}#top)"),
+            ImportedNote(title="C", body="no links here"),
+        ]
+        result = await engine.import_batch(notes, options)
+
+        mock_client.get_note.assert_not_called()
+        mock_client.modify_note.assert_called_once_with(
+            "c" * 32, body=f"see [A](:/{new_a}#top)"
+        )
+        assert result.notes_rewritten == 1
+
+    @pytest.mark.asyncio
+    async def test_rewritten_body_save_failure_is_isolated(self, mock_client, mock_config):
+        """One failed save is logged and not counted; the others still land."""
+        mock_client.modify_note.side_effect = [Exception("boom"), None]
+        engine = JoplinImportEngine(mock_client, mock_config)
+        result = ImportResult()
+
+        await engine._save_rewritten_bodies([("n1", "x"), ("n2", "y")], result)
+
+        assert mock_client.modify_note.call_count == 2
+        assert result.notes_rewritten == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_same_title_notes_get_distinct_names(self, mock_client, mock_config):
+        """Same-titled notes in one batch are renamed one after another, not in a race."""
+        inbox = Mock(id="inbox_id")
+        inbox.title = "Inbox"
+        mock_client.get_notebooks.return_value = _page(inbox)
+        mock_client.get_notes.return_value = _page(Mock(id="existing1", title="A"))
+        mock_client.add_note.side_effect = ["new1", "new2"]
+        engine = JoplinImportEngine(mock_client, mock_config)
+        options = ImportOptions(target_notebook="Inbox", handle_duplicates="rename")
+
+        notes = [
+            ImportedNote(title="A", body="x", metadata={"id": "orig1"}),
+            ImportedNote(title="A", body="y", metadata={"id": "orig2"}),
+        ]
+        result = await engine.import_batch(notes, options)
+
+        assert result.successful_imports == 2
+        titles = [c.kwargs["title"] for c in mock_client.add_note.call_args_list]
+        assert sorted(titles) == ["A (1)", "A (2)"]
+
+
+class TestFormatDetection:
+    """Test file and directory format detection."""
+
+    @pytest.mark.parametrize(
+        "file_path,expected",
+        [
+            ("/notes/a.md", "md"),
+            ("/notes/B.MarkDown", "md"),
+            ("/notes/export.JEX", "jex"),
+            ("page.htm", "html"),
+            ("/notes.v1/README", "generic"),
+            ("/notes/.md", "generic"),
+            ("data.txt", "generic"),
+        ],
+    )
+    def test_file_format_from_extension(self, file_path, expected):
+        """File formats come from the lowercased extension of the file name."""
+        assert detect_file_format(file_path) == expected
+
+    def test_single_type_tree(self, tmp_path):
+        """Nested markdown (any md extension) is detected as md."""
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        (tmp_path / "a.md").write_text("a")
+        (tmp_path / "sub" / "deeper" / "B.MARKDOWN").write_text("b")
+        (tmp_path / ".hidden").write_text("x")
+
+        assert detect_directory_format(str(tmp_path)) == "md"
+
+    def test_mixed_tree_is_generic(self, tmp_path):
+        """Several supported types in one tree go to the generic importer."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.md").write_text("a")
+        (tmp_path / "sub" / "b.html").write_text("<p>b</p>")
+
+        assert detect_directory_format(str(tmp_path)) == "generic"
+
+    def test_empty_tree_rejected(self, tmp_path):
+        """A tree without files is an error."""
+        (tmp_path / "empty").mkdir()
+
+        with pytest.raises(ValueError, match="No files found"):
+            detect_directory_format(str(tmp_path))
@@ -439,3 +439,36 @@ class TestRenderNoteDefault:
 
         assert result == "METADATA_OUTPUT"
         mock_format.assert_called_once_with(note, False, "individual_notes", config=cfg)
+
+
+# === Search result entries ===
+
+
+class TestFormatNoteEntry:
+    """Content lines for search result entries whose body may be unknown."""
+
+    @staticmethod
+    def _note(body):
+        note = MagicMock(spec=["id", "title", "body"])
+        note.id, note.title, note.body = "note123", "Title", body
+        return note
+
+    @staticmethod
+    def _display(show_content):
+        return note_view._EntryDisplay(show_content, False, 300, "")
+
+    @pytest.mark.parametrize(
+        "body,show_content,expected",
+        [
+            ("", True, "  content: (empty)"),
+            (None, False, "  content: (hidden by privacy settings)"),
+            ("Body", False, "  content: (hidden by privacy settings)"),
+            ("", False, "  content: (empty)"),
+        ],
+    )
+    def test_content_line(self, body, show_content, expected):
+        entry = note_view._format_note_entry(
+            self._note(body), 1, self._display(show_content)
+        )
+
+        assert expected in entry
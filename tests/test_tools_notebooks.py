@@ -590,3 +590,40 @@ class TestFormatNotebookIcon:
         from joplin_mcp.fastmcp_server import _format_notebook_icon
 
         assert _format_notebook_icon('{"type":1,"name":""}') is None
+
+
+# === Tests for format_item_list attribute snapshots ===
+
+
+class TestFormatItemList:
+    """Tests for format_item_list reading item fields."""
+
+    def test_renders_joppy_notebook(self):
+        from joppy.data_types import NotebookData
+
+        from joplin_mcp.fastmcp_server import ItemType, format_item_list
+
+        nb = NotebookData(
+            id="a" * 32, title="Work", parent_id="", created_time=1700000000000
+        )
+        result = format_item_list([nb], ItemType.notebook)
+
+        assert f"notebook_id: {'a' * 32}" in result
+        assert "title: Work" in result
+        assert "created: " in result
+
+    def test_renders_slotted_item(self):
+        """Objects without a __dict__ fall back to per-attribute lookups."""
+        from joplin_mcp.fastmcp_server import ItemType, format_item_list
+
+        class SlottedTag:
+            __slots__ = ("id", "title")
+
+            def __init__(self, id, title):
+                self.id = id
+                self.title = title
+
+        result = format_item_list([SlottedTag("b" * 32, "urgent")], ItemType.tag)
+
+        assert f"tag_id: {'b' * 32}" in result
+        assert "title: urgent" in result
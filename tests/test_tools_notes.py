@@ -339,6 +339,46 @@ class TestFindNotesTool:
         mock_client.get_all_notes.assert_called_once()
         assert result == "ALL_NOTES"
 
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.notes.format_search_results_with_pagination")
+    @patch("joplin_mcp.tools.notes.get_joplin_client")
+    async def test_text_search_lists_bodies_in_one_pass(self, mock_get_client, mock_format):
+        """With content shown, bodies come with the listing; no per-note fetches."""
+        from joplin_mcp.tools.notes import find_notes
+
+        notes = [MagicMock(id=f"note_{i}", body="text") for i in range(30)]
+
+        mock_client = MagicMock()
+        mock_client.search_all.return_value = notes
+        mock_get_client.return_value = mock_client
+        mock_format.return_value = "RESULTS"
+
+        await find_notes.fn("meeting", limit=5)
+
+        assert "body" in mock_client.search_all.call_args[1]["fields"].split(",")
+        mock_client.get_note.assert_not_called()
+        assert mock_format.call_args[0][2] == 30
+
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.notes.format_search_results_with_pagination")
+    @patch("joplin_mcp.tools.notes.get_joplin_client")
+    async def test_hidden_content_lists_without_bodies(
+        self, mock_get_client, mock_format, override_config
+    ):
+        """No bodies are requested when privacy settings hide search result content."""
+        from joplin_mcp.tools.notes import find_notes
+
+        mock_client = MagicMock()
+        mock_client.search_all.return_value = [MagicMock(id=f"note_{i}") for i in range(3)]
+        mock_get_client.return_value = mock_client
+        mock_format.return_value = "RESULTS"
+
+        with override_config(content_exposure={"search_results": "none"}):
+            await find_notes.fn("meeting", limit=5)
+
+        assert "body" not in mock_client.search_all.call_args[1]["fields"].split(",")
+        mock_client.get_note.assert_not_called()
+
 
 class TestFindNotesTrashGuards:
     """Tests for find_notes trash=True validation guards.
@@ -458,6 +498,36 @@ class TestFindNotesInNotebookTool:
         assert mock_client.get_all_notes.call_args[1]["notebook_id"] == "notebook_id_123"
         assert result == "NOTEBOOK_RESULTS"
 
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.notes.format_search_results_with_pagination")
+    @patch("joplin_mcp.tools.notes.get_notebook_id_by_name")
+    @patch("joplin_mcp.tools.notes.get_joplin_client")
+    async def test_lists_bodies_without_per_note_fetches(self, mock_get_client, mock_get_notebook_id, mock_format):
+        """With content shown, the listing pass carries bodies; nothing is refetched."""
+        from joplin_mcp.tools.notes import find_notes_in_notebook
+
+        notes = []
+        for i in range(5):
+            note = MagicMock()
+            note.id = f"note_{i}"
+            note.body = f"body of note_{i}"
+            note.is_todo = 0
+            note.todo_completed = 0
+            notes.append(note)
+
+        mock_client = MagicMock()
+        mock_client.get_all_notes.return_value = notes
+        mock_get_client.return_value = mock_client
+        mock_get_notebook_id.return_value = "notebook_id_123"
+        mock_format.return_value = "NOTEBOOK_RESULTS"
+
+        await find_notes_in_notebook.fn("Work", limit=2, offset=1)
+
+        assert "body" in mock_client.get_all_notes.call_args[1]["fields"].split(",")
+        mock_client.get_note.assert_not_called()
+        page = mock_format.call_args[0][1]
+        assert [n.body for n in page] == ["body of note_1", "body of note_2"]
+
 
 class TestGetAllNotesTool:
     """Tests for get_all_notes tool."""
@@ -479,7 +549,7 @@ class TestGetAllNotesTool:
             mock_notes.append(note)
 
         mock_client = MagicMock()
-        mock_client.get_all_notes.return_value = mock_notes
+        mock_client.get_notes.return_value = mock_notes[:3]
         mock_get_client.return_value = mock_client
 
         mock_format.return_value = "ALL_NOTES_RESULT"
@@ -487,9 +557,65 @@ class TestGetAllNotesTool:
         fn = _get_tool_fn(get_all_notes)
         result = await fn(limit=3)
 
-        mock_client.get_all_notes.assert_called_once()
+        # Without an allowlist the limit is pushed to a single server page
+        mock_client.get_notes.assert_called_once()
+        assert mock_client.get_notes.call_args[1]["limit"] == 3
+        mock_client.get_all_notes.assert_not_called()
         assert result == "ALL_NOTES_RESULT"
 
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.notes.is_notebook_accessible")
+    @patch("joplin_mcp.tools.notes.format_search_results_with_pagination")
+    @patch("joplin_mcp.tools.notes.get_joplin_client")
+    async def test_allowlist_walks_all_pages_before_limiting(
+        self, mock_get_client, mock_format, mock_accessible, override_config
+    ):
+        """With an allowlist, notes are filtered over the full listing."""
+        from joplin_mcp.tools.notes import get_all_notes
+
+        mock_notes = []
+        for i in range(4):
+            note = MagicMock()
+            note.id = f"note{i}"
+            note.parent_id = "allowed" if i >= 2 else "denied"
+            mock_notes.append(note)
+
+        mock_client = MagicMock()
+        mock_client.get_all_notes.return_value = mock_notes
+        mock_get_client.return_value = mock_client
+        mock_accessible.side_effect = lambda parent_id, **kw: parent_id == "allowed"
+        mock_format.return_value = "ALL_NOTES_RESULT"
+
+        with override_config(notebook_allowlist=["Work"]):
+            fn = _get_tool_fn(get_all_notes)
+            await fn(limit=2)
+
+        mock_client.get_notes.assert_not_called()
+        shown = mock_format.call_args[0][1]
+        assert [n.id for n in shown] == ["note2", "note3"]
+
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.notes.is_notebook_accessible", return_value=True)
+    @patch("joplin_mcp.tools.notes.format_search_results_with_pagination")
+    @patch("joplin_mcp.tools.notes.get_joplin_client")
+    async def test_allowlist_check_stops_at_limit(
+        self, mock_get_client, mock_format, mock_accessible, override_config
+    ):
+        """Access checks stop once ``limit`` accessible notes are collected."""
+        from joplin_mcp.tools.notes import get_all_notes
+
+        mock_client = MagicMock()
+        mock_client.get_all_notes.return_value = [MagicMock() for _ in range(10)]
+        mock_get_client.return_value = mock_client
+        mock_format.return_value = "ALL_NOTES_RESULT"
+
+        with override_config(notebook_allowlist=["Work"]):
+            fn = _get_tool_fn(get_all_notes)
+            await fn(limit=3)
+
+        assert mock_accessible.call_count == 3
+        assert len(mock_format.call_args[0][1]) == 3
+
 
 class TestGetLinksTool:
     """Tests for get_links tool."""
@@ -1326,13 +1452,13 @@ class TestGetAllNotesSorting:
         mock_note.updated_time = 1000
 
         mock_client = MagicMock()
-        mock_client.get_all_notes.return_value = [mock_note]
+        mock_client.get_notes.return_value = [mock_note]
         mock_get_client.return_value = mock_client
         mock_format.return_value = "RESULTS"
 
         fn = _get_tool_fn(get_all_notes)
         await fn(order_by="title")
 
-        call_kwargs = mock_client.get_all_notes.call_args[1]
+        call_kwargs = mock_client.get_notes.call_args[1]
         assert call_kwargs["order_by"] == "title"
         assert call_kwargs["order_dir"] == "ASC"
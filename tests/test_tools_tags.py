@@ -43,6 +43,7 @@ class TestListTagsTool:
 
         mock_client = MagicMock()
         mock_client.get_all_tags.return_value = mock_tags
+        mock_client.get_all_notes.return_value = []
         mock_get_client.return_value = mock_client
 
         mock_format.return_value = "FORMATTED_TAG_LIST"
@@ -51,9 +52,112 @@ class TestListTagsTool:
         result = await fn()
 
         mock_client.get_all_tags.assert_called_once()
-        mock_format.assert_called_once_with(mock_tags, mock_client)
+        mock_format.assert_called_once_with(
+            mock_tags, mock_client, note_counts=[0, 0]
+        )
         assert result == "FORMATTED_TAG_LIST"
 
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.tags.format_tag_list_with_counts")
+    @patch("joplin_mcp.tools.tags.get_joplin_client")
+    async def test_tag_listing_cached_until_tag_mutation(
+        self, mock_get_client, mock_format
+    ):
+        """Repeat listings reuse the cached tags; create_tag invalidates them."""
+        from joplin_mcp.tools.tags import create_tag, list_tags
+
+        mock_client = MagicMock()
+        mock_client.get_all_tags.return_value = [_make_tag("tag1", "work")]
+        mock_client.add_tag.return_value = "tag2"
+        mock_get_client.return_value = mock_client
+        mock_format.return_value = "FORMATTED_TAG_LIST"
+
+        await _get_tool_fn(list_tags)()
+        await _get_tool_fn(list_tags)()
+        assert mock_client.get_all_tags.call_count == 1
+
+        await _get_tool_fn(create_tag)(title="personal")
+        await _get_tool_fn(list_tags)()
+        assert mock_client.get_all_tags.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.tags.format_tag_list_with_counts")
+    @patch("joplin_mcp.tools.tags.get_joplin_client")
+    async def test_concurrent_cold_listings_share_one_fetch(
+        self, mock_get_client, mock_format
+    ):
+        """Listings that arrive while the cache is being filled wait for it."""
+        import asyncio
+        import time
+
+        from joplin_mcp.tools.tags import list_tags
+
+        def slow_get_all_tags(fields):
+            time.sleep(0.05)
+            return [_make_tag("tag1", "work")]
+
+        mock_client = MagicMock()
+        mock_client.get_all_tags.side_effect = slow_get_all_tags
+        mock_client.get_all_notes.return_value = []
+        mock_get_client.return_value = mock_client
+        mock_format.return_value = "FORMATTED_TAG_LIST"
+
+        await asyncio.gather(*(_get_tool_fn(list_tags)() for _ in range(4)))
+
+        assert mock_client.get_all_tags.call_count == 1
+
+
+# === Tests for format_tag_list_with_counts ===
+
+
+class TestFormatTagListWithCounts:
+    """Tests for the tag listing formatter's note counts."""
+
+    def test_counts_all_pages_with_id_only_fields(self):
+        """Counts come from an unpaginated id-only listing per tag."""
+        from joplin_mcp.fastmcp_server import format_tag_list_with_counts
+
+        mock_client = MagicMock()
+        mock_client.get_all_notes.return_value = [MagicMock() for _ in range(12)]
+
+        result = format_tag_list_with_counts([_make_tag("t1", "work")], mock_client)
+
+        assert "note_count: 12" in result
+        mock_client.get_all_notes.assert_called_once()
+        kwargs = mock_client.get_all_notes.call_args.kwargs
+        assert kwargs["tag_id"] == "t1"
+        assert kwargs["fields"] == "id"
+        mock_client.get_notes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_counts_follow_tag_order(self):
+        """Parallel counts line up with their tags; a failed count is 0."""
+        from joplin_mcp.fastmcp_server import count_tag_notes_concurrently
+
+        per_tag = {"t1": 3, "t2": None, "t3": 1}
+
+        def get_all_notes(tag_id, **kwargs):
+            if per_tag[tag_id] is None:
+                raise Exception("boom")
+            return [MagicMock() for _ in range(per_tag[tag_id])]
+
+        mock_client = MagicMock()
+        mock_client.get_all_notes.side_effect = get_all_notes
+        tags = [_make_tag(tid, tid) for tid in per_tag]
+
+        assert await count_tag_notes_concurrently(mock_client, tags) == [3, 0, 1]
+
+    def test_count_failure_reports_zero(self):
+        """A failing count lookup degrades to note_count: 0."""
+        from joplin_mcp.fastmcp_server import format_tag_list_with_counts
+
+        mock_client = MagicMock()
+        mock_client.get_all_notes.side_effect = Exception("boom")
+
+        result = format_tag_list_with_counts([_make_tag("t1", "work")], mock_client)
+
+        assert "note_count: 0" in result
+
 
 # === Tests for create_tag tool ===
 
@@ -185,6 +289,28 @@ class TestGetTagsByNoteTool:
         mock_format.assert_called_once_with("tag", "for note: 12345678901234567890123456789012")
         assert result == "NO_TAGS_MESSAGE"
 
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.tags.format_item_list")
+    @patch("joplin_mcp.tools.tags.get_joplin_client")
+    async def test_note_tags_cached_until_tagged(self, mock_get_client, mock_format):
+        """Repeat lookups reuse the cached tags; tag_note evicts that note."""
+        from joplin_mcp.tools.tags import get_tags_by_note, tag_note
+
+        note_id = "12345678901234567890123456789012"
+        mock_client = MagicMock()
+        mock_client.get_tags.return_value = [MagicMock(id="tag1", title="work")]
+        mock_client.get_all_tags.return_value = [_make_tag("tag1", "work")]
+        mock_get_client.return_value = mock_client
+        mock_format.return_value = "FORMATTED_TAGS"
+
+        await _get_tool_fn(get_tags_by_note)(note_id=note_id)
+        await _get_tool_fn(get_tags_by_note)(note_id=note_id)
+        assert mock_client.get_tags.call_count == 1
+
+        await _get_tool_fn(tag_note)(note_id=note_id, tag_name="work")
+        await _get_tool_fn(get_tags_by_note)(note_id=note_id)
+        assert mock_client.get_tags.call_count == 2
+
 
 # === Tests for tag_note tool ===
 
@@ -357,6 +483,31 @@ class TestTagNoteTool:
         assert NOTE_B in result
         assert "simulated note-missing error" in result
 
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.tags.get_joplin_client")
+    async def test_failures_reported_in_input_order(self, mock_get_client):
+        """Ops run concurrently, but report rows follow the input order."""
+        import time
+
+        from joplin_mcp.tools.tags import tag_note
+
+        mock_client = MagicMock()
+        mock_client.get_all_tags.return_value = [_make_tag("t1", "Work")]
+
+        def side_effect(tag_id, note_id):
+            if note_id == NOTE_A:
+                time.sleep(0.05)  # finish after NOTE_C
+            raise Exception(f"failed {note_id}")
+
+        mock_client.add_tag_to_note.side_effect = side_effect
+        mock_get_client.return_value = mock_client
+
+        fn = _get_tool_fn(tag_note)
+        result = await fn(note_id=[NOTE_A, NOTE_B, NOTE_C], tag_name="Work")
+
+        assert result.index(f"failed {NOTE_A}") < result.index(f"failed {NOTE_B}")
+        assert result.index(f"failed {NOTE_B}") < result.index(f"failed {NOTE_C}")
+
     @pytest.mark.asyncio
     @patch("joplin_mcp.tools.tags.get_joplin_client")
     async def test_token_redacted_in_failure_messages(self, mock_get_client):
@@ -1,6 +1,6 @@
 """Tests for tag tool allowlist enforcement."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -19,6 +19,13 @@ def _make_tag(tag_id: str, title: str):
     return tag
 
 
+def _deny_unless(parent_id: str, allowed: str) -> None:
+    from joplin_mcp.notebook_utils import AllowlistDeniedError
+
+    if parent_id != allowed:
+        raise AllowlistDeniedError("Notebook not accessible")
+
+
 # === Fixtures ===
 
 
@@ -123,6 +130,40 @@ class TestTagNoteAllowlist:
         assert "FAILED: 1" in result
         assert "Notebook not accessible" in result
 
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.tags.get_joplin_client")
+    async def test_bulk_tag_note_checks_each_note_in_order(
+        self,
+        mock_get_client,
+        mock_allowlist_config,
+    ):
+        """Parent notes are fetched up front; denials still map to their note."""
+        from joplin_mcp.tools.tags import tag_note
+
+        parents = {"a" * 32: "allowed_nb", "b" * 32: "blocked_nb"}
+
+        def get_note(note_id, fields=None):
+            note = MagicMock()
+            note.parent_id = parents[note_id]
+            return note
+
+        mock_client = MagicMock()
+        mock_client.get_note.side_effect = get_note
+        mock_client.get_all_tags.return_value = [_make_tag("tag_id_123", "Important")]
+        mock_get_client.return_value = mock_client
+
+        with patch(
+            "joplin_mcp.tools.tags.validate_notebook_access",
+            side_effect=lambda parent_id, **kw: _deny_unless(parent_id, "allowed_nb"),
+        ):
+            fn = _get_tool_fn(tag_note)
+            result = await fn(note_id=list(parents), tag_name="Important")
+
+        assert mock_client.get_note.call_count == 2
+        mock_client.add_tag_to_note.assert_called_once_with("tag_id_123", "a" * 32)
+        assert "SUCCEEDED: 1" in result
+        assert f"note_id={'b' * 32}" in result
+
     @pytest.mark.asyncio
     @patch("joplin_mcp.tools.tags.get_joplin_client")
     async def test_tag_note_no_allowlist(
@@ -316,6 +357,77 @@ class TestGetTagsByNoteAllowlist:
 
         mock_client.get_tags.assert_not_called()
 
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.tags.get_joplin_client")
+    async def test_get_tags_by_note_list_reports_denied_note_inline(
+        self,
+        mock_get_client,
+        mock_allowlist_config,
+    ):
+        """List form keeps input order; a denied note gets an ERROR block."""
+        from joplin_mcp.tools.tags import get_tags_by_note
+
+        parents = {"a" * 32: "allowed_nb", "b" * 32: "blocked_nb"}
+
+        def get_note(note_id, fields=None):
+            note = MagicMock()
+            note.parent_id = parents[note_id]
+            return note
+
+        mock_client = MagicMock()
+        mock_client.get_note.side_effect = get_note
+        mock_client.get_tags.return_value = [_make_tag("tag_id_1", "Work")]
+        mock_get_client.return_value = mock_client
+
+        with patch(
+            "joplin_mcp.tools.tags.validate_notebook_access",
+            side_effect=lambda parent_id, **kw: _deny_unless(parent_id, "allowed_nb"),
+        ):
+            fn = _get_tool_fn(get_tags_by_note)
+            result = await fn(note_id=["b" * 32, "a" * 32])
+
+        mock_client.get_tags.assert_called_once_with(note_id="a" * 32, fields=ANY)
+        blocked, allowed = result.split("\n\nNOTE_ID: ")
+        assert blocked.startswith(f"NOTE_ID: {'b' * 32}")
+        assert "ERROR: Notebook not accessible" in blocked
+        assert allowed.startswith("a" * 32)
+        assert "title: Work" in allowed
+
+    @pytest.mark.asyncio
+    @patch("joplin_mcp.tools.tags.get_joplin_client")
+    async def test_get_tags_by_note_list_reports_missing_note_inline(
+        self,
+        mock_get_client,
+        mock_allowlist_config,
+    ):
+        """A note whose parent lookup fails gets an ERROR block; others still load."""
+        from joplin_mcp.tools.tags import get_tags_by_note
+
+        def get_note(note_id, fields=None):
+            if note_id == "b" * 32:
+                raise RuntimeError("Note not found")
+            note = MagicMock()
+            note.parent_id = "allowed_nb"
+            return note
+
+        mock_client = MagicMock()
+        mock_client.get_note.side_effect = get_note
+        mock_client.get_tags.return_value = [_make_tag("tag_id_1", "Work")]
+        mock_get_client.return_value = mock_client
+
+        with patch(
+            "joplin_mcp.tools.tags.validate_notebook_access",
+            side_effect=lambda parent_id, **kw: _deny_unless(parent_id, "allowed_nb"),
+        ):
+            fn = _get_tool_fn(get_tags_by_note)
+            result = await fn(note_id=["b" * 32, "a" * 32])
+
+        mock_client.get_tags.assert_called_once_with(note_id="a" * 32, fields=ANY)
+        missing, found = result.split("\n\nNOTE_ID: ")
+        assert "STATUS: ERROR" in missing
+        assert "Note not found" in missing
+        assert "title: Work" in found
+
     @pytest.mark.asyncio
     @patch("joplin_mcp.tools.tags.get_joplin_client")
     async def test_get_tags_by_note_no_allowlist(